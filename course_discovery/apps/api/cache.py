@@ -1,9 +1,11 @@
 import logging
+import operator
 import time
 import zlib
 
 from django.conf import settings
 from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
 from django.http.response import HttpResponse
 from edx_django_utils.cache import get_cache_key
 from rest_framework.renderers import JSONRenderer
@@ -15,17 +17,87 @@ from rest_framework_extensions.key_constructor.constructors import (
 from waffle import get_waffle_flag_model  # lint-amnesty, pylint: disable=invalid-django-waffle-import
 
 from course_discovery.apps.api.utils import conditional_decorator
+from course_discovery.apps.core import middleware
 
 logger = logging.getLogger(__name__)
 API_TIMESTAMP_KEY = 'api_timestamp'
+API_RESOURCE_TIMESTAMP_KEY = 'api_timestamp.{resource}.{partner_id}'
+API_CACHE_STATS_KEY = 'api_cache_stats.{view}.{method}.{outcome}'
+API_CACHE_LOCK_KEY = '{key}.lock'
+API_LATEST_RESPONSE_KEY = 'api_latest_response.{key}'
+API_CACHE_LOCK_POLL_INTERVAL = 0.05
+
+# Resource types whose changes only invalidate the cached responses of views listing them in their
+# `cache_resources`, mapped to the course_metadata models they consist of and the attribute path from
+# an instance of such a model to the id of its partner. Changes to any other model invalidate every
+# cached response, as those models are usually shared by several resource types.
+API_CACHE_RESOURCE_MODELS = {
+    'course': {
+        'Course': 'partner_id',
+        'CourseRun': 'course.partner_id',
+        'Seat': 'course_run.course.partner_id',
+        'CourseEntitlement': 'course.partner_id',
+    },
+    'program': {
+        'Program': 'partner_id',
+    },
+    'pathway': {
+        'Pathway': 'partner_id',
+    },
+    'person': {
+        'Person': 'partner_id',
+    },
+    'organization': {
+        'Organization': 'partner_id',
+    },
+}
+API_CACHE_RESOURCE_BY_MODEL = {
+    model_name: (resource, operator.attrgetter(partner_path))
+    for resource, models in API_CACHE_RESOURCE_MODELS.items()
+    for model_name, partner_path in models.items()
+}
 
 
 class ApiTimestampKeyBit(KeyBitBase):
-    def get_data(self, **kwargs):  # pylint: disable=arguments-differ
-        return cache.get_or_set(API_TIMESTAMP_KEY, time.time, None)
-
-
-class TimestampedListKeyConstructor(DefaultListKeyConstructor):
+    """
+    Versions cached responses by the global API timestamp and, for views declaring `cache_resources`,
+    by the timestamps of those resource types for the partner of the request.
+    """
+    def get_data(self, params, view_instance, view_method, request, args, kwargs):
+        resources = getattr(view_instance, 'cache_resources', ())
+        partner = getattr(getattr(request, 'site', None), 'partner', None) if resources else None
+        if partner is None:
+            return cache.get_or_set(API_TIMESTAMP_KEY, time.time, None)
+
+        keys = [API_TIMESTAMP_KEY] + [
+            API_RESOURCE_TIMESTAMP_KEY.format(resource=resource, partner_id=partner.id) for resource in resources
+        ]
+        timestamps = cache.get_many(keys)
+        # Versions missing from the cache, either never set or evicted, are initialized rather than left
+        # out of the key, so that responses cached before a change can never be served again.
+        missing = {key: time.time() for key in keys if key not in timestamps}
+        if missing:
+            cache.set_many(missing, None)
+            timestamps.update(missing)
+        return [timestamps[key] for key in keys]
+
+
+class LatestKeyConstructorMixin:
+    """
+    Computes, along with the key of a response, the key of every version of that response.
+    """
+    def get_latest_key(self, **kwargs):
+        """
+        Returns the key built from every bit but the timestamp, which identifies a response whichever
+        versions of the API data it is cached for. The other bits, such as the SQL query of the view,
+        which may depend on the user, are kept so that only the same response is ever served.
+        """
+        key_dict = self.get_data_from_bits(**kwargs)
+        del key_dict['timestamp']
+        return API_LATEST_RESPONSE_KEY.format(key=self.prepare_key(key_dict))
+
+
+class TimestampedListKeyConstructor(LatestKeyConstructorMixin, DefaultListKeyConstructor):
     timestamp = ApiTimestampKeyBit()
     # The DefaultListKeyConstructor includes the PaginationKeyBit. While it does
     # subclass QueryParamsKeyBit, it also bypasses logic which includes all query
@@ -36,7 +108,7 @@ class TimestampedListKeyConstructor(DefaultListKeyConstructor):
     querystring = QueryParamsKeyBit()
 
 
-class TimestampedObjectKeyConstructor(DefaultObjectKeyConstructor):
+class TimestampedObjectKeyConstructor(LatestKeyConstructorMixin, DefaultObjectKeyConstructor):
     timestamp = ApiTimestampKeyBit()
     # The DefaultObjectKeyConstructor doesn't include querystring parameters
     # in its cache key.
@@ -51,25 +123,88 @@ def timestamped_object_key_constructor(*args, **kwargs):
     return TimestampedObjectKeyConstructor()(**kwargs)
 
 
-def set_api_timestamp():
+def timestamped_list_latest_key_constructor(*args, **kwargs):
+    return TimestampedListKeyConstructor().get_latest_key(**kwargs)
+
+
+def timestamped_object_latest_key_constructor(*args, **kwargs):
+    return TimestampedObjectKeyConstructor().get_latest_key(**kwargs)
+
+
+def set_api_timestamp(resource=None, partner_id=None):
+    """
+    Invalidates cached API responses.
+
+    Without arguments every cached response is invalidated. Otherwise, only the responses of the views
+    depending on the given resource type are, for the given partner.
+    """
     timestamp = time.time()
-    cache.set(API_TIMESTAMP_KEY, timestamp, None)
+    if resource is None:
+        cache.set(API_TIMESTAMP_KEY, timestamp, None)
+    else:
+        cache.set(API_RESOURCE_TIMESTAMP_KEY.format(resource=resource, partner_id=partner_id), timestamp, None)
 
 
-def api_change_receiver(sender, **kwargs):  # pylint: disable=unused-argument
+def api_change_receiver(sender, instance=None, **kwargs):
     """
     Receiver function for handling post_save and post_delete signals emitted by
     course_metadata models.
     """
+    resource, get_partner_id = API_CACHE_RESOURCE_BY_MODEL.get(sender.__name__, (None, None))
+    if resource is not None:
+        try:
+            partner_id = get_partner_id(instance)
+        except ObjectDoesNotExist:
+            partner_id = None
+
+        if partner_id is not None:
+            set_api_timestamp(resource, partner_id)
+            return
+
     set_api_timestamp()
 
 
+def record_cache_outcome(view_name, method_name, hit):
+    """
+    Counts a cache hit or miss of the given view method.
+    """
+    middleware.record_cache_outcome(hit)
+    key = API_CACHE_STATS_KEY.format(view=view_name, method=method_name, outcome='hits' if hit else 'misses')
+    if not cache.add(key, 1, None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            # The counter was evicted between the two calls.
+            cache.add(key, 1, None)
+
+
+def get_cache_stats(view_name, method_name):
+    """
+    Returns the numbers of cache hits and misses counted for the given view method.
+    """
+    keys = {
+        outcome: API_CACHE_STATS_KEY.format(view=view_name, method=method_name, outcome=outcome)
+        for outcome in ('hits', 'misses')
+    }
+    counts = cache.get_many(keys.values())
+    return {outcome: counts.get(key, 0) for outcome, key in keys.items()}
+
+
 class CompressedCacheResponse(CacheResponse):
     """
     Subclasses CacheResponse to allow for compression of content going into the cache
     See https://github.com/chibisov/drf-extensions/blob/master/rest_framework_extensions/cache/decorators.py#L52
     for a similar implementation of process_cache_response without compression
+
+    Cache misses are coalesced: a single request, holding a lock in the cache, renders the missing response.
+    Identical requests received meanwhile are served the response previously cached under the same
+    `latest_key_func` key, if any, and otherwise wait for the lock holder to cache its response rather than
+    rendering their own. Without a `latest_key_func`, they always wait.
     """
+    def __init__(self, *args, latest_key_func=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latest_key_func = latest_key_func
+
     def process_cache_response(self, view_instance, view_method, request, args, kwargs):
         flag_name = f'compressed_cache.{view_instance.__class__.__name__}.{view_method.__name__}'
         flag = get_waffle_flag_model().get(flag_name)
@@ -80,65 +215,126 @@ class CompressedCacheResponse(CacheResponse):
         # to define all of the flags ahead of time.
         use_page_cache = (not flag.pk) or flag.is_active(request)
 
-        if use_page_cache:
-            key = self.calculate_key(
-                view_instance=view_instance,
-                view_method=view_method,
-                request=request,
-                args=args,
-                kwargs=kwargs
-            )
-            response_triple = self.cache.get(key)
-        else:
+        if not use_page_cache:
             logger.info("Skipping page caching for %s", flag_name)
-            response_triple = None
-
-        if not response_triple:
-            response = view_method(view_instance, request, *args, **kwargs)
-            response = view_instance.finalize_response(request, response, *args, **kwargs)
-            response.render()
-
-            if (not (response.status_code >= 400 or self.cache_errors) and
-                    isinstance(response.accepted_renderer, JSONRenderer) and
-                    use_page_cache):
-                # Put the response in the cache only if there are no cache errors, response errors,
-                # and the format is json. We avoid caching for the BrowsableAPIRenderer so that users don't see
-                # different usernames that are cached from the BrowsableAPIRenderer html
-
-                # django 3.0 has not .items() method, django 3.2 has not ._headers
-                if hasattr(response, '_headers'):
-                    headers = response._headers.copy()  # pylint: disable=protected-access
-                else:
-                    headers = {k: (k, v) for k, v in response.items()}
-
-                response_triple = (
-                    zlib.compress(response.rendered_content),
-                    response.status_code,
-                    headers
-                )
-                self.cache.set(key, response_triple, self.timeout)
-        else:
-            # If we get data from the cache, we reassemble the data to build a response
-            # We reassemble the pieces from the cache because we can't actually set rendered_content
-            # which is the part of the response that we compress
-            compressed_content, status, headers = response_triple
-
-            try:
-                decompressed_content = zlib.decompress(compressed_content)
-            except (TypeError, zlib.error):
-                # If we get a type error or a zlib error, the response content was never compressed
-                decompressed_content = compressed_content
-
-            response = HttpResponse(content=decompressed_content, status=status)
-
-            for k, v in headers.values():
-                response[k] = v
+            return self.render_response(view_instance, view_method, request, args, kwargs)
+
+        key = self.calculate_key(
+            view_instance=view_instance,
+            view_method=view_method,
+            request=request,
+            args=args,
+            kwargs=kwargs
+        )
+        response_triple = self.cache.get(key)
+        record_cache_outcome(view_instance.__class__.__name__, view_method.__name__, bool(response_triple))
+        if response_triple:
+            return self.build_cached_response(response_triple)
+
+        latest_key = self.calculate_latest_key(view_instance, view_method, request, args, kwargs)
+        lock_key = API_CACHE_LOCK_KEY.format(key=key)
+        if not self.cache.add(lock_key, True, settings.API_CACHE_LOCK_TIMEOUT):
+            response_triple = self.get_stale_or_wait(key, latest_key, lock_key)
+            if response_triple:
+                return self.build_cached_response(response_triple)
+
+            logger.info('Timed out waiting for the response cached under [%s], rendering it.', key)
+            return self.render_response(view_instance, view_method, request, args, kwargs)
+
+        try:
+            response = self.render_response(view_instance, view_method, request, args, kwargs)
+            self.cache_response(response, key, latest_key)
+        finally:
+            self.cache.delete(lock_key)
+        return response
+
+    def calculate_latest_key(self, view_instance, view_method, request, args, kwargs):
+        """
+        Returns the key pointing to the key of the same response last cached, whichever versions of the
+        API data it was cached for, or None if stale responses are not served.
+        """
+        if self.latest_key_func is None:
+            return None
+        return self.latest_key_func(
+            view_instance=view_instance,
+            view_method=view_method,
+            request=request,
+            args=args,
+            kwargs=kwargs
+        )
+
+    def get_stale_or_wait(self, key, latest_key, lock_key):
+        """
+        Returns the same response last cached for other versions of the API data, or waits for the request
+        holding the lock to cache the requested one.
+
+        Returns:
+            tuple: The cached response triple, or None if no response was cached before the wait timed out.
+        """
+        latest_cached_key = self.cache.get(latest_key) if latest_key else None
+        response_triple = self.cache.get(latest_cached_key) if latest_cached_key else None
+        if response_triple:
+            return response_triple
+
+        deadline = time.monotonic() + settings.API_CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(API_CACHE_LOCK_POLL_INTERVAL)
+            response_triple = self.cache.get(key)
+            if response_triple or self.cache.get(lock_key) is None:
+                return response_triple
+        return None
+
+    def render_response(self, view_instance, view_method, request, args, kwargs):
+        response = view_method(view_instance, request, *args, **kwargs)
+        response = view_instance.finalize_response(request, response, *args, **kwargs)
+        response.render()
 
         if not hasattr(response, '_closable_objects'):
             response._closable_objects = []  # pylint: disable=protected-access
 
         return response
 
+    def cache_response(self, response, key, latest_key):
+        if (not (response.status_code >= 400 or self.cache_errors) and
+                isinstance(response.accepted_renderer, JSONRenderer)):
+            # Put the response in the cache only if there are no cache errors, response errors,
+            # and the format is json. We avoid caching for the BrowsableAPIRenderer so that users don't see
+            # different usernames that are cached from the BrowsableAPIRenderer html
+
+            # django 3.0 has not .items() method, django 3.2 has not ._headers
+            if hasattr(response, '_headers'):
+                headers = response._headers.copy()  # pylint: disable=protected-access
+            else:
+                headers = {k: (k, v) for k, v in response.items()}
+
+            response_triple = (
+                zlib.compress(response.rendered_content),
+                response.status_code,
+                headers
+            )
+            self.cache.set(key, response_triple, self.timeout)
+            if latest_key:
+                self.cache.set(latest_key, key, self.timeout)
+
+    def build_cached_response(self, response_triple):
+        # If we get data from the cache, we reassemble the data to build a response
+        # We reassemble the pieces from the cache because we can't actually set rendered_content
+        # which is the part of the response that we compress
+        compressed_content, status, headers = response_triple
+
+        try:
+            decompressed_content = zlib.decompress(compressed_content)
+        except (TypeError, zlib.error):
+            # If we get a type error or a zlib error, the response content was never compressed
+            decompressed_content = compressed_content
+
+        response = HttpResponse(content=decompressed_content, status=status)
+
+        for k, v in headers.values():
+            response[k] = v
+
+        return response
+
 
 # Decorator for mixin
 compressed_cache_response = CompressedCacheResponse
@@ -147,7 +343,11 @@ compressed_cache_response = CompressedCacheResponse
 class CompressedCacheResponseMixin():
     """
     Acts like drf-extensions CacheResponseMixin, but with compression into the cache and decompression out of it
+
+    Views list the resource types their responses depend on in `cache_resources`, see API_CACHE_RESOURCE_MODELS.
+    Responses of views without any are only invalidated when every cached response is.
     """
+    cache_resources = ()
     object_cache_key_func = timestamped_object_key_constructor
     list_cache_key_func = timestamped_list_key_constructor
     object_cache_timeout = settings.REST_FRAMEWORK_EXTENSIONS['DEFAULT_CACHE_RESPONSE_TIMEOUT']
@@ -155,14 +355,20 @@ class CompressedCacheResponseMixin():
 
     @conditional_decorator(
         lambda: settings.USE_API_CACHING,
-        compressed_cache_response(key_func=list_cache_key_func, timeout=list_cache_timeout),
+        compressed_cache_response(
+            key_func=list_cache_key_func, latest_key_func=timestamped_list_latest_key_constructor,
+            timeout=list_cache_timeout,
+        ),
     )
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
     @conditional_decorator(
         lambda: settings.USE_API_CACHING,
-        compressed_cache_response(key_func=object_cache_key_func, timeout=object_cache_timeout),
+        compressed_cache_response(
+            key_func=object_cache_key_func, latest_key_func=timestamped_object_latest_key_constructor,
+            timeout=object_cache_timeout,
+        ),
     )
     def retrieve(self, request, *args, **kwargs):
         return super().retrieve(request, *args, **kwargs)
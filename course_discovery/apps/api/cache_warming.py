@@ -0,0 +1,98 @@
+"""
+Warming of the API response cache.
+
+Changing the API timestamp makes every cached response stale at once, which is what the data loaders
+do once they complete. The functions below replay the most requested API URLs through the whole view
+stack, so that their responses are cached again before they are requested by users.
+"""
+import concurrent.futures
+import logging
+import re
+import threading
+import time
+from collections import Counter, namedtuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.test import Client
+
+logger = logging.getLogger(__name__)
+User = get_user_model()
+
+# Matches the request line of GET requests made to the API in access logs of the common and combined formats.
+ACCESS_LOG_REQUEST_REGEX = re.compile(r'"GET (?P<path>/api/\S+) HTTP/[\d.]+"')
+
+WarmedUrl = namedtuple('WarmedUrl', 'path status_code seconds')
+
+
+def get_most_requested_paths(lines, limit):
+    """
+    Returns the API paths most requested in the given access log lines, most requested first.
+    """
+    counts = Counter()
+    for line in lines:
+        match = ACCESS_LOG_REQUEST_REGEX.search(line)
+        if match:
+            counts[match.group('path')] += 1
+    return [path for path, __ in counts.most_common(limit)]
+
+
+def warm_api_cache(paths, username, workers):
+    """
+    Requests the given API paths, with up to `workers` concurrent requests, as the given user, so that
+    their responses are cached.
+
+    Cached responses are shared by every user, so the user only needs to be allowed to request the paths.
+
+    Returns:
+        list[WarmedUrl]: The status code and render time of every path, slowest first.
+    """
+    user = User.objects.get(username=username)
+    local = threading.local()
+
+    def warm(path):
+        if not hasattr(local, 'client'):
+            local.client = Client(raise_request_exception=False)
+            local.client.force_login(user)
+
+        started = time.perf_counter()
+        response = local.client.get(path, HTTP_ACCEPT='application/json')
+        return WarmedUrl(path, response.status_code, time.perf_counter() - started)
+
+    def warm_in_thread(path):
+        try:
+            return warm(path)
+        finally:
+            # Connections are opened per thread, and would otherwise be left open once the pool shuts down.
+            connections.close_all()
+
+    if workers > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            warmed_urls = list(executor.map(warm_in_thread, paths))
+    else:
+        warmed_urls = [warm(path) for path in paths]
+
+    warmed_urls.sort(key=lambda warmed_url: warmed_url.seconds, reverse=True)
+    for warmed_url in warmed_urls:
+        logger.info(
+            'Warmed [%s] in %.2fs with status %d.', warmed_url.path, warmed_url.seconds, warmed_url.status_code
+        )
+    return warmed_urls
+
+
+def warm_api_cache_after_data_load():
+    """
+    Warms the cached responses of the configured API paths, if enabled.
+
+    Failures are logged rather than raised, so that they never fail the data load that just completed.
+    """
+    if not (settings.USE_API_CACHING and settings.API_CACHE_WARMER_AFTER_DATA_LOADS):
+        return
+
+    try:
+        warm_api_cache(
+            settings.API_CACHE_WARMER_PATHS, settings.API_CACHE_WARMER_USERNAME, settings.API_CACHE_WARMER_WORKERS
+        )
+    except Exception:  # pylint: disable=broad-except
+        logger.exception('Failed to warm the API cache.')
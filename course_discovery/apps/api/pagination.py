@@ -1,4 +1,4 @@
-from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.pagination import CursorPagination, LimitOffsetPagination
 from rest_framework.pagination import PageNumberPagination as BasePageNumberPagination
 
 
@@ -6,6 +6,24 @@ class PageNumberPagination(BasePageNumberPagination):
     page_size_query_param = 'page_size'
 
 
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination seeking to the position of the last result of the previous page.
+
+    Unlike page number and limit/offset pagination, no count query is made and the cost of a page does
+    not depend on how deep it is, which keeps crawls of whole lists linear in the number of pages. Results
+    are ordered by the `cursor_ordering` of the view, and by primary key if it declares none. The first
+    field of the ordering should be unique or nearly unique, results sharing a value being told apart
+    by an offset in the cursor.
+    """
+    mode_query_param = 'pagination'
+    page_size_query_param = 'page_size'
+    ordering = ('pk',)
+
+    def get_ordering(self, request, queryset, view):
+        return tuple(getattr(view, 'cursor_ordering', None) or self.ordering)
+
+
 class ProxiedCall:
     """
     Utility class used in conjunction with ProxiedPagination to route method
@@ -55,8 +73,8 @@ class ProxiedCall:
 
 class ProxiedPagination:
     """
-    Pagination class which proxies to either DRF's PageNumberPagination or
-    LimitOffsetPagination.
+    Pagination class which proxies to either DRF's PageNumberPagination,
+    LimitOffsetPagination or KeysetPagination.
 
     The following are all valid:
 
@@ -64,24 +82,30 @@ class ProxiedPagination:
         http://api.example.org/accounts/?page=4&page_size=100
         http://api.example.org/accounts/?limit=100
         http://api.example.org/accounts/?offset=400&limit=100
+        http://api.example.org/accounts/?pagination=cursor&page_size=100
+        http://api.example.org/accounts/?pagination=cursor&page_size=100&cursor=cD0xMDA%3D
+
+    Links to the next and previous pages keep the `pagination` query parameter,
+    so that clients only need to follow them.
 
     If no query parameters are passed, proxies to LimitOffsetPagination by default.
     """
 
     def __init__(self):
+        keyset_paginator = KeysetPagination()
         page_number_paginator = PageNumberPagination()
         limit_offset_paginator = LimitOffsetPagination()
 
         self.paginators = [
+            (keyset_paginator, keyset_paginator.mode_query_param),
             (page_number_paginator, page_number_paginator.page_query_param),
             (limit_offset_paginator, limit_offset_paginator.limit_query_param),
         ]
 
     def __getattr__(self, name):
         # For each paginator, check if the requested attribute is defined.
-        # If the attr is defined on both paginators, we take the one defined for
-        # LimitOffsetPagination. As of this writing, `display_page_controls` is
-        # the only attr shared by the two pagination classes.
+        # If the attr is defined on several paginators, we take the one defined
+        # for the last of them, LimitOffsetPagination, e.g. `display_page_controls`.
         for paginator, __ in self.paginators:
             try:
                 attr = getattr(paginator, name)
@@ -93,7 +117,7 @@ class ProxiedPagination:
         try:
             attr
         except NameError as name_error:
-            # The attribute wasn't found on either paginator.
+            # The attribute wasn't found on any paginator.
             raise AttributeError from name_error
         # The attribute was found. If it's callable, return a ProxiedCall
         # which will route method calls to the correct paginator.
@@ -37,7 +37,7 @@ from course_discovery.apps.api.utils import StudioAPI, get_excluded_restriction_
 from course_discovery.apps.catalogs.models import Catalog
 from course_discovery.apps.core.api_client.lms import LMSAPIClient
 from course_discovery.apps.core.utils import update_instance
-from course_discovery.apps.course_metadata.choices import CourseRunStatus, ProgramStatus
+from course_discovery.apps.course_metadata.choices import CourseRunRestrictionType, CourseRunStatus, ProgramStatus
 from course_discovery.apps.course_metadata.fields import HtmlField as MetadataHtmlField
 from course_discovery.apps.course_metadata.models import (
     FAQ, AbstractLocationRestrictionModel, AdditionalMetadata, AdditionalPromoArea, BulkOperationTask, CertificateInfo,
@@ -2053,7 +2053,7 @@ class MinimalProgramSerializer(TaggitSerializer, FlexFieldsSerializerMixin, Base
 
         return queryset.select_related(
             'type', 'partner', 'degree', 'language_override', 'level_type_override', 'primary_subject_override',
-            'degree__additional_metadata'
+            'degree__additional_metadata', 'summary'
         ).prefetch_related(
             'excluded_course_runs',
             # `type` is serialized by a third-party serializer. Providing this field name allows us to
@@ -2179,6 +2179,30 @@ class MinimalProgramSerializer(TaggitSerializer, FlexFieldsSerializerMixin, Base
             return obj.card_image.url
         return obj.card_image_url
 
+    # The values below are read from the ProgramSummary of the program when it is current, rather than computed
+    # over its courses, course runs, seats and entitlements.
+
+    def get_price_ranges(self, obj):
+        summary = obj.current_summary
+        return summary.get_price_ranges() if summary else obj.price_ranges
+
+    def get_weeks_to_complete_min(self, obj):
+        summary = obj.current_summary
+        return summary.weeks_to_complete_min if summary else obj.weeks_to_complete_min
+
+    def get_weeks_to_complete_max(self, obj):
+        summary = obj.current_summary
+        return summary.weeks_to_complete_max if summary else obj.weeks_to_complete_max
+
+    def get_languages(self, obj):
+        # Summaries only hold the languages of unrestricted course runs.
+        request = self.context.get('request')
+        includes_restricted_runs = request and (
+            set(get_excluded_restriction_types(request)) != set(CourseRunRestrictionType.values)
+        )
+        summary = None if includes_restricted_runs else obj.current_summary
+        return summary.languages if summary else [language.code for language in obj.languages]
+
     def to_representation(self, instance):
         data = super().to_representation(instance)
 
@@ -2214,6 +2238,7 @@ class MinimalExtendedProgramSerializer(MinimalProgramSerializer):
     curricula = CurriculumSerializer(many=True)
     card_image_url = serializers.SerializerMethodField()
     expected_learning_items = serializers.SlugRelatedField(many=True, read_only=True, slug_field='value')
+    price_ranges = serializers.SerializerMethodField()
 
     @classmethod
     def prefetch_queryset(cls, partner, queryset=None, course_runs=None):
@@ -2237,8 +2262,7 @@ class ProgramSerializer(MinimalProgramSerializer):
     corporate_endorsements = CorporateEndorsementSerializer(many=True)
     job_outlook_items = serializers.SlugRelatedField(many=True, read_only=True, slug_field='value')
     individual_endorsements = EndorsementSerializer(many=True)
-    languages = serializers.SlugRelatedField(
-        many=True, read_only=True, slug_field='code',
+    languages = serializers.SerializerMethodField(
         help_text=_('Languages that course runs in this program are offered in.'),
     )
     transcript_languages = serializers.SlugRelatedField(
@@ -2258,6 +2282,9 @@ class ProgramSerializer(MinimalProgramSerializer):
     skill_names = serializers.SerializerMethodField()
     skills = serializers.SerializerMethodField()
     product_source = SourceSerializer(required=False, read_only=True)
+    price_ranges = serializers.SerializerMethodField()
+    weeks_to_complete_min = serializers.SerializerMethodField()
+    weeks_to_complete_max = serializers.SerializerMethodField()
 
     @classmethod
     def prefetch_queryset(cls, partner, queryset=None, course_runs=None):
@@ -2282,7 +2309,8 @@ class ProgramSerializer(MinimalProgramSerializer):
             'language_override',
             'level_type_override',
             'primary_subject_override',
-            'degree__additional_metadata'
+            'degree__additional_metadata',
+            'summary',
         ).prefetch_related(
             'excluded_course_runs',
             # `type` is serialized by a third-party serializer. Providing this field name allows us to
@@ -4,7 +4,9 @@ from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
 
-from course_discovery.apps.api.pagination import PageNumberPagination, ProxiedPagination
+from course_discovery.apps.api.pagination import KeysetPagination, PageNumberPagination, ProxiedPagination
+from course_discovery.apps.core.models import User
+from course_discovery.apps.core.tests.factories import UserFactory
 
 
 class ProxiedPaginationTests(TestCase):
@@ -65,6 +67,19 @@ class ProxiedPaginationTests(TestCase):
         request = self.get_request(limit=2)
         self.assert_proxied(self.limit_offset_paginator, request)
 
+    def test_keyset_pagination(self):
+        """
+        Verify that ProxiedPagination proxies to KeysetPagination when a
+        `pagination` query parameter is present.
+        """
+        UserFactory.create_batch(3)
+        self.queryset = User.objects.all()
+        request = self.get_request(pagination='cursor', page_size=2)
+        self.assert_proxied(KeysetPagination(), request)
+
+        results = self.paginate_queryset(KeysetPagination(), request)
+        assert results == list(User.objects.order_by('pk')[:2])
+
     def test_noncallable_attribute_access(self):
         """
         Verify that attempts to access noncallable attributes are proxied to
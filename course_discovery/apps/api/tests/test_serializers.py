@@ -44,7 +44,9 @@ from course_discovery.apps.core.tests.helpers import make_image_file
 from course_discovery.apps.core.tests.mixins import ElasticsearchTestMixin, LMSAPIClientMixin
 from course_discovery.apps.core.utils import serialize_datetime
 from course_discovery.apps.course_metadata.choices import CourseRunStatus, ProgramStatus
-from course_discovery.apps.course_metadata.models import AbstractLocationRestrictionModel, CourseReview, CourseType
+from course_discovery.apps.course_metadata.models import (
+    AbstractLocationRestrictionModel, CourseReview, CourseType, Program, ProgramSummary
+)
 from course_discovery.apps.course_metadata.search_indexes.documents import (
     CourseDocument, CourseRunDocument, LearnerPathwayDocument, PersonDocument, ProgramDocument
 )
@@ -1268,6 +1270,26 @@ class ProgramSerializerTests(MinimalProgramSerializerTests):
         serializer = self.serializer_class(program, context={'request': request})
         self.assertDictEqual(serializer.data, expected)
 
+    def test_data_with_summary(self):
+        """ Verify the values of a current summary of the program are serialized rather than computed. """
+        request = make_request()
+        program = self.create_program()
+        ProgramSummary.rebuild(Program.objects.filter(pk=program.pk))
+        ProgramSummary.objects.filter(program=program).update(weeks_to_complete_min=99)
+
+        program = Program.objects.get(pk=program.pk)
+        expected = self.get_expected_data(program, request)
+        expected['weeks_to_complete_min'] = 99
+        expected['languages'] = sorted(expected['languages'])
+        serializer = self.serializer_class(program, context={'request': request})
+        self.assertDictEqual(serializer.data, expected)
+
+        # Summaries are ignored once their program changes.
+        Program.objects.filter(pk=program.pk).update(data_modified_timestamp=now())
+        program = Program.objects.get(pk=program.pk)
+        serializer = self.serializer_class(program, context={'request': request})
+        assert serializer.data['weeks_to_complete_min'] == program.weeks_to_complete_min
+
     def test_data_with_skills(self):
         """
         Verify we can specify program excluded_course_runs and the serializers will
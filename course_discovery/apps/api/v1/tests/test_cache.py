@@ -1,4 +1,5 @@
 import zlib
+from unittest import mock
 
 import ddt
 from django.core.cache import cache
@@ -9,7 +10,11 @@ from rest_framework.response import Response
 from rest_framework_extensions.test import APIRequestFactory
 from waffle.testutils import override_flag
 
-from course_discovery.apps.api.cache import compressed_cache_response
+from course_discovery.apps.api.cache import (
+    API_CACHE_LOCK_KEY, ApiTimestampKeyBit, compressed_cache_response, get_cache_stats, record_cache_outcome
+)
+from course_discovery.apps.core.tests.factories import PartnerFactory
+from course_discovery.apps.course_metadata.tests.factories import CourseFactory, ProgramFactory, SubjectFactory
 
 factory = APIRequestFactory()
 
@@ -19,6 +24,7 @@ factory = APIRequestFactory()
 class CompressedCacheResponseTest(TestCase):
     def setUp(self):
         super().setUp()
+        cache.clear()
         self.request = factory.get('')
         self.cache_response_key = 'cache_response_key'
 
@@ -169,3 +175,116 @@ class CompressedCacheResponseTest(TestCase):
         cache.set('cache_response_key', response_dict)
         response = view_instance.dispatch(request=self.request)
         self.assertEqual(response['test'], 'foo')
+
+    def get_coalescing_view(self, key):
+        def key_func(**kwargs):
+            return key
+
+        class TestView(views.APIView):
+            permission_classes = [permissions.AllowAny]
+            renderer_classes = [JSONRenderer]
+            render_count = 0
+
+            @compressed_cache_response(key_func=key_func, latest_key_func=lambda **kwargs: 'latest_key')
+            def get(self, request, *_args, **_kwargs):
+                TestView.render_count += 1
+                return Response('test response')
+
+        view_instance = TestView()
+        view_instance.headers = {}  # pylint: disable=attribute-defined-outside-init
+        return view_instance
+
+    def test_should_serve_stale_response_while_another_request_renders(self):
+        """ Verify a miss is served the response previously cached for the URL while the lock is held. """
+        view_instance = self.get_coalescing_view('old_key')
+        response = view_instance.dispatch(request=self.request)
+        assert response.content.decode('utf-8') == '"test response"'
+
+        view_instance = self.get_coalescing_view('new_key')
+        cache.set(API_CACHE_LOCK_KEY.format(key='new_key'), True)
+        response = view_instance.dispatch(request=factory.get(''))
+
+        assert response.content.decode('utf-8') == '"test response"'
+        assert view_instance.render_count == 0
+        assert cache.get('new_key') is None
+
+    def test_should_release_lock_after_rendering(self):
+        """ Verify a miss renders and caches the response, and then releases the lock. """
+        view_instance = self.get_coalescing_view(self.cache_response_key)
+        view_instance.dispatch(request=self.request)
+
+        assert view_instance.render_count == 1
+        assert cache.get(self.cache_response_key) is not None
+        assert cache.get(API_CACHE_LOCK_KEY.format(key=self.cache_response_key)) is None
+
+    @override_settings(API_CACHE_LOCK_WAIT=0)
+    def test_should_render_after_waiting_for_lock(self):
+        """ Verify a miss renders the response itself once it timed out waiting for the lock holder. """
+        view_instance = self.get_coalescing_view(self.cache_response_key)
+        cache.set(API_CACHE_LOCK_KEY.format(key=self.cache_response_key), True)
+        response = view_instance.dispatch(request=self.request)
+
+        assert response.content.decode('utf-8') == '"test response"'
+        assert view_instance.render_count == 1
+
+
+class ApiTimestampKeyBitTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.partner = PartnerFactory()
+        self.other_partner = PartnerFactory()
+
+    def get_data(self, resources, partner):
+        view_instance = mock.Mock(cache_resources=resources)
+        request = mock.Mock(site=mock.Mock(partner=partner))
+        return ApiTimestampKeyBit().get_data(
+            params=None, view_instance=view_instance, view_method=None, request=request, args=(), kwargs={}
+        )
+
+    def test_changes_invalidate_views_of_their_resource_and_partner(self):
+        """ Verify a change only invalidates the responses depending on the changed resource, for its partner. """
+        course = CourseFactory(partner=self.partner)
+        program = ProgramFactory(partner=self.partner)
+        course_data = self.get_data(('course',), self.partner)
+        program_data = self.get_data(('program',), self.partner)
+        other_partner_course_data = self.get_data(('course',), self.other_partner)
+        assert self.get_data(('course',), self.partner) == course_data
+
+        course.save()
+
+        assert self.get_data(('course',), self.partner) != course_data
+        assert self.get_data(('program',), self.partner) == program_data
+        assert self.get_data(('course',), self.other_partner) == other_partner_course_data
+
+        program.save()
+
+        assert self.get_data(('program',), self.partner) != program_data
+
+    def test_changes_to_shared_models_invalidate_every_view(self):
+        """ Verify changes to models not belonging to a resource type invalidate every response. """
+        course_data = self.get_data(('course',), self.partner)
+        global_data = self.get_data((), self.partner)
+
+        SubjectFactory(partner=self.partner)
+
+        assert self.get_data(('course',), self.partner) != course_data
+        assert self.get_data((), self.partner) != global_data
+
+
+class CacheStatsTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_record_cache_outcome(self):
+        """ Verify hits and misses are counted per view method. """
+        assert get_cache_stats('TestView', 'list') == {'hits': 0, 'misses': 0}
+
+        record_cache_outcome('TestView', 'list', hit=False)
+        record_cache_outcome('TestView', 'list', hit=True)
+        record_cache_outcome('TestView', 'list', hit=True)
+        record_cache_outcome('TestView', 'retrieve', hit=True)
+
+        assert get_cache_stats('TestView', 'list') == {'hits': 2, 'misses': 1}
+        assert get_cache_stats('TestView', 'retrieve') == {'hits': 1, 'misses': 0}
@@ -232,3 +232,13 @@ class APITestCase(SiteMixin, RestAPITestCase):
         while still ensuring that we don't inflate the number of queries by an order of magnitude.
         """
         return super().assertNumQueries(FuzzyInt(num, kwargs.pop('threshold', 2)), func=func, *args, **kwargs)
+
+    def assertWithinQueryBudget(self, response):
+        """
+        Asserts that the view which served the response made no more queries than its declared budget.
+        """
+        profile = response.request_profile
+        assert profile.query_budget is not None, f'{profile.view_name} declares no query budget'
+        assert profile.query_count <= profile.query_budget, (
+            f'{profile.view_name} made {profile.query_count} queries, exceeding its budget of {profile.query_budget}'
+        )
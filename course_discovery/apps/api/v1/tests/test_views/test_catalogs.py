@@ -14,6 +14,7 @@ from rest_framework.reverse import reverse
 
 from course_discovery.apps.api.tests.jwt_utils import generate_jwt_header_for_user
 from course_discovery.apps.api.v1.tests.test_views.mixins import APITestCase, OAuth2Mixin, SerializationMixin
+from course_discovery.apps.api.v1.views.catalogs import CatalogViewSet
 from course_discovery.apps.catalogs.models import Catalog
 from course_discovery.apps.catalogs.tests.factories import CatalogFactory
 from course_discovery.apps.core.tests.factories import UserFactory
@@ -426,6 +427,8 @@ class CatalogViewSetTests(ElasticsearchTestMixin, SerializationMixin, OAuth2Mixi
 
         with self.assertNumQueries(23, threshold=10):
             response = self.client.get(url)
+            # The course runs are only loaded as the content is streamed.
+            received_content = b''.join(response.streaming_content)
 
         course_run = self.serialize_catalog_flat_course_run(self.course_run)
         expected = [
@@ -480,11 +483,6 @@ class CatalogViewSetTests(ElasticsearchTestMixin, SerializationMixin, OAuth2Mixi
             course_run['video']['src'],
         ]
 
-        # collect streamed content
-        received_content = b''
-        for item in response.streaming_content:
-            received_content += item
-
         # convert received content to csv for comparison
         f = StringIO(received_content.decode('utf-8'))
         reader = csv.reader(f)
@@ -493,6 +491,22 @@ class CatalogViewSetTests(ElasticsearchTestMixin, SerializationMixin, OAuth2Mixi
         assert response.status_code == 200
         assert expected == content[1]
 
+    def test_csv_in_batches(self):
+        """ Verify every course run is streamed when the course runs are loaded in several batches. """
+        course_run = CourseRunFactory(
+            course=self.course, enrollment_end=self.course_run.enrollment_end, end=self.course_run.end
+        )
+        for run in (self.course_run, course_run):
+            SeatFactory(type=SeatTypeFactory.verified(), course_run=run)
+
+        url = reverse('api:v1:catalog-csv', kwargs={'id': self.catalog.id})
+        with mock.patch.object(CatalogViewSet, 'CSV_BATCH_SIZE', 1):
+            response = self.client.get(url)
+            content = list(csv.DictReader(StringIO(b''.join(response.streaming_content).decode('utf-8'))))
+
+        assert response.status_code == 200
+        assert [row['key'] for row in content] == [self.course_run.key, course_run.key]
+
     def test_get(self):
         """ Verify the endpoint returns the details for a single catalog. """
         url = reverse('api:v1:catalog-detail', kwargs={'id': self.catalog.id})
@@ -1239,6 +1239,7 @@ class CourseRunViewSetTests(SerializationMixin, ElasticsearchTestMixin, OAuth2Mi
             response.data['results'],
             self.serialize_course_run(CourseRun.objects.all().order_by(Lower('key')), many=True)
         )
+        self.assertWithinQueryBudget(response)
 
     @ddt.data(
         [True, 3],
@@ -8,11 +8,13 @@ import pytest
 import pytz
 import responses
 from django.conf import settings
-from django.db import IntegrityError
+from django.core.cache import cache
+from django.db import IntegrityError, connection
 from django.db.models.functions import Lower
 from django.db.models.query import Prefetch
 from django.db.models.signals import m2m_changed, pre_save
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from edx_toggles.toggles.testutils import override_waffle_switch
 from rest_framework.reverse import reverse
 from testfixtures import LogCapture
@@ -109,6 +111,7 @@ class CourseViewSetTests(SerializationMixin, ElasticsearchTestMixin, OAuth2Mixin
             response = self.client.get(url)
         assert response.status_code == 200
         assert response.data == self.serialize_course(self.course)
+        self.assertWithinQueryBudget(response)
 
     @ddt.data(
         [True, 200],
@@ -455,6 +458,21 @@ class CourseViewSetTests(SerializationMixin, ElasticsearchTestMixin, OAuth2Mixin
         context = {'exclude_utm': 1}
         assert response.data['results'] == self.serialize_course([self.course], many=True, extra_context=context)
 
+    def test_list_cursor_pagination(self):
+        """ Verify the endpoint pages through every course, ordered by key, when cursor pagination is requested. """
+        courses = [self.course] + CourseFactory.create_batch(4, partner=self.partner)
+        url = reverse('api:v1:course-list') + '?pagination=cursor&page_size=2'
+
+        keys = []
+        while url:
+            response = self.client.get(url)
+            assert response.status_code == 200
+            assert 'count' not in response.data
+            keys += [course['key'] for course in response.data['results']]
+            url = response.data['next']
+
+        assert keys == sorted(course.key for course in courses)
+
     def test_list_pubq_by_title(self):
         """ Verify the endpoint returns a list of courses filtered by title when specified with pubq and editable """
         url = reverse('api:v1:course-list') + '?editable=1&pubq=ThisIsASpecificTestString'
@@ -700,6 +718,34 @@ class CourseViewSetTests(SerializationMixin, ElasticsearchTestMixin, OAuth2Mixin
         assert response.status_code == 200
         assert response.data['results'] == self.serialize_course([self.course], many=True)
 
+    @override_settings(USE_API_CACHING=True, API_CACHE_LOCK_WAIT=0)
+    def test_editable_list_is_not_served_from_another_user_cache(self):
+        """ Verify responses cached for the editable courses of a user are not served to another one. """
+        other_org = OrganizationFactory(partner=self.partner)
+        other_course = CourseFactory(partner=self.partner, key='edX+Other101')
+        other_course.authoring_organizations.add(other_org)
+        other_user = UserFactory()
+        other_user.groups.add(OrganizationExtensionFactory(organization=other_org).group)
+        self.user.groups.add(OrganizationExtensionFactory(organization=self.org).group)
+        self.user.is_staff = False
+        self.user.save()
+        url = reverse('api:v1:course-list') + '?editable=1'
+
+        response = self.client.get(url)
+        assert [course['key'] for course in response.json()['results']] == [self.course.key]
+
+        # Another request is rendering every missing response, so the response last cached would be served.
+        add = cache.add
+
+        def add_unless_lock(key, *args):
+            return not key.endswith('.lock') and add(key, *args)
+
+        self.client.logout()
+        self.client.login(username=other_user.username, password=USER_PASSWORD)
+        with mock.patch.object(cache, 'add', side_effect=add_unless_lock):
+            response = self.client.get(url)
+        assert [course['key'] for course in response.json()['results']] == [other_course.key]
+
     @responses.activate
     def test_editable_list_is_denied_as_normal_user(self):
         """ Verify that GET with editable=1 can't be reached by a normal unprivileged user. """
@@ -2029,6 +2075,26 @@ class CourseViewSetTests(SerializationMixin, ElasticsearchTestMixin, OAuth2Mixin
         assert self.course.title == 'Fake Test'
         self.assertDictEqual(response.data, self.serialize_course(course))
 
+    @responses.activate
+    def test_patch_does_not_save_course_runs(self):
+        """ Verify editing a course makes no query saving its runs, however many it has. """
+        CourseRunFactory.create_batch(5, course=self.course, status=CourseRunStatus.Unpublished)
+        url = reverse('api:v1:course-detail', kwargs={'key': self.course.uuid})
+        # The first edit creates the draft versions of the course and its runs.
+        response = self.client.patch(url, {'title': 'Title'}, format='json')
+        assert response.status_code == 200
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.patch(url, {'title': 'Title EDIT'}, format='json')
+        assert response.status_code == 200
+
+        course_run_table = connection.ops.quote_name(CourseRun._meta.db_table)
+        course_run_writes = [
+            query for query in context.captured_queries
+            if query['sql'].startswith(('UPDATE', 'INSERT')) and course_run_table in query['sql']
+        ]
+        assert course_run_writes == []
+
     @responses.activate
     def test_patch_resets_run_status(self):
         self.mock_ecommerce_publication()
@@ -14,7 +14,7 @@ from course_discovery.apps.api.v1.views.programs import ProgramViewSet
 from course_discovery.apps.core.tests.factories import USER_PASSWORD, UserFactory
 from course_discovery.apps.core.tests.helpers import make_image_file
 from course_discovery.apps.course_metadata.choices import CourseRunStatus, ProgramStatus
-from course_discovery.apps.course_metadata.models import CourseType, Program, ProgramType
+from course_discovery.apps.course_metadata.models import CourseType, Program, ProgramSummary, ProgramType
 from course_discovery.apps.course_metadata.tests.factories import (
     CorporateEndorsementFactory, CourseFactory, CourseRunFactory, CurriculumCourseMembershipFactory, CurriculumFactory,
     CurriculumProgramMembershipFactory, DegreeAdditionalMetadataFactory, DegreeFactory, EndorsementFactory,
@@ -235,6 +235,20 @@ class TestProgramViewSet(SerializationMixin):
             assert not resp.data['results'][0]['courses'][0]['course_run_statuses']
             assert resp.data['results'][0]['course_run_statuses'] == []
 
+    @pytest.mark.parametrize("include_restriction_param", [True, False])
+    def test_retrieve_restricted_runs_languages(self, include_restriction_param):
+        """ Verify the languages of restricted runs are only returned when requested, even from a summary. """
+        program = self.create_program(include_restricted_run=True)
+        ProgramSummary.rebuild(Program.objects.filter(pk=program.pk))
+        assert Program.objects.get(pk=program.pk).current_summary.languages == []
+
+        querystring = {'include_restricted': 'custom-b2c'} if include_restriction_param else None
+        response = self.assert_retrieve_success(program, querystring)
+
+        course_run = program.courses.first().course_runs.first()
+        expected = [course_run.language.code] if include_restriction_param else []
+        assert response.data['languages'] == expected
+
     def test_extended_query_param_fields(self):
         """ Verify that the `extended` query param will result in an extended amount of fields returned. """
         for _ in range(3):
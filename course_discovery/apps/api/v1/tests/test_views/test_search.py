@@ -3,6 +3,7 @@ import json
 import urllib.parse
 import uuid
 from operator import itemgetter
+from unittest import mock
 
 import ddt
 import factory
@@ -1104,6 +1105,26 @@ class TypeaheadSearchViewTests(mixins.TypeaheadSerializationMixin, mixins.LoginM
         # compare course titles embedded in course run title to ensure that course runs belong to different courses
         assert course_runs[0]['title'][4:-1] != course_runs[1]['title'][4:-1]
 
+    def test_typeahead_cached(self):
+        """ Verify the typeahead results are cached per partner and query, regardless of its case and whitespace. """
+        title = "Python"
+        course_run = CourseRunFactory(title=title, course__partner=self.partner)
+        program = ProgramFactory(title=title, status=ProgramStatus.Active, partner=self.partner)
+        expected_response_data = {
+            'course_runs': [self.serialize_course_run_search(course_run)],
+            'programs': [self.serialize_program_search(program)]
+        }
+
+        with mock.patch.object(
+            TypeaheadSearchView, 'get_results', autospec=True, side_effect=TypeaheadSearchView.get_results
+        ) as mock_get_results:
+            for query in (title, f' {title.lower()}  '):
+                response = self.get_response({'q': query})
+                assert response.status_code == 200
+                self.assertDictEqual(response.json(), expected_response_data)
+
+        assert mock_get_results.call_count == 1
+
     def test_typeahead_multiple_authoring_organizations(self):
         """ Test typeahead response with multiple authoring organizations. """
         title = "Design"
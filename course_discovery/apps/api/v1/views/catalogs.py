@@ -32,6 +32,9 @@ class CatalogViewSet(viewsets.ModelViewSet):
     # versions of this API should only support the system default, PageNumberPagination.
     pagination_class = ProxiedPagination
 
+    # Number of course runs loaded at once when streaming a catalog CSV.
+    CSV_BATCH_SIZE = 500
+
     @transaction.atomic
     def create(self, request, *args, **kwargs):
         """ Create a new catalog. """
@@ -170,7 +173,8 @@ class CatalogViewSet(viewsets.ModelViewSet):
         """
         catalog = self.get_object()
         courses = catalog.courses()
-        course_runs = CourseRun.objects.filter(course__in=courses).active().marketable()
+        course_runs = CourseRun.objects.filter(course__in=courses).active().marketable().order_by('pk')
+        course_run_pks = list(course_runs.values_list('pk', flat=True))
 
         # We use select_related and prefetch_related to decrease our database query count
         course_runs = course_runs.select_related(*serializers.SELECT_RELATED_FIELDS['course_run'])
@@ -178,13 +182,20 @@ class CatalogViewSet(viewsets.ModelViewSet):
         prefetch_fields += serializers.PREFETCH_FIELDS['course_run']
         course_runs = course_runs.prefetch_related(*prefetch_fields)
 
-        serializer = serializers.FlattenedCourseRunWithCourseSerializer(
-            course_runs, many=True, context={'request': request}
-        )
-        data = CourseRunCSVRenderer().render(serializer.data)
-
+        data = CourseRunCSVRenderer().render(self._serialize_in_batches(course_runs, course_run_pks))
         response = StreamingHttpResponse(data, content_type='text/csv')
         response['Content-Disposition'] = 'attachment; filename="catalog_{id}_{date}.csv"'.format(
             id=id, date=datetime.datetime.utcnow().strftime('%Y-%m-%d-%H-%M')
         )
         return response
+
+    def _serialize_in_batches(self, course_runs, course_run_pks):
+        """
+        Yields the serialized course runs with the given pks, loading them with their prefetched
+        relations in batches of `CSV_BATCH_SIZE`, so that only a batch is held in memory at a time.
+        """
+        for start in range(0, len(course_run_pks), self.CSV_BATCH_SIZE):
+            batch = course_runs.filter(pk__in=course_run_pks[start:start + self.CSV_BATCH_SIZE])
+            yield from serializers.FlattenedCourseRunWithCourseSerializer(
+                batch, many=True, context={'request': self.request}
+            ).data
@@ -63,6 +63,8 @@ class CourseRunViewSet(CompressedCacheResponseMixin, ValidElasticSearchQueryRequ
     permission_classes = (IsAuthenticated, IsCourseRunEditorOrDjangoOrReadOnly)
     queryset = CourseRun.objects.all().order_by(Lower('key'))
     serializer_class = serializers.CourseRunWithProgramsSerializer
+    cache_resources = ('course', 'program', 'person', 'organization')
+    query_budgets = {'list': 40, 'retrieve': 30}
     metadata_class = MetadataWithRelatedChoices
     metadata_related_choices_whitelist = (
         'content_language', 'level_type', 'transcript_languages', 'expected_program_type', 'type'
@@ -70,7 +72,9 @@ class CourseRunViewSet(CompressedCacheResponseMixin, ValidElasticSearchQueryRequ
 
     # Explicitly support PageNumberPagination and LimitOffsetPagination. Future
     # versions of this API should only support the system default, PageNumberPagination.
+    # KeysetPagination, ordered by `cursor_ordering`, serves crawls of every result.
     pagination_class = ProxiedPagination
+    cursor_ordering = ('key', 'id')
 
     def get_queryset(self):
         """ List one course run
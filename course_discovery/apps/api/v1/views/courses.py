@@ -75,6 +75,8 @@ class CourseViewSet(CompressedCacheResponseMixin, viewsets.ModelViewSet):
     lookup_value_regex = COURSE_ID_REGEX + '|' + COURSE_UUID_REGEX
     permission_classes = (IsAuthenticated, IsCourseEditorOrReadOnly,)
     serializer_class = serializers.CourseWithProgramsSerializer
+    cache_resources = ('course', 'program', 'person', 'organization')
+    query_budgets = {'list': 50, 'retrieve': 50}
     metadata_class = MetadataWithType
     metadata_related_choices_whitelist = ('mode', 'level_type', 'subjects',)
 
@@ -83,7 +85,9 @@ class CourseViewSet(CompressedCacheResponseMixin, viewsets.ModelViewSet):
 
     # Explicitly support PageNumberPagination and LimitOffsetPagination. Future
     # versions of this API should only support the system default, PageNumberPagination.
+    # KeysetPagination, ordered by `cursor_ordering`, serves crawls of every result.
     pagination_class = ProxiedPagination
+    cursor_ordering = ('key', 'id')
 
     def get_object(self):
         queryset = self.filter_queryset(self.get_queryset())
@@ -543,4 +547,5 @@ class CourseRecommendationViewSet(CompressedCacheResponseMixin, RetrieveModelMix
     lookup_value_regex = COURSE_ID_REGEX
     permission_classes = (IsAuthenticated, IsCourseEditorOrReadOnly,)
     serializer_class = serializers.CourseWithRecommendationsSerializer
+    cache_resources = ('course', 'program', 'person', 'organization')
     queryset = Course.objects.all()
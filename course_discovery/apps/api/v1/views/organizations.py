@@ -19,6 +19,7 @@ class OrganizationViewSet(CompressedCacheResponseMixin, viewsets.ReadOnlyModelVi
     lookup_value_regex = '[0-9a-f-]+'
     permission_classes = (IsAuthenticated,)
     serializer_class = serializers.OrganizationSerializer
+    cache_resources = ('organization',)
 
     # Explicitly support PageNumberPagination and LimitOffsetPagination. Future
     # versions of this API should only support the system default, PageNumberPagination.
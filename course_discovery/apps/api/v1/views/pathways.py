@@ -14,6 +14,7 @@ class PathwayViewSet(CompressedCacheResponseMixin, viewsets.ReadOnlyModelViewSet
     serializer_class = serializers.PathwaySerializer
     filter_backends = (DjangoFilterBackend,)
     filterset_fields = ('status',)
+    cache_resources = ('pathway', 'program', 'course', 'organization')
 
     def get_queryset(self):
         excluded_restriction_types = get_excluded_restriction_types(self.request)
@@ -23,10 +23,14 @@ class ProgramViewSet(CompressedCacheResponseMixin, viewsets.ReadOnlyModelViewSet
     permission_classes = (IsAuthenticated,)
     filter_backends = (DjangoFilterBackend, rest_framework_filters.OrderingFilter)
     filterset_class = filters.ProgramFilter
+    cache_resources = ('program', 'course', 'person', 'organization')
+    query_budgets = {'list': 50, 'retrieve': 100}
 
     # Explicitly support PageNumberPagination and LimitOffsetPagination. Future
     # versions of this API should only support the system default, PageNumberPagination.
+    # KeysetPagination, ordered by `cursor_ordering`, serves crawls of every result.
     pagination_class = ProxiedPagination
+    cursor_ordering = ('uuid', 'id')
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -1,12 +1,15 @@
 import uuid
+from hashlib import md5
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Q as DQ
 from django_elasticsearch_dsl_drf.constants import (
     LOOKUP_FILTER_RANGE, LOOKUP_FILTER_TERM, LOOKUP_FILTER_TERMS, LOOKUP_QUERY_EXCLUDE, LOOKUP_QUERY_GT,
     LOOKUP_QUERY_GTE, LOOKUP_QUERY_IN, LOOKUP_QUERY_LT, LOOKUP_QUERY_LTE
 )
 from django_elasticsearch_dsl_drf.filter_backends import DefaultOrderingFilterBackend, OrderingFilterBackend
+from elasticsearch_dsl import MultiSearch
 from elasticsearch_dsl.query import Q as ESDSLQ
 from rest_framework import status, viewsets
 from rest_framework.exceptions import ValidationError
@@ -423,6 +426,12 @@ class TypeaheadSearchView(APIView):
     permission_classes = (IsAuthenticated,)
 
     def get_results(self, query, partner):
+        """
+        Searches course runs and programs with a single multi search request.
+
+        Course runs are collapsed on their course key, so that the first run of up to RESULT_COUNT different
+        courses is returned.
+        """
         course_runs = search_documents.CourseRunDocument.search().query(
             ESDSLQ(
                 'bool',
@@ -437,21 +446,7 @@ class TypeaheadSearchView(APIView):
                 filter=[ESDSLQ('term', published=True), ESDSLQ('term', partner=partner.short_code)],
                 must_not=ESDSLQ('term', hidden=True),
             )
-        )
-
-        # Get first three results after deduplicating by course key.
-        seen_course_keys, course_run_list = set(), []
-        for course_run in course_runs:
-            course_key = course_run.course_key
-
-            if course_key in seen_course_keys:
-                continue
-
-            seen_course_keys.add(course_key)
-            course_run_list.append(course_run)
-
-            if len(course_run_list) == self.RESULT_COUNT:
-                break
+        ).extra(collapse={'field': 'course_key'})
 
         programs = search_documents.ProgramDocument.search().query(
             ESDSLQ(
@@ -467,9 +462,20 @@ class TypeaheadSearchView(APIView):
                 must_not=[ESDSLQ('term', hidden=True)],
             )
         )
-        programs = programs[:self.RESULT_COUNT]
 
-        return course_run_list, programs
+        multi_search = MultiSearch()
+        for search in (course_runs, programs):
+            multi_search = multi_search.add(search[:self.RESULT_COUNT])
+        course_run_results, program_results = multi_search.execute()  # pylint: disable=unbalanced-tuple-unpacking
+        return list(course_run_results), list(program_results)
+
+    @staticmethod
+    def get_cache_key(query, partner):
+        # Queries only differing by case or whitespace have the same results.
+        normalized_query = ' '.join(query.lower().split())
+        return 'typeahead.{partner}.{query}'.format(
+            partner=partner.short_code, query=md5(normalized_query.encode('utf-8')).hexdigest()
+        )
 
     def get(self, request, *_args, **_kwargs):
         """
@@ -497,7 +503,12 @@ class TypeaheadSearchView(APIView):
         partner = request.site.partner
         if not query:
             raise ValidationError("The 'q' querystring parameter is required for searching.")
-        course_runs, programs = self.get_results(query, partner)
-        data = {'course_runs': course_runs, 'programs': programs}
-        serializer = serializers.TypeaheadSearchSerializer(data)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+
+        # Results are cached for a short time, as the same prefixes are searched again and again while typing.
+        cache_key = self.get_cache_key(query, partner)
+        data = cache.get(cache_key)
+        if data is None:
+            course_runs, programs = self.get_results(query, partner)
+            data = serializers.TypeaheadSearchSerializer({'course_runs': course_runs, 'programs': programs}).data
+            cache.set(cache_key, data, settings.TYPEAHEAD_CACHE_TIMEOUT)
+        return Response(data, status=status.HTTP_200_OK)
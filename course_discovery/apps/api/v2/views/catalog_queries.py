@@ -43,13 +43,14 @@ class CatalogQueryContainsViewSet(ValidElasticSearchQueryRequiredMixin, GenericA
                 course_run_ids = course_run_ids.split(',')
                 specified_identifiers = course_run_ids
                 identified_course_ids.update(
-                    self.search(
+                    self.search_values(
                         query,
+                        'key',
                         queryset=CourseRun.objects.all(),
                         partner=ESDSLQ('term', partner=partner.short_code),
                         identifiers=ESDSLQ('terms', **{'key.raw': course_run_ids}),
                         document=CourseRunDocument
-                    ).values_list('key', flat=True)
+                    )
                 )
 
             if course_uuids:
@@ -58,13 +59,14 @@ class CatalogQueryContainsViewSet(ValidElasticSearchQueryRequiredMixin, GenericA
 
                 log.info(f"Specified course ids: {specified_identifiers}")
                 identified_course_ids.update(
-                    self.search(
+                    self.search_values(
                         query,
+                        'uuid',
                         queryset=Course.objects.all(),
                         partner=ESDSLQ('term', partner=partner.short_code),
                         identifiers=ESDSLQ('terms', **{'uuid': course_uuids}),
                         document=CourseDocument
-                    ).values_list('uuid', flat=True)
+                    )
                 )
             log.info(f"Identified {len(identified_course_ids)} course ids: {identified_course_ids}")
 
@@ -9,7 +9,8 @@ from guardian.shortcuts import get_users_with_perms
 
 from course_discovery.apps.core.mixins import ModelPermissionsMixin
 from course_discovery.apps.course_metadata.models import Course, CourseRun, Program
-from course_discovery.apps.course_metadata.search_indexes.documents import CourseDocument
+from course_discovery.apps.course_metadata.search_indexes.documents import CourseDocument, CourseRunDocument
+from course_discovery.apps.edx_elasticsearch_dsl_extensions.query_cache import get_query_values
 
 
 class Catalog(ModelPermissionsMixin, TimeStampedModel):
@@ -71,12 +72,8 @@ class Catalog(ModelPermissionsMixin, TimeStampedModel):
             dict: Mapping of course IDs to booleans indicating if course is
                   contained in this catalog.
         """
-        contains = {course_id: False for course_id in course_ids}
-        results = self._get_query_results().filter('terms', **{'key.raw': course_ids})
-        for result in results:
-            contains[result.key] = True
-
-        return contains
+        course_keys = self._get_cached_keys(CourseDocument, self._get_query_results)
+        return {course_id: course_id in course_keys for course_id in course_ids}
 
     def contains_course_runs(self, course_run_ids):
         """
@@ -89,15 +86,23 @@ class Catalog(ModelPermissionsMixin, TimeStampedModel):
             dict: Mapping of course IDs to booleans indicating if course run is
                   contained in this catalog.
         """
-        contains = {course_run_id: False for course_run_id in course_run_ids}
-        course_runs = CourseRun.search(self.query).filter('terms', **{'key.raw': course_run_ids}).source(['key'])
+        course_run_keys = self._get_cached_keys(CourseRunDocument, lambda: CourseRun.search(self.query))
+        return {course_run_id: course_run_id in course_run_keys for course_run_id in course_run_ids}
+
+    def _get_cached_keys(self, document, get_search):
+        """
+        Returns the keys of every document matching this Catalog's query, which are cached until the index changes.
+
+        Returns:
+            frozenset
+        """
+        def resolve():
+            return [result.key for result in get_search().source(['key']).scan()]
+
         try:
-            course_runs_keys = [i.key for i in course_runs]
+            return get_query_values(document, self.query, 'key', resolve)
         except RequestError:
-            course_runs_keys = []
-        contains.update({course_run_id: course_run_id in course_runs_keys for course_run_id in course_run_ids})
-
-        return contains
+            return frozenset()
 
     @property
     def viewers(self):
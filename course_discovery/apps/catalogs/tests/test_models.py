@@ -1,3 +1,5 @@
+from unittest import mock
+
 import ddt
 import pytest
 from django.contrib.auth.models import ContentType, Permission
@@ -7,6 +9,7 @@ from course_discovery.apps.catalogs.models import Catalog
 from course_discovery.apps.catalogs.tests import factories
 from course_discovery.apps.core.tests.factories import UserFactory
 from course_discovery.apps.core.tests.mixins import ElasticsearchTestMixin
+from course_discovery.apps.course_metadata.search_indexes.documents import CourseDocument
 from course_discovery.apps.course_metadata.tests.factories import CourseFactory, CourseRunFactory
 
 
@@ -52,6 +55,17 @@ class CatalogTests(ElasticsearchTestMixin, TestCase):
             {course_run.key: True, uncontained_course_run.key: False}
         )
 
+    def test_contains_cached_until_index_changes(self):
+        """ Verify the keys contained in the catalog are reused until the search index is updated. """
+        with mock.patch.object(CourseDocument, 'search', wraps=CourseDocument.search) as mock_search:
+            assert self.catalog.contains([self.course.key]) == {self.course.key: True}
+            assert self.catalog.contains(['d/e/f']) == {'d/e/f': False}
+            assert mock_search.call_count == 1
+
+            CourseFactory(key='d/e/f', title='ABCDEF')
+            assert self.catalog.contains(['d/e/f']) == {'d/e/f': True}
+            assert mock_search.call_count == 2
+
     def test_contains_course_runs_if_query_is_incorrect(self):
         """ Verify the method returns a mapping of course run IDs to booleans. """
         course_run = CourseRunFactory(course=self.course)
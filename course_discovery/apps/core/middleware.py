@@ -0,0 +1,238 @@
+"""
+Middleware profiling the requests served by the API.
+
+Every request is profiled: the number of SQL queries it makes and the time spent running them, the number of
+Elasticsearch requests and the time spent waiting on them, the API cache hits and misses, and the time spent
+in the view and rendering its response. The profile is reported as custom attributes of the monitoring
+transaction and, when `DEBUG` is enabled, as response headers.
+
+Views may declare the number of SQL queries each of their actions is expected to make at most, e.g.
+
+    class CourseViewSet(viewsets.ModelViewSet):
+        query_budgets = {'list': 50, 'retrieve': 50}
+
+Requests exceeding their budget are logged, and the profile is attached to the response as `request_profile`
+so that tests can assert that a view stays within its budget.
+"""
+import logging
+import threading
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from edx_django_utils.monitoring import set_custom_attribute
+from elasticsearch_dsl.connections import connections as es_connections
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+class RequestProfile:
+    """
+    Measurements of a single request.
+    """
+    def __init__(self):
+        self.view_name = None
+        self.query_budget = None
+        self.query_count = 0
+        self.db_time = 0.0
+        self.es_count = 0
+        self.es_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.view_time = 0.0
+        self.render_time = 0.0
+        self.total_time = 0.0
+
+    @property
+    def over_budget(self):
+        return self.query_budget is not None and self.query_count > self.query_budget
+
+    def as_attributes(self):
+        return {
+            'query_count': self.query_count,
+            'query_budget': self.query_budget,
+            'db_time_ms': round(self.db_time * 1000, 2),
+            'es_count': self.es_count,
+            'es_time_ms': round(self.es_time * 1000, 2),
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'view_time_ms': round(self.view_time * 1000, 2),
+            'render_time_ms': round(self.render_time * 1000, 2),
+            'total_time_ms': round(self.total_time * 1000, 2),
+        }
+
+    def as_headers(self):
+        server_timing = ', '.join(
+            f'{name};dur={duration * 1000:.2f}'
+            for name, duration in (
+                ('db', self.db_time), ('es', self.es_time), ('view', self.view_time),
+                ('render', self.render_time), ('total', self.total_time),
+            )
+        )
+        headers = {
+            'Server-Timing': server_timing,
+            'X-Query-Count': str(self.query_count),
+            'X-ES-Request-Count': str(self.es_count),
+            'X-Cache-Hits': str(self.cache_hits),
+            'X-Cache-Misses': str(self.cache_misses),
+        }
+        if self.query_budget is not None:
+            headers['X-Query-Budget'] = str(self.query_budget)
+        return headers
+
+
+def get_current_profile():
+    """
+    Returns the profile of the request being served by the current thread, if any.
+    """
+    return getattr(_local, 'profile', None)
+
+
+def record_cache_outcome(hit):
+    """
+    Counts a cache hit or miss in the profile of the current request.
+    """
+    profile = get_current_profile()
+    if profile is not None:
+        if hit:
+            profile.cache_hits += 1
+        else:
+            profile.cache_misses += 1
+
+
+def _profile_queries(execute, sql, params, many, context):
+    profile = get_current_profile()
+    if profile is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.query_count += 1
+        profile.db_time += time.perf_counter() - start
+
+
+def _profile_es_requests(transport):
+    """
+    Wraps the requests made by the given Elasticsearch transport to time them.
+    """
+    if getattr(transport, '_request_profiling', False):
+        return
+
+    perform_request = transport.perform_request
+
+    def profiled_perform_request(*args, **kwargs):
+        profile = get_current_profile()
+        if profile is None:
+            return perform_request(*args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return perform_request(*args, **kwargs)
+        finally:
+            profile.es_count += 1
+            profile.es_time += time.perf_counter() - start
+
+    transport.perform_request = profiled_perform_request
+    transport._request_profiling = True  # pylint: disable=protected-access
+
+
+def get_view_class(view_func):
+    # DRF sets `cls` on the functions returned by `as_view`, and Django sets `view_class`.
+    return getattr(view_func, 'cls', None) or getattr(view_func, 'view_class', None)
+
+
+def get_query_budget(view_func, request):
+    """
+    Returns the query budget declared by the view for the action handling the request, if any.
+    """
+    budgets = getattr(get_view_class(view_func), 'query_budgets', None)
+    if not budgets:
+        return None
+
+    method = request.method.lower()
+    # Viewsets map methods to actions, e.g. `get` to either `list` or `retrieve`.
+    action = (getattr(view_func, 'actions', None) or {}).get(method, method)
+    return budgets.get(action)
+
+
+class RequestProfilingMiddleware:
+    """
+    Profiles the SQL queries, Elasticsearch requests, cache lookups and rendering of each request.
+    """
+    def __init__(self, get_response):
+        if not settings.REQUEST_PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        _profile_es_requests(es_connections.get_connection().transport)
+
+    def __call__(self, request):
+        profile = RequestProfile()
+        _local.profile = profile
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(_profile_queries))
+                response = self.get_response(request)
+        finally:
+            _local.profile = None
+
+        profile.total_time = time.perf_counter() - start
+        self.report(request, response, profile)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):  # pylint: disable=unused-argument
+        profile = get_current_profile()
+        if profile is None:
+            return None
+
+        view_class = get_view_class(view_func)
+        profile.view_name = view_class.__name__ if view_class else getattr(view_func, '__qualname__', str(view_func))
+        profile.query_budget = get_query_budget(view_func, request)
+
+        # The view is timed from here until its response reaches the middleware, or until it is rendered.
+        request._profile_view_start = time.perf_counter()  # pylint: disable=protected-access
+        return None
+
+    def process_template_response(self, request, response):
+        profile = get_current_profile()
+        view_start = getattr(request, '_profile_view_start', None)
+        if profile is None or view_start is None:
+            return response
+
+        render_start = time.perf_counter()
+        profile.view_time = render_start - view_start
+
+        def record_render_time(_response):
+            profile.render_time = time.perf_counter() - render_start
+
+        response.add_post_render_callback(record_render_time)
+        return response
+
+    def report(self, request, response, profile):
+        view_start = getattr(request, '_profile_view_start', None)
+        if view_start is not None and not profile.view_time:
+            # Responses that are not rendered, e.g. those served from the cache.
+            profile.view_time = time.perf_counter() - view_start
+
+        response.request_profile = profile
+        for name, value in profile.as_attributes().items():
+            if value is not None:
+                set_custom_attribute(f'request_profile.{name}', value)
+
+        if profile.over_budget:
+            logger.warning(
+                '[%s] made %d queries, exceeding its budget of %d: %s',
+                profile.view_name, profile.query_count, profile.query_budget, profile.as_attributes(),
+            )
+
+        if settings.DEBUG:
+            for header, value in profile.as_headers().items():
+                response[header] = value
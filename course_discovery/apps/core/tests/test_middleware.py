@@ -0,0 +1,64 @@
+from unittest import mock
+
+import pytest
+from django.core.exceptions import MiddlewareNotUsed
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from course_discovery.apps.api.tests.mixins import SiteMixin
+from course_discovery.apps.api.v1.views.courses import CourseViewSet
+from course_discovery.apps.core.middleware import RequestProfilingMiddleware
+from course_discovery.apps.core.tests.factories import USER_PASSWORD, UserFactory
+from course_discovery.apps.course_metadata.tests.factories import CourseFactory
+
+
+class RequestProfilingMiddlewareTests(SiteMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = UserFactory(is_staff=True)
+        self.client.login(username=self.user.username, password=USER_PASSWORD)
+        self.course = CourseFactory(partner=self.partner)
+        self.url = reverse('api:v1:course-detail', kwargs={'key': self.course.key})
+
+    @override_settings(USE_API_CACHING=True)
+    def test_profile(self):
+        """ Verify the queries, cache lookups and declared query budget of the view are profiled. """
+        response = self.client.get(self.url)
+        assert response.status_code == 200
+
+        profile = response.request_profile
+        assert profile.view_name == 'CourseViewSet'
+        assert profile.query_budget == CourseViewSet.query_budgets['retrieve']
+        assert profile.query_count > 0
+        assert profile.db_time > 0
+        assert (profile.cache_hits, profile.cache_misses) == (0, 1)
+        assert profile.render_time > 0
+
+        profile = self.client.get(self.url).request_profile
+        assert (profile.cache_hits, profile.cache_misses) == (1, 0)
+
+    def test_headers_in_debug_mode(self):
+        """ Verify the profile is only exposed as response headers when DEBUG is enabled. """
+        response = self.client.get(self.url)
+        assert 'X-Query-Count' not in response
+
+        with override_settings(DEBUG=True):
+            response = self.client.get(self.url)
+        assert response['X-Query-Count'] == str(response.request_profile.query_count)
+        assert response['X-Query-Budget'] == str(CourseViewSet.query_budgets['retrieve'])
+        assert 'db;dur=' in response['Server-Timing']
+
+    def test_over_budget(self):
+        """ Verify requests exceeding the query budget of their view are logged. """
+        with mock.patch.object(CourseViewSet, 'query_budgets', {'retrieve': 1}):
+            with mock.patch('course_discovery.apps.core.middleware.logger') as mock_logger:
+                response = self.client.get(self.url)
+
+        assert response.request_profile.over_budget
+        mock_logger.warning.assert_called_once()
+
+    @override_settings(REQUEST_PROFILING_ENABLED=False)
+    def test_disabled(self):
+        with pytest.raises(MiddlewareNotUsed):
+            RequestProfilingMiddleware(get_response=mock.Mock())
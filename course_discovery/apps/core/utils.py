@@ -22,6 +22,9 @@ INDEX_ALIAS_SLICE = slice(0, -16)
 # >>> 'course_run_20200826_122240'[INDEX_ALIAS_SLICE]
 # >>> 'course_run'
 
+# Key of the index mapping `_meta` entry holding the time up to which the index reflects the database.
+HIGH_WATER_MARK_META_KEY = 'indexed_until'
+
 
 def serialize_datetime(d):
     return d.strftime('%Y-%m-%dT%H:%M:%SZ') if d else None
@@ -119,6 +122,43 @@ class ElasticsearchUtils:
         es_connection.cluster.health(index=index, wait_for_status='yellow', request_timeout=1)
         logger.info('...index refreshed.')
 
+    @classmethod
+    def get_high_water_mark(cls, es_connection, index):
+        """
+        Returns the time up to which the index is known to reflect the database.
+
+        The value is kept in the `_meta` section of the index mapping, so that it is discarded
+        together with the index whenever a full rebuild points the alias at a new one.
+
+        Args:
+            es_connection (Elasticsearch): Elasticsearch connection.
+            index (str): Name of the index or alias.
+
+        Returns:
+            datetime.datetime: The stored high-water mark, or None if the index has never recorded one.
+        """
+        mappings = es_connection.indices.get_mapping(index=index)
+        for index_mapping in mappings.values():
+            value = index_mapping.get('mappings', {}).get('_meta', {}).get(HIGH_WATER_MARK_META_KEY)
+            if value:
+                return datetime.datetime.fromisoformat(value)
+        return None
+
+    @classmethod
+    def set_high_water_mark(cls, es_connection, index, timestamp):
+        """
+        Records the time up to which the index is known to reflect the database.
+
+        Args:
+            es_connection (Elasticsearch): Elasticsearch connection.
+            index (str): Name of the index or alias.
+            timestamp (datetime.datetime): Timezone-aware time to record.
+        """
+        logger.info('Setting high-water mark of index [%s] to [%s]...', index, timestamp.isoformat())
+        es_connection.indices.put_mapping(
+            index=index, body={'_meta': {HIGH_WATER_MARK_META_KEY: timestamp.isoformat()}}
+        )
+
 
 def get_all_related_field_names(model):
     """
@@ -119,7 +119,8 @@ def get_course_availability(course):
         else:
             availability.add(_('Archived'))
 
-    return list(availability)
+    # Sets are sorted, so that records, and their content hashes, do not change along with the iteration order.
+    return sorted(availability)
 
 # Proxies Program model in order to trick Algolia into thinking this is a single model so it doesn't error.
 # No model-specific attributes or methods are actually used.
@@ -374,7 +375,7 @@ class AlgoliaProxyCourse(Course, AlgoliaBasicModelFieldsMixin):
     def staff_slugs(self):
         staff = [course_run.staff.all() for course_run in self.active_course_runs]
         staff = itertools.chain.from_iterable(staff)
-        return list({person.slug for person in staff})
+        return sorted({person.slug for person in staff})
 
     @property
     def promoted_in_spanish_index(self):
@@ -385,7 +386,7 @@ class AlgoliaProxyCourse(Course, AlgoliaBasicModelFieldsMixin):
 
     @property
     def tags(self):
-        return list(self.topics.names())
+        return sorted(self.topics.names())
 
     @property
     def product_allowed_in(self):
@@ -624,7 +625,7 @@ class AlgoliaProxyProgram(Program, AlgoliaBasicModelFieldsMixin):
     def tags(self):
         topics = [topic.name for topic in self.topics]
         labels = [label.name for label in self.labels.all()]
-        return list(set(topics + labels))
+        return sorted(set(topics + labels))
 
     @property
     def product_allowed_in(self):
@@ -677,7 +678,7 @@ class AlgoliaProxyProgram(Program, AlgoliaBasicModelFieldsMixin):
         if self.subscription_eligible:
             availability.add(_('Available by subscription'))
 
-        return list(availability)
+        return sorted(availability)
 
     @property
     def promoted_in_spanish_index(self):
@@ -1,6 +1,7 @@
 """
 Contains all utility functions for Contentful.
 """
+import concurrent.futures
 import logging
 
 from contentful import Client
@@ -9,74 +10,132 @@ from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
+CONTENTFUL_FETCH_WORKERS = 4
+CONTENTFUL_SYNC_TOKEN_CACHE_KEY = 'contentful_sync_token'
+
 
 def get_contentful_cache_key(content_type):
     """
-    Cache key for either bootcamp or degree data from Contentful.
+    Cache key for the snapshot of either bootcamp or degree data from Contentful.
     """
     if content_type == settings.BOOTCAMP_CONTENTFUL_CONTENT_TYPE:
-        return 'contentful_bootcamp_data_key'
+        return 'contentful_bootcamp_snapshot_key'
     elif content_type == settings.DEGREE_CONTENTFUL_CONTENT_TYPE:
-        return 'contentful_degree_data_key'
+        return 'contentful_degree_snapshot_key'
     else:
         return None
 
 
+def get_contentful_client():
+    return Client(
+        settings.CONTENTFUL_SPACE_ID,
+        settings.CONTENTFUL_CONTENT_DELIVERY_API_KEY,
+        environment=settings.CONTENTFUL_ENVIRONMENT,
+        timeout_s=30  # increases read timeout
+    )
+
+
 def get_data_from_contentful(content_type):
     """
     Utility function to get data from Contentful. Returns contentful entries of the content_type.
     Since fetching all objects results in a large amount of data, it gives us `Response size too big` error.
-    We're fetching 10 objects per Contentful Client call and returning an appended response.
+    We're fetching 10 objects per Contentful Client call and returning an appended response. The calls
+    following the first one are made concurrently, by up to `CONTENTFUL_FETCH_WORKERS` threads.
 
     Args:
         content_type (str): Contentful table-like instance comprised of fields.
     """
-
-    cache_key = get_contentful_cache_key(content_type)
-    cached_entries = cache.get(cache_key)
-    if cached_entries:
-        logger.info(f"Using cached Contentful entries data and skipping API call for {content_type}")
-        return cached_entries
-
-    client = Client(
-        settings.CONTENTFUL_SPACE_ID,
-        settings.CONTENTFUL_CONTENT_DELIVERY_API_KEY,
-        environment=settings.CONTENTFUL_ENVIRONMENT,
-        timeout_s=30  # increases read timeout
-    )
+    client = get_contentful_client()
     limit = 10
-    skip = 10
     include = 5  # the depth of linked entries to be fetched from contentful
-    total_entries = []
+
+    def fetch_entries(skip):
+        return client.entries({
+            'content_type': content_type,
+            'limit': limit,
+            'skip': skip,
+            'include': include
+        })
+
     contentful_entries = client.entries({
         'content_type': content_type,
         'limit': limit,
         'include': include
     })
-    total_entries.extend(contentful_entries.items)
+    total_entries = list(contentful_entries.items)
     total_count = contentful_entries.total
     logger.info(f'Fetching a total of {total_count} Contentful Entries for Content Type [{content_type}]')
-    logger.info(f'Successfully fetched Contentful Entries from 1 to {skip}')
+    logger.info(f'Successfully fetched Contentful Entries from 1 to {limit}')
 
-    while skip < total_count:
-        contentful_entries = client.entries({
-            'content_type': content_type,
-            'limit': limit,
-            'skip': skip,
-            'include': include
-        })
-        if contentful_entries:
+    skips = range(limit, total_count, limit)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=CONTENTFUL_FETCH_WORKERS) as executor:
+        for skip, contentful_entries in zip(skips, executor.map(fetch_entries, skips)):
             total_entries.extend(contentful_entries.items)
             logger.info(f'Successfully fetched Contentful Entries from {skip + 1} to '
                         f'{skip + limit if skip + limit < total_count else total_count}')
-            skip += limit
-
-    # cache contentful API response for one day
-    cache.set(cache_key, total_entries, timeout=60 * 60 * 24)
 
     return total_entries
 
 
+def get_contentful_snapshot(content_type):
+    """
+    Returns the transformed data of the content type's Contentful entries, by product UUID.
+
+    The transformed data is kept in the cache without expiring, and refreshed by `sync_contentful_data`.
+    It is only fetched from Contentful if it is not cached yet.
+    """
+    snapshot = cache.get(get_contentful_cache_key(content_type))
+    if snapshot is not None:
+        logger.info(f"Using cached Contentful entries data and skipping API call for {content_type}")
+        return snapshot
+    return refresh_contentful_snapshot(content_type)
+
+
+def refresh_contentful_snapshot(content_type):
+    """
+    Fetches the content type's Contentful entries, and caches their transformed data.
+    """
+    if content_type == settings.BOOTCAMP_CONTENTFUL_CONTENT_TYPE:
+        transform = transform_bootcamp_contentful_data
+    else:
+        transform = transform_degree_contentful_data
+
+    snapshot = transform(get_data_from_contentful(content_type))
+    cache.set(get_contentful_cache_key(content_type), snapshot, timeout=None)
+    return snapshot
+
+
+def sync_contentful_data():
+    """
+    Refreshes the cached bootcamp and degree data if any Contentful entry changed since the last sync.
+
+    Changes are found with the Contentful sync API, from the sync token stored by the previous sync.
+    Entries of any content type are synced, as pages include the entries they link to, such as their modules.
+
+    Returns:
+        bool: Whether the cached data was refreshed.
+    """
+    client = get_contentful_client()
+    sync_token = cache.get(CONTENTFUL_SYNC_TOKEN_CACHE_KEY)
+    sync_page = client.sync({'sync_token': sync_token} if sync_token else {'initial': True})
+    changed = not sync_token or bool(sync_page.items)
+    while sync_page.next_page_url:
+        sync_page = sync_page.next(client)
+        changed = changed or bool(sync_page.items)
+
+    content_types = (settings.BOOTCAMP_CONTENTFUL_CONTENT_TYPE, settings.DEGREE_CONTENTFUL_CONTENT_TYPE)
+    refresh = changed or any(
+        cache.get(get_contentful_cache_key(content_type)) is None for content_type in content_types
+    )
+    if refresh:
+        for content_type in content_types:
+            refresh_contentful_snapshot(content_type)
+
+    cache.set(CONTENTFUL_SYNC_TOKEN_CACHE_KEY, sync_page.next_sync_token, timeout=None)
+    logger.info(f'Synced Contentful data, {"refreshing" if refresh else "keeping"} the cached data.')
+    return refresh
+
+
 def extract_plain_text_from_rich_text(rich_text_dict):
     """
     Recursive function to extract a list of values of all the keys containing plain text.
@@ -286,13 +345,19 @@ def get_placement_about_section_module(placement_about_section_module):
 
 
 def fetch_and_transform_bootcamp_contentful_data():
+    """
+    Returns bootcamp data from contentful in algolia-usable form, by product UUID.
+    """
+    return get_contentful_snapshot(settings.BOOTCAMP_CONTENTFUL_CONTENT_TYPE)
+
+
+def transform_bootcamp_contentful_data(contentful_bootcamp_page_entries):
     """
     Transforms incoming bootcamp data from contentful to algolia-usable form.
 
     Each Contentful entry has seo, hero and modules list.
     Each rich text content field has been transformed into plain text using `rich_text_to_plain_text`.
     """
-    contentful_bootcamp_page_entries = get_data_from_contentful(settings.BOOTCAMP_CONTENTFUL_CONTENT_TYPE)
     transformed_bootcamp_data = {}
     for bootcamp_entry in contentful_bootcamp_page_entries:
         product_uuid = bootcamp_entry.uuid
@@ -390,14 +455,18 @@ def aggregate_contentful_data(data, product_uuid):
 
 
 def fetch_and_transform_degree_contentful_data():
+    """
+    Returns degree data from contentful in algolia-usable form, by product UUID.
+    """
+    return get_contentful_snapshot(settings.DEGREE_CONTENTFUL_CONTENT_TYPE)
+
+
+def transform_degree_contentful_data(contentful_degree_page_entries):
     """
     Transforms incoming degree data from contentful to algolia-usable form.
 
     Each Contentful entry has seo, hero and modules list.
     """
-
-    contentful_degree_page_entries = get_data_from_contentful(settings.DEGREE_CONTENTFUL_CONTENT_TYPE)
-
     transformed_degree_data = {}
 
     for degree_entry in contentful_degree_page_entries:
@@ -1,9 +1,13 @@
 import abc
+import logging
 
 from dateutil.parser import parse
 from edx_rest_framework_extensions.auth.jwt.decoder import configured_jwt_decode_handler
 
-from course_discovery.apps.course_metadata.models import Course, Image, Video
+from course_discovery.apps.course_metadata.data_loaders.rate_limiting import RateLimitedPageFetcher, RateLimiter
+from course_discovery.apps.course_metadata.models import Course, DataLoaderCheckpoint, Image, Video
+
+logger = logging.getLogger(__name__)
 
 
 class AbstractDataLoader(metaclass=abc.ABCMeta):
@@ -13,12 +17,16 @@ class AbstractDataLoader(metaclass=abc.ABCMeta):
         api_url (str): URL of the API from which data is loaded
         partner (Partner): Partner which owns the data for this data loader
         PAGE_SIZE (int): Number of items to load per API call
+        RATE_LIMIT (float): Maximum number of API calls per second, or None if the API does not limit them
+        resume (bool): True if the loader continues from the pages processed by its previous run
     """
 
     LOADER_MAX_RETRY = 3
     PAGE_SIZE = 50
+    RATE_LIMIT = None
 
-    def __init__(self, partner, api_url=None, max_workers=None, is_threadsafe=False, enable_api=True, **kwargs):
+    def __init__(self, partner, api_url=None, max_workers=None, is_threadsafe=False, enable_api=True, resume=False,
+                 **kwargs):
         """
         Arguments:
             partner (Partner): Partner which owns the APIs and data being loaded
@@ -27,6 +35,7 @@ class AbstractDataLoader(metaclass=abc.ABCMeta):
             is_threadsafe (bool): True if multiple threads can be used to write data.
             enable_api (bool): True if we want to use the api functionalities and clients with the dataloader.
                 This will most likely only be turned off for event bus use cases.
+            resume (bool): True if pages already processed by a previous run of the loader should be skipped.
         """
 
         self.partner = partner
@@ -38,11 +47,70 @@ class AbstractDataLoader(metaclass=abc.ABCMeta):
 
         self.max_workers = max_workers
         self.is_threadsafe = is_threadsafe
+        self.rate_limiter = RateLimiter(self.RATE_LIMIT)
+        self.resume = resume
+        self.checkpoint = None
+        self.processed_pages = set()
 
     @abc.abstractmethod
     def ingest(self):  # pragma: no cover
         """ Load data for all supported objects (e.g. courses, runs). """
 
+    def get_page_fetcher(self, request_page, **kwargs):
+        """
+        Returns a RateLimitedPageFetcher requesting pages with the loader's workers, within the rate limit of its API.
+        """
+        return RateLimitedPageFetcher(request_page, self.rate_limiter, max_workers=self.max_workers, **kwargs)
+
+    def start_checkpoint(self):
+        """
+        Loads the checkpoint of the loader for its partner, starting it over unless the loader resumes.
+
+        Returns:
+            DataLoaderCheckpoint
+        """
+        self.checkpoint, __ = DataLoaderCheckpoint.objects.get_or_create(
+            partner=self.partner, loader=self.__class__.__name__
+        )
+        if not self.resume and (self.checkpoint.last_page or self.checkpoint.completed):
+            self.checkpoint.last_page = 0
+            self.checkpoint.completed = False
+            self.checkpoint.save()
+        elif self.checkpoint.last_page:
+            logger.info('Resuming %s after page %d.', self.__class__.__name__, self.checkpoint.last_page)
+        return self.checkpoint
+
+    def is_page_processed(self, page):
+        return self.checkpoint is not None and page <= self.checkpoint.last_page
+
+    def checkpoint_page(self, page):
+        """
+        Records the given page as processed.
+
+        Pages may be processed in any order, so the checkpoint only advances over the pages processed
+        without a gap since the first one.
+        """
+        if self.checkpoint is None:
+            return
+
+        self.processed_pages.add(page)
+        last_page = self.checkpoint.last_page
+        while last_page + 1 in self.processed_pages:
+            last_page += 1
+            self.processed_pages.remove(last_page)
+
+        if last_page != self.checkpoint.last_page:
+            self.checkpoint.last_page = last_page
+            self.checkpoint.save(update_fields=['last_page', 'modified'])
+
+    def complete_checkpoint(self):
+        """
+        Records that the loader has completed, so that resumed runs skip it.
+        """
+        DataLoaderCheckpoint.objects.update_or_create(
+            partner=self.partner, loader=self.__class__.__name__, defaults={'completed': True}
+        )
+
     def get_username_from_client(self, client):
         token = client.get_jwt_access_token()
         decoded_jwt = configured_jwt_decode_handler(token)
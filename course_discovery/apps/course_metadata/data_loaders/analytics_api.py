@@ -3,9 +3,11 @@ import logging
 
 import pytz
 from analyticsclient.client import Client
+from django.conf import settings
+from django.db.models import F
 
 from course_discovery.apps.course_metadata.data_loaders import AbstractDataLoader
-from course_discovery.apps.course_metadata.models import CourseRun
+from course_discovery.apps.course_metadata.models import Course, CourseRun, Program
 
 logger = logging.getLogger(__name__)
 
@@ -13,13 +15,18 @@ logger = logging.getLogger(__name__)
 class AnalyticsAPIDataLoader(AbstractDataLoader):
 
     API_TIMEOUT = 120  # time in seconds
+    BULK_UPDATE_BATCH_SIZE = 1000
 
-    def __init__(self, partner, api_url, max_workers=None, is_threadsafe=False):
-        super().__init__(partner, api_url, max_workers, is_threadsafe)
+    def __init__(self, partner, api_url, max_workers=None, is_threadsafe=False, resume=False):
+        super().__init__(partner, api_url, max_workers, is_threadsafe, resume=resume)
 
-        # uuid: {course, count, recent_count}
+        # id: (count, recent_count)
+        self.course_run_dictionary = {}
+        # id: (count, recent_count)
         self.course_dictionary = {}
-        # uuid: {program, count, recent_count}
+        # id: draft version id
+        self.course_draft_versions = {}
+        # id: (count, recent_count)
         self.program_dictionary = {}
 
         if not (self.partner.analytics_url and self.partner.analytics_token):
@@ -45,70 +52,73 @@ class AnalyticsAPIDataLoader(AbstractDataLoader):
                                                                                   'count',
                                                                                   'recent_count_change'])
 
+        course_runs_by_key = self._get_course_runs_by_key()
         for course_run_summary in course_run_summaries:
-            self._process_course_run_summary(course_run_summary=course_run_summary)
-
-        for course_dict in self.course_dictionary.values():
-            self._process_course_enrollment_count(course_dict['course'],
-                                                  course_dict['count'],
-                                                  course_dict['recent_count'])
-
-        for program_dict in self.program_dictionary.values():
-            # Update program count
-            program = program_dict['program']
-            program.enrollment_count = program_dict['count']
-            program.recent_enrollment_count = program_dict['recent_count']
-            program.save(update_fields=['enrollment_count', 'recent_enrollment_count'], suppress_publication=True)
-            logger.info('Updating program: %s', program.uuid)
-
-    def _process_course_run_summary(self, course_run_summary):
-        # Get course run object from course run key
+            self._process_course_run_summary(course_run_summary, course_runs_by_key)
+
+        for program_id, course_id in Program.courses.through.objects.values_list('program_id', 'course_id'):
+            if course_id in self.course_dictionary:
+                # Add course total to program total in dictionary
+                self._add_counts(self.program_dictionary, program_id, *self.course_dictionary[course_id])
+
+        self._update_enrollment_counts(CourseRun.everything, self.course_run_dictionary)
+        self._update_enrollment_counts(Course.everything, self._with_draft_versions(self.course_dictionary))
+        self._update_enrollment_counts(Program.objects, self.program_dictionary)
+
+    def _get_course_runs_by_key(self):
+        """
+        Returns:
+            dict: Ids of the official course runs, their courses and draft versions, by lowercased course run key.
+        """
+        course_runs = CourseRun.objects.annotate(
+            course_draft_version_id=F('course__draft_version_id')
+        ).values_list('id', 'key', 'draft_version_id', 'course_id', 'course_draft_version_id', named=True)
+        course_runs = course_runs.iterator(chunk_size=settings.ITERATOR_CHUNK_SIZE)
+        return {course_run.key.lower(): course_run for course_run in course_runs}
+
+    def _process_course_run_summary(self, course_run_summary, course_runs_by_key):
+        # Get course run ids from course run key
         course_run_key = course_run_summary['course_id']
         course_run_count = int(course_run_summary['count'])
         course_run_recent_count = int(course_run_summary['recent_count_change'])
-        try:
-            course_run = CourseRun.objects.get(key__iexact=course_run_key)
-        except CourseRun.DoesNotExist:
+        course_run = course_runs_by_key.get(course_run_key.lower())
+        if not course_run:
             logger.info('Course run: [%s] not found in DB.', course_run_key)
             return
 
-        course = course_run.course
-        # Update course run counts
-        course_run.enrollment_count = course_run_count
-        course_run.recent_enrollment_count = course_run_recent_count
-        course_run.save(update_fields=['enrollment_count', 'recent_enrollment_count'], suppress_publication=True)
-        draft_run = course_run.draft_version
-        if draft_run:
-            draft_run.enrollment_count = course_run_count
-            draft_run.recent_enrollment_count = course_run_recent_count
-            draft_run.save(update_fields=['enrollment_count', 'recent_enrollment_count'], suppress_publication=True)
+        # Update course run counts, of the draft version too
+        for course_run_id in (course_run.id, course_run.draft_version_id):
+            if course_run_id:
+                self.course_run_dictionary[course_run_id] = (course_run_count, course_run_recent_count)
 
         # Add course run total to course total in dictionary
-        if course.uuid in self.course_dictionary:
-            self.course_dictionary[course.uuid]['count'] += course_run_count
-            self.course_dictionary[course.uuid]['recent_count'] += course_run_recent_count
-        else:
-            self.course_dictionary[course.uuid] = {'course': course,
-                                                   'count': course_run_count,
-                                                   'recent_count': course_run_recent_count}
-
-    def _process_course_enrollment_count(self, course, count, recent_count):
-        # update course count
-        course.enrollment_count = count
-        course.recent_enrollment_count = recent_count
-        course.save(update_fields=['enrollment_count', 'recent_enrollment_count'])
-        draft_course = course.draft_version
-        if draft_course:
-            draft_course.enrollment_count = count
-            draft_course.recent_enrollment_count = recent_count
-            draft_course.save(update_fields=['enrollment_count', 'recent_enrollment_count'])
-        # Add course count to program dictionary for all programs
-        for program in course.programs.all():
-            # add course total to program total in dictionary
-            if program.uuid in self.program_dictionary:
-                self.program_dictionary[program.uuid]['count'] += count
-                self.program_dictionary[program.uuid]['recent_count'] += recent_count
-            else:
-                self.program_dictionary[program.uuid] = {'program': program,
-                                                         'count': count,
-                                                         'recent_count': recent_count}
+        self._add_counts(self.course_dictionary, course_run.course_id, course_run_count, course_run_recent_count)
+        if course_run.course_draft_version_id:
+            self.course_draft_versions[course_run.course_id] = course_run.course_draft_version_id
+
+    @staticmethod
+    def _add_counts(dictionary, key, count, recent_count):
+        total_count, total_recent_count = dictionary.get(key, (0, 0))
+        dictionary[key] = (total_count + count, total_recent_count + recent_count)
+
+    def _with_draft_versions(self, course_dictionary):
+        course_dictionary = dict(course_dictionary)
+        for course_id, draft_course_id in self.course_draft_versions.items():
+            course_dictionary[draft_course_id] = course_dictionary[course_id]
+        return course_dictionary
+
+    def _update_enrollment_counts(self, manager, dictionary):
+        """
+        Saves the counts of the given dictionary, of (count, recent count) by object id.
+
+        Only the counts are saved, with bulk updates. They skip the history and signals of the objects, which
+        would otherwise record every count change of every object, every time the loader runs.
+        """
+        objects = [
+            manager.model(id=object_id, enrollment_count=count, recent_enrollment_count=recent_count)
+            for object_id, (count, recent_count) in dictionary.items()
+        ]
+        manager.bulk_update(
+            objects, ['enrollment_count', 'recent_enrollment_count'], batch_size=self.BULK_UPDATE_BATCH_SIZE
+        )
+        logger.info('Updated enrollment counts of %d %s.', len(objects), manager.model._meta.verbose_name_plural)
@@ -2,17 +2,22 @@ import concurrent.futures
 import logging
 import math
 import threading
-import time
+from collections import defaultdict
 from decimal import Decimal
 from io import BytesIO
+from uuid import UUID
 
 import backoff
 import requests
 from django.conf import settings
 from django.core.files import File
 from django.core.management import CommandError
+from django.db import transaction
 from django.db.models import Q
+from django.db.models.signals import post_save
+from django.utils import timezone
 from opaque_keys.edx.keys import CourseKey
+from simple_history.utils import bulk_create_with_history, bulk_update_with_history
 
 from course_discovery.apps.core.models import Currency
 from course_discovery.apps.course_metadata.choices import CourseRunPacing, CourseRunStatus
@@ -22,7 +27,9 @@ from course_discovery.apps.course_metadata.models import (
     Course, CourseEntitlement, CourseRun, CourseRunType, CourseType, Organization, Program, ProgramType, Seat, SeatType,
     Source, Video
 )
-from course_discovery.apps.course_metadata.toggles import BYPASS_LMS_DATA_LOADER__END_DATE_UPDATED_CHECK
+from course_discovery.apps.course_metadata.toggles import (
+    BYPASS_LMS_DATA_LOADER__END_DATE_UPDATED_CHECK, COURSES_API_DATA_LOADER__BULK_WRITE
+)
 from course_discovery.apps.course_metadata.utils import push_to_ecommerce_for_course_run, subtract_deadline_delta
 
 logger = logging.getLogger(__name__)
@@ -45,14 +52,20 @@ class CoursesApiDataLoader(AbstractDataLoader):
     """ Loads course runs from the Courses API. """
 
     PAGE_SIZE = 50
+    # The courses endpoint has 40 requests/minute rate limit.
+    RATE_LIMIT = 40 / 60
+    # Fields whose updates trigger side effects of CourseRun.save, which bulk updates would skip. The pacing type
+    # of a run determines its enterprise subscription inclusion.
+    BULK_WRITE_EXCLUDED_FIELDS = {'end', 'pacing_type', 'status'}
 
-    def __init__(self, partner, api_url=None, max_workers=None, is_threadsafe=False, enable_api=True):
+    def __init__(self, partner, api_url=None, max_workers=None, is_threadsafe=False, enable_api=True, resume=False):
         super().__init__(
             partner=partner,
             api_url=api_url,
             max_workers=max_workers,
             is_threadsafe=is_threadsafe,
-            enable_api=enable_api
+            enable_api=enable_api,
+            resume=resume,
         )
         self.default_product_source, __ = Source.objects.get_or_create(
             name=settings.DEFAULT_PRODUCT_SOURCE_NAME,
@@ -62,36 +75,25 @@ class CoursesApiDataLoader(AbstractDataLoader):
     def ingest(self):
         logger.info('Refreshing Courses and CourseRuns from %s...', self.partner.courses_api_url)
 
+        self.start_checkpoint()
         initial_page = 1
         response = self._make_request(initial_page)
         count = response['pagination']['count']
         pages = response['pagination']['num_pages']
-        self._process_response(response)
-
-        pagerange = range(initial_page + 1, pages + 1)
-        logger.info('Looping to request all %d pages...', pages)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:  # pragma: no cover
-            if self.is_threadsafe:
-                for page in pagerange:
-                    # This time.sleep is to make it very likely that this method does not encounter a 429 status
-                    # code by increasing the amount of time between each code. More details at LEARNER-5560
-                    # The current crude estimation is for ~3000 courses with a PAGE_SIZE=50 which means this method
-                    # will take ~30 minutes.
-                    # TODO Ticket to gracefully handle 429 https://openedx.atlassian.net/browse/LEARNER-5565
-                    time.sleep(30)
-                    executor.submit(self._load_data, page)
-            else:
-                for future in [executor.submit(self._make_request, page) for page in pagerange]:
-                    response = future.result()
-                    self._process_response(response)
+        if not self.is_page_processed(initial_page):
+            self._process_response(response)
+            self.checkpoint_page(initial_page)
 
-        logger.info('Retrieved %d course runs from %s.', count, self.partner.courses_api_url)
+        pagerange = [page for page in range(initial_page + 1, pages + 1) if not self.is_page_processed(page)]
+        logger.info('Looping to request %d of %d pages...', len(pagerange), pages)
+
+        # Pages are requested at the rate allowed by the API, while the ones already received are processed.
+        fetcher = self.get_page_fetcher(self._request_page, giveup=_fatal_code)
+        for page, response in fetcher.fetch_all(pagerange):
+            self._process_response(response)
+            self.checkpoint_page(page)
 
-    def _load_data(self, page):  # pragma: no cover
-        """Make a request for the given page and process the response."""
-        response = self._make_request(page)
-        self._process_response(response)
+        logger.info('Retrieved %d course runs from %s.', count, self.partner.courses_api_url)
 
     # The courses endpoint has 40 requests/minute rate limit.
     # This will back off at a rate of 60/120/240 seconds (from the factor 60 and default value of base 2).
@@ -106,19 +108,136 @@ class CoursesApiDataLoader(AbstractDataLoader):
         giveup=_fatal_code,
     )
     def _make_request(self, page):
-        logger.info('Requesting course run page %d...', page)
-        params = {'page': page, 'page_size': self.PAGE_SIZE, 'username': self.username, 'active_only': True}
-        response = self.api_client.get(self.api_url + '/courses/', params=params)
+        response = self._request_page(page)
         response.raise_for_status()
         return response.json()
 
+    def _request_page(self, page):
+        logger.info('Requesting course run page %d...', page)
+        params = {'page': page, 'page_size': self.PAGE_SIZE, 'username': self.username, 'active_only': True}
+        return self.api_client.get(self.api_url + '/courses/', params=params)
+
     def _process_response(self, response):
         results = response['results']
         logger.info('Retrieved %d course runs...', len(results))
 
+        if COURSES_API_DATA_LOADER__BULK_WRITE.is_enabled():
+            self.process_course_runs(results)
+            return
+
         for body in results:
             self.process_single_course_run(body)
 
+    def process_course_runs(self, bodies):
+        """
+        Processes a page of course runs with as few queries as possible.
+
+        The existing runs of the page, official and draft versions alike, are fetched with a single query.
+        Runs only needing updates of fields without side effects are then saved with a bulk update, and the
+        post_save signal is sent for them once it is committed. Every other run is processed on its own, as
+        its saves have side effects, like pushing upgrade deadlines to ecommerce or creating the run.
+        """
+        bodies = [self.clean_strings(body) for body in bodies]
+        runs_by_key = self.get_course_runs_by_key([body['id'] for body in bodies])
+        bypass_end_date_check = BYPASS_LMS_DATA_LOADER__END_DATE_UPDATED_CHECK.is_enabled()
+
+        updated_runs = []
+        updated_fields = set()
+        single_bodies = []
+        for body in bodies:
+            official_run, draft_run = runs_by_key.get(body['id'].lower(), (None, None))
+            if bypass_end_date_check or not (official_run or draft_run):
+                single_bodies.append(body)
+                continue
+
+            validated_data = self.format_course_run_data(body)
+            changes = [
+                (run, self._get_changed_fields(run, validated_data)) for run in (official_run, draft_run) if run
+            ]
+            fields = set().union(*(run_fields for __, run_fields in changes))
+            if fields & self.BULK_WRITE_EXCLUDED_FIELDS or self._has_course_changes(official_run, draft_run, body):
+                single_bodies.append(body)
+                continue
+
+            for run, run_fields in changes:
+                if run_fields:
+                    for field in run_fields:
+                        setattr(run, field, validated_data[field])
+                    updated_runs.append(run)
+            updated_fields |= fields
+
+        if updated_runs:
+            try:
+                self.bulk_update_course_runs(updated_runs, sorted(updated_fields))
+            except Exception:  # pylint: disable=broad-except
+                logger.exception('Failed to bulk update %d course runs, updating them one by one.', len(updated_runs))
+                updated_keys = {run.key.lower() for run in updated_runs}
+                single_bodies += [body for body in bodies if body['id'].lower() in updated_keys]
+
+        logger.info(
+            'Bulk updated %d course runs, processing %d course runs one by one...', len(updated_runs),
+            len(single_bodies)
+        )
+        for body in single_bodies:
+            self.process_single_course_run(body)
+
+    def get_course_runs_by_key(self, keys):
+        """
+        Returns:
+            dict: (official, draft) versions of the existing runs with the given keys, by lowercased key.
+        """
+        runs_by_key = defaultdict(lambda: [None, None])
+        for run in CourseRun.everything.filter(key__in=keys).select_related('canonical_for_course', 'video'):
+            runs_by_key[run.key.lower()][int(run.draft)] = run
+        return {key: tuple(runs) for key, runs in runs_by_key.items()}
+
+    def bulk_update_course_runs(self, runs, fields):
+        modified = timezone.now()
+        for run in runs:
+            run.modified = modified
+
+        fields = fields + ['modified']
+        draft_run_pks = [run.pk for run in runs if run.draft]
+        with transaction.atomic():
+            bulk_update_with_history(runs, CourseRun, fields, manager=CourseRun.everything)
+            if draft_run_pks:
+                # Bulk updates don't send the pre_save signal updating these timestamps.
+                now = timezone.now()
+                courses = Course.everything.filter(
+                    key__in=Course.everything.filter(course_runs__pk__in=draft_run_pks).values('key')
+                )
+                courses.update(data_modified_timestamp=now)
+                Program.objects.filter(courses__in=courses).update(data_modified_timestamp=now)
+            transaction.on_commit(lambda: self._send_post_save(runs, fields))
+
+    def _send_post_save(self, runs, fields):
+        for run in runs:
+            # The history of the runs was already saved along with them.
+            run.skip_history_when_saving = True
+            try:
+                post_save.send(
+                    sender=CourseRun, instance=run, created=False, update_fields=frozenset(fields), raw=False,
+                    using=run._state.db,  # pylint: disable=protected-access
+                )
+            finally:
+                del run.skip_history_when_saving
+            logger.info(f'Processed course run with UUID [{run.uuid}] and key [{run.key}].')
+
+    def _has_course_changes(self, official_run, draft_run, body):
+        if self.partner.uses_publisher:
+            return False
+
+        validated_data = self.format_course_data(body)
+        return any(
+            self._get_changed_fields(getattr(run, 'canonical_for_course', None), validated_data)
+            for run in (official_run, draft_run)
+        )
+
+    def _get_changed_fields(self, instance, validated_data):
+        if not instance:
+            return set()
+        return {attr for attr, value in validated_data.items() if getattr(instance, attr) != value}
+
     def process_single_course_run(self, body):
         course_run_id = body['id']
 
@@ -330,6 +449,115 @@ class CoursesApiDataLoader(AbstractDataLoader):
         return video
 
 
+class ProductBatch:
+    """
+    Seats or entitlements of a page of the E-Commerce API, saved with a few bulk queries.
+
+    Products are looked up among the products of their course run or course, which are prefetched along with the
+    page, and are created, updated or deleted in memory until the batch is saved. Draft products are saved first,
+    so that official products can then be saved along with the draft versions they are linked to.
+    """
+
+    def __init__(self, model, owner_field):
+        """
+        Arguments:
+            model (Model): Seat or CourseEntitlement.
+            owner_field (str): Name of the foreign key to the course run or course owning the products.
+        """
+        self.model = model
+        self.owner_field = owner_field
+        self.related_name = model._meta.get_field(owner_field).remote_field.related_name
+        self.products = {}
+        self.created = {True: [], False: []}
+        self.updated = {True: {}, False: {}}
+        self.updated_fields = {True: set(), False: set()}
+        self.deleted = []
+        self.draft_links = []
+        self.modified_course_keys = set()
+
+    def get_products(self, owner):
+        """
+        Returns the products of the given course run or course, including the ones created by the batch.
+        """
+        if owner.pk not in self.products:
+            self.products[owner.pk] = list(getattr(owner, self.related_name).all())
+        return self.products[owner.pk]
+
+    def upsert(self, owner, lookup, values, course_key):
+        """
+        Same as update_or_create() on the products of the given course run or course.
+
+        Arguments:
+            lookup (dict): Values of the fields identifying the product, by attribute name.
+            values (dict): Values of the fields to update, by attribute name.
+            course_key (str): Key of the course, whose data modified timestamp is updated if a draft product changes.
+        Returns:
+            tuple: The product, and whether it was created.
+        """
+        for product in self.get_products(owner):
+            if all(getattr(product, name) == value for name, value in lookup.items()):
+                changed = {name for name, value in values.items() if getattr(product, name) != value}
+                for name in changed:
+                    setattr(product, name, values[name])
+                if changed and product.pk:
+                    self.updated[product.draft][id(product)] = product
+                    self.updated_fields[product.draft] |= changed
+                    if product.draft:
+                        self.modified_course_keys.add(course_key)
+                return product, False
+
+        product = self.model(**{self.owner_field: owner}, draft=owner.draft, **lookup, **values)
+        self.get_products(owner).append(product)
+        self.created[product.draft].append(product)
+        return product, True
+
+    def link_draft(self, product, draft_product):
+        self.draft_links.append((product, draft_product))
+
+    def delete(self, owner, products):
+        owner_products = self.get_products(owner)
+        for product in products:
+            owner_products.remove(product)
+            if product.pk:
+                self.deleted.append(product.pk)
+
+    def save(self):
+        with transaction.atomic():
+            self._save_products(draft=True)
+            for product, draft_product in self.draft_links:
+                if product.draft_version_id != draft_product.pk:
+                    product.draft_version = draft_product
+                    if product.pk:
+                        self.updated[False][id(product)] = product
+                        self.updated_fields[False].add('draft_version')
+            self._save_products(draft=False)
+
+            if self.deleted:
+                self.model.everything.filter(pk__in=self.deleted).delete()
+
+            if self.modified_course_keys:
+                # Bulk updates don't send the pre_save signal updating these timestamps.
+                now = timezone.now()
+                courses = Course.everything.filter(key__in=self.modified_course_keys)
+                courses.update(data_modified_timestamp=now)
+                Program.objects.filter(courses__in=courses).update(data_modified_timestamp=now)
+
+    def _save_products(self, draft):
+        created = self.created[draft]
+        if created:
+            # Primary keys are not set on the created products by every database, but the returned products have them.
+            for product, created_product in zip(created, bulk_create_with_history(created, self.model)):
+                product.pk = created_product.pk
+
+        updated = list(self.updated[draft].values())
+        if updated:
+            modified = timezone.now()
+            for product in updated:
+                product.modified = modified
+            fields = sorted(self.updated_fields[draft]) + ['modified']
+            bulk_update_with_history(updated, self.model, fields, manager=self.model.everything)
+
+
 class EcommerceApiDataLoader(AbstractDataLoader):
     """ Loads course seats, entitlements, and enrollment codes from the E-Commerce API. """
 
@@ -350,6 +578,8 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         self.course_run_count = 0
         self.entitlement_count = 0
         self.enrollment_code_count = 0
+        self.currencies = {}
+        self.seat_types = {}
 
         # Thread locks to protect access to the counts
         self.course_run_count_lock = threading.Lock()
@@ -380,56 +610,27 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         self.course_run_count = 0
         self.entitlement_count = 0
         self.enrollment_code_count = 0
+        self._load_currencies_and_seat_types()
         self._process_course_runs(course_runs)
         self._process_entitlements(entitlements)
         self._process_enrollment_codes(enrollment_codes)
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:  # pragma: no cover
-            # Create pageranges to iterate over all existing pages for each product type
-            pageranges = {
-                'course_runs': self._pagerange(course_runs['count']),
-                'entitlements': self._pagerange(entitlements['count']),
-                'enrollment_codes': self._pagerange(enrollment_codes['count'])
-            }
-
-            if self.is_threadsafe:
-                for page in pageranges['course_runs']:
-                    executor.submit(self._request_course_runs, page).add_done_callback(
-                        lambda future: self._check_future_and_process(future, self._process_course_runs)
-                    )
-                for page in pageranges['entitlements']:
-                    executor.submit(self._request_entitlements, page).add_done_callback(
-                        lambda future: self._check_future_and_process(future, self.process_entitlements)
-                    )
-                for page in pageranges['enrollment_codes']:
-                    executor.submit(self._request_enrollment_codes, page).add_done_callback(
-                        lambda future: self._check_future_and_process(future, self.process_enrollment_codes)
-                    )
-            else:
-                # Process in batches and wait for the result from the futures
-                pagerange = pageranges['course_runs']
-                for future in concurrent.futures.as_completed(
-                    executor.submit(self._request_course_runs, page) for page in pagerange
-                ):
-                    self._check_future_and_process(
-                        future, self._process_course_runs,
-                    )
-
-                pagerange = pageranges['entitlements']
-                for future in concurrent.futures.as_completed(
-                    executor.submit(self._request_entitlements, page) for page in pagerange
-                ):
-                    self._check_future_and_process(
-                        future, self._process_entitlements,
-                    )
-
-                pagerange = pageranges['enrollment_codes']
-                for future in concurrent.futures.as_completed(
-                    executor.submit(self._request_enrollment_codes, page) for page in pagerange
-                ):
-                    self._check_future_and_process(
-                        future, self._process_enrollment_codes,
-                    )
+        # Pages of every product type are requested concurrently, while the ones already received are processed.
+        for request_page, pagerange, process_fn in (
+            (self._get_course_runs_page, self._pagerange(course_runs['count']), self._process_course_runs),
+            (self._get_entitlements_page, self._pagerange(entitlements['count']), self._process_entitlements),
+            (
+                self._get_enrollment_codes_page,
+                self._pagerange(enrollment_codes['count']),
+                self._process_enrollment_codes,
+            ),
+        ):
+            fetcher = self.get_page_fetcher(request_page, raise_errors=False)
+            for __, response in fetcher.fetch_all(pagerange):
+                process_fn(response)
+            if fetcher.failed_pages:
+                # Protect against deletes if pages could not be fetched
+                self.processing_failure_occurred = True
 
         logger.info('Expected %d course seats, %d course entitlements, and %d enrollment codes from %s.',
                     course_runs['count'], entitlements['count'],
@@ -462,6 +663,11 @@ class EcommerceApiDataLoader(AbstractDataLoader):
             logger.warning('There is a mismatch in the expected count of results and the actual results.')
             self.processing_failure_occurred = True
 
+    def _load_currencies_and_seat_types(self):
+        """ Loads the few currencies and seat types once, rather than for every product. """
+        self.currencies = {currency.code: currency for currency in Currency.objects.all()}
+        self.seat_types = {seat_type.slug: seat_type for seat_type in SeatType.objects.all()}
+
     def _pagerange(self, count):
         pages = int(math.ceil(count / self.PAGE_SIZE))
         return range(self.initial_page + 1, pages + 1)
@@ -472,8 +678,11 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         max_tries=5
     )
     def _request_course_runs(self, page):
+        return self._get_course_runs_page(page).json()
+
+    def _get_course_runs_page(self, page):
         params = {'page': page, 'page_size': self.PAGE_SIZE, 'include_products': True}
-        return self.api_client.get(self.api_url + '/courses/', params=params).json()
+        return self.api_client.get(self.api_url + '/courses/', params=params)
 
     @backoff.on_exception(
         backoff.expo,
@@ -481,8 +690,11 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         max_tries=5
     )
     def _request_entitlements(self, page):
+        return self._get_entitlements_page(page).json()
+
+    def _get_entitlements_page(self, page):
         params = {'page': page, 'page_size': self.PAGE_SIZE, 'product_class': 'Course Entitlement'}
-        return self.api_client.get(self.api_url + '/products/', params=params).json()
+        return self.api_client.get(self.api_url + '/products/', params=params)
 
     @backoff.on_exception(
         backoff.expo,
@@ -490,8 +702,11 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         max_tries=5
     )
     def _request_enrollment_codes(self, page):
+        return self._get_enrollment_codes_page(page).json()
+
+    def _get_enrollment_codes_page(self, page):
         params = {'page': page, 'page_size': self.PAGE_SIZE, 'product_class': 'Enrollment Code'}
-        return self.api_client.get(self.api_url + '/products/', params=params).json()
+        return self.api_client.get(self.api_url + '/products/', params=params)
 
     def _process_course_runs(self, response):
         results = response['results']
@@ -500,9 +715,13 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         self.course_run_count_lock.acquire()  # lint-amnesty, pylint: disable=consider-using-with
         self.course_run_count += len(results)
         self.course_run_count_lock.release()
-        for body in results:
-            body = self.clean_strings(body)
-            self.update_seats(body)
+
+        bodies = [self.clean_strings(body) for body in results]
+        course_runs = self.get_course_runs_by_key([body['id'] for body in bodies])
+        seats = ProductBatch(Seat, 'course_run')
+        for body in bodies:
+            self.update_seats(body, course_runs.get(body['id'].lower()), seats)
+        seats.save()
 
     def _process_entitlements(self, response):
         results = response['results']
@@ -512,9 +731,12 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         self.entitlement_count += len(results)
         self.entitlement_count_lock.release()
 
-        for body in results:
-            body = self.clean_strings(body)
-            self.entitlement_skus.append(self.update_entitlement(body))
+        bodies = [self.clean_strings(body) for body in results]
+        courses = self.get_courses_by_uuid([self.get_attributes(body, 'name').get('UUID') for body in bodies])
+        entitlements = ProductBatch(CourseEntitlement, 'course')
+        for body in bodies:
+            self.entitlement_skus.append(self.update_entitlement(body, courses, entitlements))
+        entitlements.save()
 
     def _process_enrollment_codes(self, response):
         results = response['results']
@@ -523,16 +745,58 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         self.enrollment_code_count += len(results)
         self.enrollment_code_lock.release()
 
-        for body in results:
-            body = self.clean_strings(body)
-            self.enrollment_skus.append(self.update_enrollment_code(body))
+        bodies = [self.clean_strings(body) for body in results]
+        course_runs = self.get_course_runs_by_key(
+            [key for key in (self.get_attributes(body, 'code').get('course_key') for body in bodies) if key]
+        )
+        seats = ProductBatch(Seat, 'course_run')
+        for body in bodies:
+            self.enrollment_skus.append(self.update_enrollment_code(body, course_runs, seats))
+        seats.save()
+
+    def get_course_runs_by_key(self, keys):
+        """
+        Returns:
+            dict: Official runs with the given keys, by lowercased key, loaded with their draft versions, their
+            types and their seats.
+        """
+        course_runs = CourseRun.objects.filter(key__in=keys).select_related(
+            'course', 'type', 'draft_version'
+        ).prefetch_related('type__tracks', 'seats', 'draft_version__seats')
+        return {course_run.key.lower(): course_run for course_run in course_runs}
+
+    def get_courses_by_uuid(self, uuids):
+        """
+        Returns:
+            dict: Official courses with the given UUIDs, by UUID, loaded with their draft versions, their types and
+            their entitlements.
+        """
+        uuids = [course_uuid for course_uuid in map(self.parse_uuid, uuids) if course_uuid]
+        courses = Course.objects.filter(uuid__in=uuids).select_related('type', 'draft_version').prefetch_related(
+            'type__entitlement_types', 'entitlements', 'draft_version__entitlements'
+        )
+        return {course.uuid: course for course in courses}
+
+    @staticmethod
+    def parse_uuid(value):
+        try:
+            return UUID(str(value))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def get_attributes(body, name_key):
+        return {attribute[name_key]: attribute['value'] for attribute in body['attribute_values']}
 
     def _delete_entitlements(self):
-        # The last two excludes ensure that we do not delete entitlements
-        # that have no official variants yet.
-        entitlements_to_delete = CourseEntitlement.everything.filter(
-            partner=self.partner
-        ).exclude(sku__in=self.entitlement_skus).exclude(sku__isnull=True).exclude(sku__exact='')
+        # Entitlements without skus are not deleted, as they do not have official variants yet.
+        entitlement_skus = set(self.entitlement_skus)
+        entitlements_to_delete = [
+            entitlement for entitlement in CourseEntitlement.everything.filter(
+                partner=self.partner
+            ).exclude(sku__isnull=True).exclude(sku__exact='').select_related('course', 'partner')
+            if entitlement.sku not in entitlement_skus
+        ]
 
         for entitlement in entitlements_to_delete:
             # pylint: disable=line-too-long
@@ -543,23 +807,13 @@ class EcommerceApiDataLoader(AbstractDataLoader):
                 draft_status='draft' if entitlement.draft else 'non-draft'
             )
             logger.info(msg)
-        entitlements_to_delete.delete()
+        if entitlements_to_delete:
+            pks = [entitlement.pk for entitlement in entitlements_to_delete]
+            CourseEntitlement.everything.filter(pk__in=pks).delete()
 
-    def _check_future_and_process(self, future, process_fn):
-        check_exception = future.exception()
-        if check_exception is None:
-            response = future.result()
-            process_fn(response)
-        else:
-            logger.exception(check_exception)
-            # Protect against deletes if exceptions occurred
-            self.processing_failure_occurred = True
-
-    def update_seats(self, body):
+    def update_seats(self, body, course_run, seats):
         course_run_key = body['id']
-        try:
-            course_run = CourseRun.objects.get(key__iexact=course_run_key)
-        except CourseRun.DoesNotExist:
+        if not course_run:
             logger.warning('Could not find course run [%s]', course_run_key)
             return
 
@@ -567,26 +821,28 @@ class EcommerceApiDataLoader(AbstractDataLoader):
             if product_body['structure'] != 'child':
                 continue
             product_body = self.clean_strings(product_body)
-            self.update_seat(course_run, product_body)
+            self.update_seat(course_run, product_body, seats)
 
         # Remove seats which no longer exist for that course run
         certificate_types = [self.get_certificate_type(product) for product in body['products']
                              if product['structure'] == 'child']
 
-        seats_to_remove = course_run.seats.exclude(type__slug__in=certificate_types)
-        if seats_to_remove.count() > 0:
+        seats_to_remove = [seat for seat in seats.get_products(course_run) if seat.type_id not in certificate_types]
+        if seats_to_remove:
             logger.info(
                 'Removing seats [%s] for course run with key [%s].',
-                ', '.join(s.type.slug for s in seats_to_remove),
+                ', '.join(seat.type_id for seat in seats_to_remove),
                 course_run_key,
             )
-        seats_to_remove.delete()
+        seats.delete(course_run, seats_to_remove)
 
         if course_run.draft_version:
-            draft_seats_to_remove = course_run.draft_version.seats.exclude(type__slug__in=certificate_types)
-            draft_seats_to_remove.delete()
+            draft_seats_to_remove = [
+                seat for seat in seats.get_products(course_run.draft_version) if seat.type_id not in certificate_types
+            ]
+            seats.delete(course_run.draft_version, draft_seats_to_remove)
 
-    def update_seat(self, course_run, product_body):
+    def update_seat(self, course_run, product_body, seats):
         stock_record = product_body['stockrecords'][0]
         currency_code = stock_record['price_currency']
         price = Decimal(stock_record.get('price_excl_tax') or stock_record.get('price'))
@@ -597,24 +853,24 @@ class EcommerceApiDataLoader(AbstractDataLoader):
             logger.warning("Skipping mobile seat with sku [%s]", sku)
             return
 
-        try:
-            currency = Currency.objects.get(code=currency_code)
-        except Currency.DoesNotExist:
+        currency = self.currencies.get(currency_code)
+        if not currency:
             logger.warning("Could not find currency [%s]", currency_code)
             return
 
-        attributes = {attribute['name']: attribute['value'] for attribute in product_body['attribute_values']}
+        attributes = self.get_attributes(product_body, 'name')
 
         certificate_type = attributes.get('certificate_type', Seat.AUDIT)
-        try:
-            seat_type = SeatType.objects.get(slug=certificate_type)
-        except SeatType.DoesNotExist:
+        seat_type = self.seat_types.get(certificate_type)
+        if not seat_type:
             msg = ('Could not find seat type {seat_type} while loading seat with sku {sku} for course run with key '
                    '{key}'.format(seat_type=certificate_type, sku=sku, key=course_run.key))
             logger.warning(msg)
             self.processing_failure_occurred = True
             return
-        if not course_run.type.empty and not course_run.type.tracks.filter(seat_type=seat_type).exists():
+        if not course_run.type.empty and not any(
+            track.seat_type_id == seat_type.id for track in course_run.type.tracks.all()
+        ):
             logger.warning(
                 'Seat type {seat_type} is not compatible with course run type {run_type} for course run {key}'.format(  # lint-amnesty, pylint: disable=logging-format-interpolation
                     seat_type=seat_type.slug, run_type=course_run.type.slug, key=course_run.key,
@@ -629,30 +885,23 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         if credit_hours:
             credit_hours = int(credit_hours)
 
-        defaults = {
+        lookup = {
+            'type_id': seat_type.slug,
+            'credit_provider': credit_provider,
+            'currency_id': currency.code,
+        }
+        values = {
             'price': price,
             'sku': sku,
-            'upgrade_deadline': self.parse_date(product_body.get('expires')),
+            '_upgrade_deadline': self.parse_date(product_body.get('expires')),
             'credit_hours': credit_hours,
         }
 
-        seat, created = course_run.seats.update_or_create(
-            type=seat_type,
-            credit_provider=credit_provider,
-            currency=currency,
-            defaults=defaults
-        )
+        seat, created = seats.upsert(course_run, lookup, values, course_run.course.key)
 
         if course_run.draft_version:
-            draft_seat, _ = course_run.draft_version.seats.update_or_create(
-                draft=True,
-                type=seat_type,
-                credit_provider=credit_provider,
-                currency=currency,
-                defaults=defaults
-            )
-            seat.draft_version = draft_seat
-            seat.save()
+            draft_seat, __ = seats.upsert(course_run.draft_version, lookup, values, course_run.course.key)
+            seats.link_draft(seat, draft_seat)
 
         if created:
             logger.info('Created seat for course with key [%s] and sku [%s].', course_run.key, sku)
@@ -709,9 +958,7 @@ class EcommerceApiDataLoader(AbstractDataLoader):
             logger.warning(msg)
             return None
 
-        try:
-            Currency.objects.get(code=currency_code)
-        except Currency.DoesNotExist:
+        if currency_code not in self.currencies:
             msg = 'Could not find currency {code} while loading {product} {title} with sku {sku}'.format(
                 product=product_class['value'], code=currency_code, title=title, sku=sku
             )
@@ -721,14 +968,16 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         # All validation checks passed!
         return True
 
-    def update_entitlement(self, body):
+    def update_entitlement(self, body, courses, entitlements):
         """
         Argument:
             body (dict): entitlement product data from ecommerce
+            courses (dict): courses of the page, by UUID
+            entitlements (ProductBatch): entitlements of the page
         Returns:
             entitlement product sku if no exceptions, else None
         """
-        attributes = {attribute['name']: attribute['value'] for attribute in body['attribute_values']}
+        attributes = self.get_attributes(body, 'name')
         course_uuid = attributes.get('UUID')
         title = body['title']
         stockrecords = body['stockrecords']
@@ -741,18 +990,16 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         price = Decimal(stock_record.get('price_excl_tax') or stock_record.get('price'))
         sku = stock_record['partner_sku']
 
-        try:
-            course = Course.objects.get(uuid=course_uuid)
-        except Course.DoesNotExist:
+        course = courses.get(self.parse_uuid(course_uuid))
+        if not course:
             msg = 'Could not find course {uuid} while loading entitlement {title} with sku {sku}'.format(
                 uuid=course_uuid, title=title, sku=sku
             )
             logger.warning(msg)
             return None
 
-        try:
-            currency = Currency.objects.get(code=currency_code)
-        except Currency.DoesNotExist:
+        currency = self.currencies.get(currency_code)
+        if not currency:
             msg = 'Could not find currency {code} while loading entitlement {title} with sku {sku}'.format(
                 code=currency_code, title=title, sku=sku
             )
@@ -760,9 +1007,8 @@ class EcommerceApiDataLoader(AbstractDataLoader):
             return None
 
         mode_name = attributes.get('certificate_type')
-        try:
-            mode = SeatType.objects.get(slug=mode_name)
-        except SeatType.DoesNotExist:
+        mode = self.seat_types.get(mode_name)
+        if not mode:
             msg = 'Could not find mode {mode} while loading entitlement {title} with sku {sku}'.format(
                 mode=mode_name, title=title, sku=sku
             )
@@ -778,33 +1024,32 @@ class EcommerceApiDataLoader(AbstractDataLoader):
             self.processing_failure_occurred = True
             return None
 
-        defaults = {
-            'partner': self.partner,
+        values = {
+            'partner_id': self.partner.id,
             'price': price,
-            'currency': currency,
+            'currency_id': currency.code,
             'sku': sku,
         }
         msg = 'Creating entitlement {title} with sku {sku} for partner {partner}'.format(
             title=title, sku=sku, partner=self.partner
         )
         logger.info(msg)
-        entitlement, _ = course.entitlements.update_or_create(mode=mode, defaults=defaults)
+        entitlement, __ = entitlements.upsert(course, {'mode_id': mode.id}, values, course.key)
         if course.draft_version:
-            draft_entitlement, _ = course.draft_version.entitlements.update_or_create(
-                draft=True, mode=mode, defaults=defaults
-            )
-            entitlement.draft_version = draft_entitlement
-            entitlement.save()
+            draft_entitlement, __ = entitlements.upsert(course.draft_version, {'mode_id': mode.id}, values, course.key)
+            entitlements.link_draft(entitlement, draft_entitlement)
         return sku
 
-    def update_enrollment_code(self, body):
+    def update_enrollment_code(self, body, course_runs, seats):
         """
         Argument:
             body (dict): enrollment code product data from ecommerce
+            course_runs (dict): course runs of the page, by lowercased key
+            seats (ProductBatch): seats of the page
         Returns:
             enrollment code product sku if no exceptions, else None
         """
-        attributes = {attribute['code']: attribute['value'] for attribute in body['attribute_values']}
+        attributes = self.get_attributes(body, 'code')
         course_key = attributes.get('course_key')
         title = body['title']
         stockrecords = body['stockrecords']
@@ -815,9 +1060,8 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         stock_record = stockrecords[0]
         sku = stock_record['partner_sku']
 
-        try:
-            course_run = CourseRun.objects.get(key=course_key)
-        except CourseRun.DoesNotExist:
+        course_run = course_runs.get(course_key.lower()) if course_key else None
+        if not course_run:
             msg = 'Could not find course run {key} while loading enrollment code {title} with sku {sku}'.format(
                 key=course_key, title=title, sku=sku
             )
@@ -825,16 +1069,14 @@ class EcommerceApiDataLoader(AbstractDataLoader):
             return None
 
         seat_type = attributes.get('seat_type')
-        try:
-            Seat.objects.get(course_run=course_run, type=seat_type)
-        except Seat.DoesNotExist:
+        if not any(seat.type_id == seat_type for seat in seats.get_products(course_run) if not seat.draft):
             msg = 'Could not find seat type {type} while loading enrollment code {title} with sku {sku}'.format(
                 type=seat_type, title=title, sku=sku
             )
             logger.warning(msg)
             return None
 
-        defaults = {
+        values = {
             'bulk_sku': sku
         }
         msg = 'Creating enrollment code {title} with sku {sku} for partner {partner}'.format(
@@ -842,13 +1084,12 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         )
         logger.info(msg)
 
-        seat, _ = course_run.seats.update_or_create(type=seat_type, defaults=defaults)
+        seat, __ = seats.upsert(course_run, {'type_id': seat_type}, values, course_run.course.key)
         if course_run.draft_version:
-            draft_seat, _ = course_run.draft_version.seats.update_or_create(
-                draft=True, type=seat_type, defaults=defaults
+            draft_seat, __ = seats.upsert(
+                course_run.draft_version, {'type_id': seat_type}, values, course_run.course.key
             )
-            seat.draft_version = draft_seat
-            seat.save()
+            seats.link_draft(seat, draft_seat)
 
         return sku
 
@@ -859,52 +1100,136 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         )
 
 
+class ProgramsPage:
+    """
+    Courses, course runs and organizations referenced by a page of the Programs API, along with the current
+    relations of the page's existing programs to them.
+
+    Each of them is loaded with a single query, so that the relations of every program of the page can be
+    updated by only writing their differences.
+    """
+
+    def __init__(self, partner, bodies):
+        run_keys = {
+            course_run['course_key']
+            for body in bodies
+            for course_code in body.get('course_codes', [])
+            for course_run in course_code['run_modes']
+        }
+        organization_keys = {organization['key'] for body in bodies for organization in body['organizations']}
+        marketing_slugs = [body['marketing_slug'] for body in bodies]
+        programs = Program.objects.filter(partner=partner, marketing_slug__in=marketing_slugs)
+
+        self.course_ids_by_run_key = dict(CourseRun.objects.filter(key__in=run_keys).values_list('key', 'course_id'))
+        self.course_runs_by_course_id = defaultdict(list)
+        for course_run_id, key, course_id in CourseRun.objects.filter(
+            course_id__in=set(self.course_ids_by_run_key.values())
+        ).values_list('id', 'key', 'course_id'):
+            self.course_runs_by_course_id[course_id].append((course_run_id, key))
+        self.organization_ids_by_key = dict(
+            Organization.objects.filter(partner=partner, key__in=organization_keys).values_list('key', 'id')
+        )
+
+        self.banner_images = {
+            marketing_slug: (banner_image_url, banner_image)
+            for marketing_slug, banner_image_url, banner_image in programs.values_list(
+                'marketing_slug', 'banner_image_url', 'banner_image'
+            )
+        }
+        self.course_ids = self._get_related_ids('courses', programs)
+        self.excluded_course_run_ids = self._get_related_ids('excluded_course_runs', programs)
+        self.organization_ids = self._get_related_ids('authoring_organizations', programs)
+
+    @staticmethod
+    def _get_related_ids(field_name, programs):
+        """
+        Returns:
+            dict: Sets of the ids of the objects related to the given programs by a many-to-many field, by program id.
+        """
+        field = Program._meta.get_field(field_name)
+        related_ids = defaultdict(set)
+        for program_id, related_id in field.remote_field.through.objects.filter(**{
+            f'{field.m2m_field_name()}__in': programs
+        }).values_list(f'{field.m2m_field_name()}_id', f'{field.m2m_reverse_field_name()}_id'):
+            related_ids[program_id].add(related_id)
+        return related_ids
+
+
 class ProgramsApiDataLoader(AbstractDataLoader):
     """ Loads programs from the Programs API. """
     image_width = 1440
     image_height = 480
     XSERIES = None
+    # Number of banner images downloaded at the same time.
+    IMAGE_DOWNLOAD_WORKERS = 4
 
-    def __init__(self, partner, api_url, max_workers=None, is_threadsafe=False):
+    def __init__(self, partner, api_url, max_workers=None, is_threadsafe=False, resume=False):
         super().__init__(
             partner=partner,
             api_url=api_url,
             max_workers=max_workers,
-            is_threadsafe=is_threadsafe
+            is_threadsafe=is_threadsafe,
+            resume=resume,
         )
         self.XSERIES = ProgramType.objects.get(translations__name_t='XSeries')
+        self.image_pool = None
 
     def ingest(self):
         api_url = self.partner.programs_api_url
-        count = None
-        page = 1
+        initial_page = 1
 
         logger.info('Refreshing programs from %s...', api_url)
 
-        while page:
-            params = {'page': page, 'page_size': self.PAGE_SIZE}
-            response = self.api_client.get(self.api_url + '/programs/', params=params)
+        self.start_checkpoint()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.IMAGE_DOWNLOAD_WORKERS) as self.image_pool:
+            response = self._request_page(initial_page)
             response.raise_for_status()
             response_json = response.json()
             count = response_json['count']
-            results = response_json['results']
-            logger.info('Retrieved %d programs...', len(results))
+            if not self.is_page_processed(initial_page):
+                self._process_response(response_json)
+                self.checkpoint_page(initial_page)
 
             if response_json['next']:
-                page += 1
-            else:
-                page = None
-
-            for program in results:
-                program = self.clean_strings(program)
-                self.update_program(program)
+                pagerange = [
+                    page for page in range(initial_page + 1, int(math.ceil(count / self.PAGE_SIZE)) + 1)
+                    if not self.is_page_processed(page)
+                ]
+                for page, response_json in self.get_page_fetcher(self._request_page).fetch_all(pagerange):
+                    self._process_response(response_json)
+                    self.checkpoint_page(page)
 
         logger.info('Retrieved %d programs from %s.', count, api_url)
 
+    def _request_page(self, page):
+        params = {'page': page, 'page_size': self.PAGE_SIZE}
+        return self.api_client.get(self.api_url + '/programs/', params=params)
+
+    def _process_response(self, response_json):
+        results = response_json['results']
+        logger.info('Retrieved %d programs...', len(results))
+
+        bodies = [self.clean_strings(program) for program in results]
+        page = ProgramsPage(self.partner, bodies)
+        banner_image_downloads = []
+        for body in bodies:
+            program = self.update_program(body, page)
+            if program:
+                banner_image_downloads.append(self._download_program_banner_image(body, program, page))
+
+        # Banner images are downloaded concurrently, and saved once every program of the page is updated.
+        for download in banner_image_downloads:
+            if download:
+                self._save_program_banner_image(*download)
+
     def _get_uuid(self, body):
         return body['uuid']
 
-    def update_program(self, body):
+    def update_program(self, body, page):
+        """
+        Returns:
+            Program: The updated program, or None if it failed to load.
+        """
         uuid = self._get_uuid(body)
 
         try:
@@ -914,7 +1239,6 @@ class ProgramsApiDataLoader(AbstractDataLoader):
                 'subtitle': body['subtitle'],
                 'type': self.XSERIES,
                 'status': body['status'],
-                'banner_image_url': self._get_banner_image_url(body),
             }
 
             program, __ = Program.objects.update_or_create(
@@ -922,56 +1246,99 @@ class ProgramsApiDataLoader(AbstractDataLoader):
                 partner=self.partner,
                 defaults=defaults
             )
-            self._update_program_organizations(body, program)
-            self._update_program_courses_and_runs(body, program)
-            self._update_program_banner_image(body, program)
+            self._update_program_organizations(body, program, page)
+            self._update_program_courses_and_runs(body, program, page)
             program.save()
+            return program
         except Exception:  # pylint: disable=broad-except
             logger.exception('Failed to load program %s', uuid)
+            return None
 
-    def _update_program_courses_and_runs(self, body, program):
+    def _update_program_courses_and_runs(self, body, program, page):
         course_run_keys = set()
         for course_code in body.get('course_codes', []):
             course_run_keys.update([course_run['course_key'] for course_run in course_code['run_modes']])
 
         # The course_code key field is technically useless, so we must build the course list from the
         # associated course runs.
-        courses = Course.objects.filter(course_runs__key__in=course_run_keys).distinct()
-        program.courses.set(courses)
+        course_ids = sorted({
+            page.course_ids_by_run_key[key] for key in course_run_keys if key in page.course_ids_by_run_key
+        })
+        self._set_related_ids(program, 'courses', page.course_ids[program.id], course_ids)
 
         # Do a diff of all the course runs and the explicitly-associated course runs to determine
         # which course runs should be explicitly excluded.
-        excluded_course_runs = CourseRun.objects.filter(course__in=courses).exclude(key__in=course_run_keys)
-        program.excluded_course_runs.set(excluded_course_runs)
+        excluded_course_run_ids = [
+            course_run_id for course_id in course_ids for course_run_id, key in page.course_runs_by_course_id[course_id]
+            if key not in course_run_keys
+        ]
+        self._set_related_ids(
+            program, 'excluded_course_runs', page.excluded_course_run_ids[program.id], excluded_course_run_ids
+        )
 
-    def _update_program_organizations(self, body, program):
+    def _update_program_organizations(self, body, program, page):
         uuid = self._get_uuid(body)
         org_keys = [org['key'] for org in body['organizations']]
-        organizations = Organization.objects.filter(key__in=org_keys, partner=self.partner)
+        organization_ids = [
+            page.organization_ids_by_key[key] for key in org_keys if key in page.organization_ids_by_key
+        ]
 
-        if len(org_keys) != organizations.count():
+        if len(org_keys) != len(organization_ids):
             logger.error('Organizations for program [%s] are invalid!', uuid)
 
-        program.authoring_organizations.set(organizations)
+        self._set_related_ids(program, 'authoring_organizations', page.organization_ids[program.id], organization_ids)
+
+    @staticmethod
+    def _set_related_ids(program, field_name, existing_ids, ids):
+        """
+        Only adds and removes the differences between the given and existing ids related to the program, rather
+        than setting every related id.
+        """
+        relation = getattr(program, field_name)
+        removed_ids = existing_ids.difference(ids)
+        if removed_ids:
+            relation.remove(*removed_ids)
+        added_ids = [related_id for related_id in ids if related_id not in existing_ids]
+        if added_ids:
+            relation.add(*added_ids)
 
     def _get_banner_image_url(self, body):
         image_key = f'w{self.image_width}h{self.image_height}'
         image_url = body.get('banner_image_urls', {}).get(image_key)
         return image_url
 
-    def _update_program_banner_image(self, body, program):
+    def _download_program_banner_image(self, body, program, page):
+        """
+        Starts downloading the banner image of the program, unless it was already loaded from the same url.
+
+        Returns:
+            tuple: The program, the image url and the future of its response, or None if there is nothing to download.
+        """
         image_url = self._get_banner_image_url(body)
         if not image_url:
             logger.warning('There are no banner image url for program %s', program.title)
-            return
+            return None
 
-        r = requests.get(image_url)  # pylint: disable=missing-timeout
-        if r.status_code == 200:
-            banner_downloaded = File(BytesIO(r.content))
-            program.banner_image.save(
-                'banner.jpg',
-                banner_downloaded
-            )
-            program.save()
-        else:
-            logger.exception('Loading the banner image %s for program %s failed', image_url, program.title)
+        previous_image_url, previous_image = page.banner_images.get(program.marketing_slug, (None, None))
+        if previous_image and previous_image_url == image_url:
+            logger.info('Banner image %s for program %s is unchanged', image_url, program.title)
+            return None
+
+        return program, image_url, self.image_pool.submit(requests.get, image_url)
+
+    def _save_program_banner_image(self, program, image_url, download):
+        try:
+            r = download.result()
+            if r.status_code == 200:
+                banner_downloaded = File(BytesIO(r.content))
+                program.banner_image.save(
+                    'banner.jpg',
+                    banner_downloaded
+                )
+                # The url is only recorded once its image is saved, so that failed downloads are retried.
+                program.banner_image_url = image_url
+                program.save()
+            else:
+                logger.exception('Loading the banner image %s for program %s failed', image_url, program.title)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception('Failed to load program %s', program.uuid)
@@ -0,0 +1,215 @@
+"""
+Rate limited fetching of paginated API responses for the data loaders.
+"""
+import datetime
+import logging
+import queue
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+def get_retry_after(response):
+    """
+    Returns the number of seconds the Retry-After header of the given response asks to wait, if any.
+    """
+    value = response.headers.get('Retry-After') if response is not None else None
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds(), 0.0)
+
+
+class RateLimiter:
+    """
+    Token bucket shared by the threads requesting the same API.
+
+    Requests are allowed at up to `max_rate` requests per second. The rate is adjusted with additive increase
+    and multiplicative decrease: it is halved whenever the API throttles a request, and increased back towards
+    `max_rate` by a tenth of it on every successful request. Throttled requests also pause every request for the
+    delay given by the Retry-After header of the response. Without a `max_rate`, requests are only paused.
+    """
+
+    def __init__(self, max_rate=None, burst=1, min_rate=None):
+        self.max_rate = max_rate
+        self.min_rate = min_rate or (max_rate / 10 if max_rate else None)
+        self.rate = max_rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def _reserve(self):
+        """
+        Takes a token if one is available.
+
+        Returns:
+            float: Seconds to wait before trying again, 0 if a token was taken.
+        """
+        with self.lock:
+            now = time.monotonic()
+            if now < self.paused_until:
+                return self.paused_until - now
+            if self.rate is None:
+                return 0.0
+
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """
+        Blocks until a request is allowed.
+        """
+        wait = self._reserve()
+        while wait:
+            time.sleep(wait)
+            wait = self._reserve()
+
+    def on_success(self):
+        if self.max_rate is None:
+            return
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+    def on_throttle(self, retry_after=None):
+        with self.lock:
+            if self.max_rate is not None:
+                self.rate = max(self.min_rate, self.rate / 2)
+            if retry_after:
+                self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+        logger.info('Throttled, requesting at %s requests/s after %ss.', self.rate, retry_after or 0)
+
+
+class RateLimitedPageFetcher:
+    """
+    Fetches pages of an API concurrently, at the rate allowed by a RateLimiter.
+
+    Up to `max_workers` threads request the pages, and put their JSON content in a queue holding at most
+    `queue_size` pages, from which the pages are iterated over as they are fetched, in any order. The pages
+    are thus processed by the iterating thread while the next ones are being fetched, and fetching pauses
+    whenever processing falls behind.
+
+    Throttled requests are retried up to `max_throttled_tries` times, after the delay asked by the API. Other
+    failures are retried up to `max_tries` times with an exponential backoff, unless `giveup` returns True
+    for them. Pages which still fail either raise their error when iterated over, or, without `raise_errors`,
+    are logged and listed in `failed_pages`.
+    """
+    THROTTLED_STATUS_CODE = 429
+    BACKOFF_BASE = 2
+
+    def __init__(self, request_page, rate_limiter, max_workers=None, queue_size=None, max_tries=4, giveup=None,
+                 raise_errors=True, max_throttled_tries=20):
+        """
+        Arguments:
+            request_page (callable): Function returning the requests.Response of the given page number.
+        """
+        self.request_page = request_page
+        self.rate_limiter = rate_limiter
+        self.max_workers = max_workers or 1
+        self.queue_size = queue_size or self.max_workers * 2
+        self.max_tries = max_tries
+        self.max_throttled_tries = max_throttled_tries
+        self.giveup = giveup or (lambda exception: False)
+        self.raise_errors = raise_errors
+        self.failed_pages = []
+
+    def fetch(self, page):
+        """
+        Returns the JSON content of the given page, retrying failed requests.
+        """
+        tries = 0
+        throttled_tries = 0
+        while True:
+            self.rate_limiter.acquire()
+            try:
+                response = self.request_page(page)
+                response.raise_for_status()
+            except requests.exceptions.RequestException as exception:
+                response = getattr(exception, 'response', None)
+                if response is not None and response.status_code == self.THROTTLED_STATUS_CODE:
+                    throttled_tries += 1
+                    if throttled_tries >= self.max_throttled_tries:
+                        raise
+                    self.rate_limiter.on_throttle(get_retry_after(response))
+                    continue
+
+                tries += 1
+                if tries >= self.max_tries or self.giveup(exception):
+                    raise
+                time.sleep(self.BACKOFF_BASE ** tries)
+                continue
+
+            self.rate_limiter.on_success()
+            return response.json()
+
+    def fetch_all(self, pages):
+        """
+        Yields (page, content) tuples of the given pages as they are fetched.
+        """
+        pages = iter(pages)
+        pages_lock = threading.Lock()
+        results = queue.Queue(maxsize=self.queue_size)
+        stopped = threading.Event()
+
+        def put(item):
+            while not stopped.is_set():
+                try:
+                    results.put(item, timeout=1)
+                    return
+                except queue.Full:
+                    continue
+
+        def work():
+            try:
+                while not stopped.is_set():
+                    with pages_lock:
+                        page = next(pages, None)
+                    if page is None:
+                        return
+                    try:
+                        put((page, self.fetch(page), None))
+                    except Exception as exception:  # pylint: disable=broad-except
+                        put((page, None, exception))
+            finally:
+                put(None)
+
+        workers = [threading.Thread(target=work, daemon=True) for __ in range(self.max_workers)]
+        for worker in workers:
+            worker.start()
+
+        try:
+            running = len(workers)
+            while running:
+                item = results.get()
+                if item is None:
+                    running -= 1
+                    continue
+
+                page, content, exception = item
+                if exception is None:
+                    yield page, content
+                elif self.raise_errors:
+                    raise exception
+                else:
+                    logger.exception('Failed to fetch page %d.', page, exc_info=exception)
+                    self.failed_pages.append(page)
+        finally:
+            stopped.set()
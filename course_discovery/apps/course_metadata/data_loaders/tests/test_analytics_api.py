@@ -1,7 +1,9 @@
 import json
 
 import responses
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from course_discovery.apps.course_metadata.data_loaders.analytics_api import AnalyticsAPIDataLoader
 from course_discovery.apps.course_metadata.data_loaders.tests import JSON, mock_data
@@ -113,3 +115,20 @@ class AnalyticsAPIDataLoaderTests(DataLoaderTestMixin, TestCase):
         for obj in [Course.objects.first(), CourseRun.objects.first()]:
             assert obj.draft_version.enrollment_count == 528
             assert obj.draft_version.recent_enrollment_count == 87
+
+    @responses.activate
+    def test_counts_updated_in_bulk(self):
+        """ Verify counts are saved with a bulk update per model, without recording history. """
+        self._define_course_metadata()
+        self._mock_course_summaries(self.mocked_data)
+        course_run = CourseRun.objects.first()
+        history_count = course_run.history.count()
+
+        with CaptureQueriesContext(connection) as context:
+            self.loader.ingest()
+
+        updates = [query for query in context.captured_queries if query['sql'].startswith('UPDATE')]
+        assert len(updates) == 3
+        course_run.refresh_from_db()
+        assert course_run.enrollment_count > 0
+        assert course_run.history.count() == history_count
@@ -9,8 +9,10 @@ import pytz
 import responses
 from django.conf import settings
 from django.core.management import CommandError
+from django.db import connection
 from django.http.response import HttpResponse
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from edx_django_utils.cache import TieredCache
 from edx_toggles.toggles.testutils import override_waffle_switch
 from pytz import UTC
@@ -24,13 +26,16 @@ from course_discovery.apps.course_metadata.data_loaders.api import (
 from course_discovery.apps.course_metadata.data_loaders.tests import JPEG, JSON, mock_data
 from course_discovery.apps.course_metadata.data_loaders.tests.mixins import DataLoaderTestMixin
 from course_discovery.apps.course_metadata.models import (
-    Course, CourseEntitlement, CourseRun, CourseRunType, CourseType, Organization, Program, ProgramType, Seat, SeatType
+    Course, CourseEntitlement, CourseRun, CourseRunType, CourseType, DataLoaderCheckpoint, Organization, Program,
+    ProgramType, Seat, SeatType
 )
 from course_discovery.apps.course_metadata.tests.factories import (
-    CourseEntitlementFactory, CourseFactory, CourseRunFactory, OrganizationFactory, SeatFactory, SeatTypeFactory,
-    SourceFactory
+    CourseEntitlementFactory, CourseFactory, CourseRunFactory, OrganizationFactory, ProgramFactory, SeatFactory,
+    SeatTypeFactory, SourceFactory
+)
+from course_discovery.apps.course_metadata.toggles import (
+    BYPASS_LMS_DATA_LOADER__END_DATE_UPDATED_CHECK, COURSES_API_DATA_LOADER__BULK_WRITE
 )
-from course_discovery.apps.course_metadata.toggles import BYPASS_LMS_DATA_LOADER__END_DATE_UPDATED_CHECK
 from course_discovery.apps.course_metadata.utils import ensure_draft_world, subtract_deadline_delta
 
 LOGGER_PATH = 'course_discovery.apps.course_metadata.data_loaders.api.logger'
@@ -189,6 +194,41 @@ class CoursesApiDataLoaderTests(DataLoaderTestMixin, TestCase):
         # Verify multiple calls to ingest data do NOT result in data integrity errors.
         self.loader.ingest()
 
+    @responses.activate
+    def test_ingest_checkpoints_pages(self):
+        """ Verify the processed pages are checkpointed, and skipped by resumed loaders. """
+        TieredCache.dangerous_clear_all_tiers()
+        api_data = self.mock_api()
+
+        self.loader.ingest()
+        checkpoint = DataLoaderCheckpoint.objects.get(partner=self.partner, loader='CoursesApiDataLoader')
+        assert checkpoint.last_page == 1
+        assert not checkpoint.completed
+
+        CourseRun.everything.all().delete()
+        self.loader.resume = True
+        self.loader.ingest()
+        assert CourseRun.objects.count() == 0
+
+        self.loader.resume = False
+        self.loader.ingest()
+        assert CourseRun.objects.count() == len(api_data)
+
+    def test_checkpoint_page(self):
+        """ Verify the checkpoint only advances over the pages processed without a gap. """
+        checkpoint = self.loader.start_checkpoint()
+        for page, last_page in ((2, 0), (1, 2), (4, 2), (3, 4)):
+            self.loader.checkpoint_page(page)
+            checkpoint.refresh_from_db()
+            assert checkpoint.last_page == last_page
+
+        self.loader.complete_checkpoint()
+        checkpoint.refresh_from_db()
+        assert checkpoint.completed
+
+        checkpoint = self.loader.start_checkpoint()
+        assert (checkpoint.last_page, checkpoint.completed) == (0, False)
+
     @responses.activate
     @mock.patch('course_discovery.apps.course_metadata.data_loaders.api.push_to_ecommerce_for_course_run')
     def test_ingest_verified_deadline(self, mock_push_to_ecomm):
@@ -393,6 +433,77 @@ class CoursesApiDataLoaderTests(DataLoaderTestMixin, TestCase):
         self.loader.ingest()
         assert not mock_push_to_ecomm.called
 
+    @responses.activate
+    def test_ingest_bulk_write(self):
+        """ Verify runs only needing plain field updates are bulk updated, along with their history. """
+        api_data = self.mock_api()
+        self.loader.ingest()
+        responses.reset()
+
+        api_data = [dict(body, name=f"{body['name']} updated") for body in api_data]
+        self.mock_api(api_data)
+        with override_waffle_switch(COURSES_API_DATA_LOADER__BULK_WRITE, active=True):
+            with mock.patch.object(self.loader, 'process_single_course_run') as mock_process_single_course_run:
+                self.loader.ingest()
+
+        assert not mock_process_single_course_run.called
+        for body in api_data:
+            course_run = self.assert_course_run_loaded(body)
+            assert course_run.history.first().title_override == body['name']
+
+    def test_bulk_update_course_runs_data_modified_timestamp(self):
+        """ Verify bulk updating draft runs updates the data modified timestamps of their courses and programs. """
+        old_timestamp = datetime.datetime(2020, 1, 1, tzinfo=pytz.UTC)
+        course = CourseFactory(partner=self.partner)
+        draft_course = CourseFactory(partner=self.partner, key=course.key, draft=True)
+        draft_run = CourseRunFactory(course=draft_course, draft=True)
+        program = ProgramFactory(partner=self.partner, courses=[course])
+        Course.everything.filter(key=course.key).update(data_modified_timestamp=old_timestamp)
+        Program.objects.filter(pk=program.pk).update(data_modified_timestamp=old_timestamp)
+
+        draft_run.title_override = 'New title'
+        self.loader.bulk_update_course_runs([draft_run], ['title_override'])
+
+        for product in (course, draft_course, program):
+            product.refresh_from_db()
+            assert product.data_modified_timestamp > old_timestamp
+
+    @responses.activate
+    def test_ingest_bulk_write_with_side_effects(self):
+        """ Verify new runs, and runs whose end date changes, are still processed one by one. """
+        api_data = self.mock_api()
+        self.loader.ingest()
+        responses.reset()
+
+        api_data = [dict(api_data[0], end='2016-08-08T00:00:00Z')] + api_data[1:]
+        self.mock_api(api_data)
+        CourseRun.everything.filter(key=api_data[1]['id']).delete()
+        with override_waffle_switch(COURSES_API_DATA_LOADER__BULK_WRITE, active=True):
+            self.loader.ingest()
+
+        for body in api_data:
+            self.assert_course_run_loaded(body)
+
+    @responses.activate
+    def test_ingest_bulk_write_pacing_change(self):
+        """ Verify runs whose pacing changes are saved, updating their enterprise subscription inclusion. """
+        api_data = self.mock_api()
+        self.loader.ingest()
+        responses.reset()
+
+        key = api_data[0]['id']
+        Course.everything.filter(course_runs__key=key).update(enterprise_subscription_inclusion=True)
+        CourseRun.everything.filter(key=key).update(pacing_type='self_paced', enterprise_subscription_inclusion=True)
+
+        api_data = [dict(api_data[0], pacing='instructor')] + api_data[1:]
+        self.mock_api(api_data)
+        with override_waffle_switch(COURSES_API_DATA_LOADER__BULK_WRITE, active=True):
+            self.loader.ingest()
+
+        for course_run in CourseRun.everything.filter(key=key):
+            assert course_run.pacing_type == 'instructor_paced'
+            assert course_run.enterprise_subscription_inclusion is False
+
     @responses.activate
     def test_ingest_exception_handling(self):
         """ Verify the data loader properly handles exceptions during processing of the data from the API. """
@@ -998,6 +1109,41 @@ class EcommerceApiDataLoaderTests(DataLoaderTestMixin, TestCase):
         assert not CourseEntitlement.everything.filter(pk=entitlement_draft_should_delete.pk).exists()
         assert CourseEntitlement.everything.filter(pk=entitlement_draft_should_not_delete.pk).exists()
 
+    def test_process_course_runs_queries(self):
+        """ Verify a page of seats is loaded with a number of queries which does not depend on its size. """
+        verified_run_type = CourseRunType.objects.get(slug=CourseRunType.VERIFIED_AUDIT)
+        self.loader._load_currencies_and_seat_types()  # pylint: disable=protected-access
+
+        def product(certificate_type, price, sku):
+            return {
+                'structure': 'child',
+                'expires': None,
+                'attribute_values': [{'name': 'certificate_type', 'value': certificate_type}],
+                'stockrecords': [{'price_currency': 'USD', 'price_excl_tax': price, 'partner_sku': sku}],
+            }
+
+        def count_page_queries(run_count):
+            bodies = []
+            for __ in range(run_count):
+                course_run = CourseRunFactory(type=verified_run_type, course__partner=self.partner)
+                SeatFactory(course_run=course_run, type=SeatTypeFactory.professional())
+                ensure_draft_world(course_run)
+                bodies.append({
+                    'id': course_run.key,
+                    'products': [product(Seat.AUDIT, '0.00', 'audit'), product(Seat.VERIFIED, '100.00', 'verified')],
+                })
+
+            with CaptureQueriesContext(connection) as context:
+                self.loader._process_course_runs({'results': bodies})  # pylint: disable=protected-access
+            return len(context.captured_queries)
+
+        assert count_page_queries(1) == count_page_queries(3)
+        for course_run in CourseRun.objects.filter(type=verified_run_type):
+            assert sorted(course_run.seats.values_list('type', flat=True)) == [Seat.AUDIT, Seat.VERIFIED]
+            for seat in course_run.seats.all():
+                assert seat.draft_version.course_run == course_run.draft_version
+                assert seat.draft_version.sku == seat.sku
+
     @responses.activate
     @mock.patch(LOGGER_PATH)
     def test_no_stockrecord(self, mock_logger):
@@ -1210,9 +1356,6 @@ class ProgramsApiDataLoaderTests(DataLoaderTestMixin, TestCase):
         assert keys == [org.key for org in expected_organizations]
         self.assertListEqual(list(program.authoring_organizations.all()), expected_organizations)
 
-        banner_image_url = body.get('banner_image_urls', {}).get('w1440h480')
-        assert program.banner_image_url == banner_image_url
-
         course_run_keys = set()
         course_codes = body.get('course_codes', [])
         for course_code in course_codes:
@@ -1229,6 +1372,7 @@ class ProgramsApiDataLoaderTests(DataLoaderTestMixin, TestCase):
         program = Program.objects.get(uuid=AbstractDataLoader.clean_string(body['uuid']), partner=self.partner)
         banner_image_url = body.get('banner_image_urls', {}).get('w1440h480')
         if banner_image_url:
+            assert program.banner_image_url == banner_image_url
             for size_key in program.banner_image.field.variations:
                 # Get different sizes specs from the model field
                 # Then get the file path from the available files
@@ -1300,3 +1444,54 @@ class ProgramsApiDataLoaderTests(DataLoaderTestMixin, TestCase):
         for program in programs:
             self.assert_program_loaded(program)
             self.assert_program_banner_image_loaded(program)
+
+    @responses.activate
+    def test_ingest_with_unchanged_banner_image(self):
+        """ Verify banner images are only downloaded again when their url changes. """
+        programs = self.mock_api()
+        banner_image_urls = [
+            program_data['banner_image_urls']['w1440h480'] for program_data in programs
+            if program_data.get('banner_image_urls', {}).get('w1440h480')
+        ]
+        for banner_image_url in banner_image_urls:
+            responses.add_callback(responses.GET, banner_image_url, callback=mock_jpeg_callback(), content_type=JPEG)
+
+        self.loader.ingest()
+        responses.calls.reset()  # pylint: disable=no-member
+        self.loader.ingest()
+
+        assert banner_image_urls
+        assert not [call for call in responses.calls if call.request.url in banner_image_urls]
+        for program in programs:
+            self.assert_program_loaded(program)
+            self.assert_program_banner_image_loaded(program)
+
+    @responses.activate
+    def test_ingest_with_failed_banner_image(self):
+        """ Verify banner images which failed to download are downloaded again. """
+        programs = self.mock_api()
+        banner_image_urls = [
+            program_data['banner_image_urls']['w1440h480'] for program_data in programs
+            if program_data.get('banner_image_urls', {}).get('w1440h480')
+        ]
+        jpeg_callback = mock_jpeg_callback()
+        failed_urls = set()
+
+        def fail_once_callback(request):
+            if request.url in failed_urls:
+                return jpeg_callback(request)
+            failed_urls.add(request.url)
+            return 500, {}, ''
+
+        for banner_image_url in banner_image_urls:
+            responses.add_callback(responses.GET, banner_image_url, callback=fail_once_callback, content_type=JPEG)
+
+        self.loader.ingest()
+        assert banner_image_urls
+        assert not Program.objects.filter(banner_image_url__in=banner_image_urls).exists()
+
+        self.loader.ingest()
+
+        for program in programs:
+            self.assert_program_loaded(program)
+            self.assert_program_banner_image_loaded(program)
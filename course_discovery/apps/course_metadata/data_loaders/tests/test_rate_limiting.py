@@ -0,0 +1,125 @@
+from unittest import mock
+
+import pytest
+import requests
+from django.test import TestCase
+
+from course_discovery.apps.course_metadata.data_loaders.rate_limiting import (
+    RateLimitedPageFetcher, RateLimiter, get_retry_after
+)
+
+RATE_LIMITING_PATH = 'course_discovery.apps.course_metadata.data_loaders.rate_limiting'
+
+
+class FakeClock:
+    """ Clock whose time only passes while sleeping. """
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def mock_response(status_code=200, headers=None, page=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = b'{"page": %d}' % (page or 0)  # pylint: disable=protected-access
+    return response
+
+
+class GetRetryAfterTests(TestCase):
+    def test_seconds(self):
+        assert get_retry_after(mock_response(429, {'Retry-After': '30'})) == 30.0
+
+    def test_http_date(self):
+        assert get_retry_after(mock_response(429, {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})) == 0.0
+
+    def test_missing(self):
+        assert get_retry_after(mock_response(429)) is None
+        assert get_retry_after(mock_response(429, {'Retry-After': 'soon'})) is None
+
+
+class RateLimiterTests(TestCase):
+    def test_additive_increase_multiplicative_decrease(self):
+        """ Verify the rate is halved when throttled, and increased back up to the maximum rate on success. """
+        limiter = RateLimiter(max_rate=10)
+        limiter.on_throttle()
+        assert limiter.rate == 5
+        limiter.on_throttle()
+        limiter.on_throttle()
+        limiter.on_throttle()
+        assert limiter.rate == 1
+
+        for __ in range(20):
+            limiter.on_success()
+        assert limiter.rate == 10
+
+    def test_acquire_waits_for_tokens(self):
+        """ Verify requests beyond the burst wait for a token to be available. """
+        clock = FakeClock()
+        with mock.patch(f'{RATE_LIMITING_PATH}.time', clock):
+            limiter = RateLimiter(max_rate=2)
+            limiter.acquire()
+            limiter.acquire()
+            limiter.acquire()
+        assert clock.sleeps == [0.5, 0.5]
+
+    def test_retry_after_pauses_requests(self):
+        clock = FakeClock()
+        with mock.patch(f'{RATE_LIMITING_PATH}.time', clock):
+            limiter = RateLimiter()
+            limiter.on_throttle(retry_after=30)
+            limiter.acquire()
+        assert clock.sleeps == [30]
+
+
+class RateLimitedPageFetcherTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.clock = FakeClock()
+        patcher = mock.patch(f'{RATE_LIMITING_PATH}.time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_fetch_all(self):
+        """ Verify every page is fetched and yielded along with its content. """
+        fetcher = RateLimitedPageFetcher(lambda page: mock_response(page=page), RateLimiter(), max_workers=3)
+        assert sorted(fetcher.fetch_all(range(1, 6))) == [(page, {'page': page}) for page in range(1, 6)]
+
+    def test_throttled_requests_are_retried(self):
+        """ Verify throttled requests are retried after the delay asked by the API, at a lower rate. """
+        responses = [mock_response(429, {'Retry-After': '60'}), mock_response(page=1)]
+        limiter = RateLimiter(max_rate=1)
+        fetcher = RateLimitedPageFetcher(lambda page: responses.pop(0), limiter)
+
+        assert fetcher.fetch(1) == {'page': 1}
+        assert self.clock.sleeps == [60]
+        assert limiter.rate == 0.6
+
+    def test_throttled_requests_give_up(self):
+        """ Verify requests that keep being throttled eventually raise their error. """
+        request_page = mock.Mock(return_value=mock_response(429, {'Retry-After': '1'}))
+        fetcher = RateLimitedPageFetcher(request_page, RateLimiter(), max_throttled_tries=3)
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            fetcher.fetch(1)
+        assert request_page.call_count == 3
+
+    def test_failed_pages(self):
+        """ Verify pages that keep failing either raise their error, or are listed without stopping the others. """
+        def request_page(page):
+            return mock_response(500 if page == 2 else 200, page=page)
+
+        fetcher = RateLimitedPageFetcher(request_page, RateLimiter(), max_tries=2)
+        with pytest.raises(requests.exceptions.HTTPError):
+            list(fetcher.fetch_all([1, 2, 3]))
+
+        fetcher = RateLimitedPageFetcher(request_page, RateLimiter(), max_tries=2, raise_errors=False)
+        assert [page for page, __ in fetcher.fetch_all([1, 2, 3])] == [1, 3]
+        assert fetcher.failed_pages == [2]
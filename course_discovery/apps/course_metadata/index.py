@@ -1,4 +1,12 @@
+import datetime
+import hashlib
+import json
+import logging
+
+import pytz
 from algoliasearch_django import AlgoliaIndex, register
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
 
 from course_discovery.apps.course_metadata.algolia_models import (
     AlgoliaProxyCourse, AlgoliaProxyProduct, AlgoliaProxyProgram, SearchDefaultResultsConfiguration
@@ -7,6 +15,11 @@ from course_discovery.apps.course_metadata.contentful_utils import (
     fetch_and_transform_bootcamp_contentful_data, fetch_and_transform_degree_contentful_data
 )
 
+logger = logging.getLogger(__name__)
+
+# Key of the index settings' user data under which the time of the last incremental sync is stored.
+LAST_SYNC_USER_DATA_KEY = 'last_sync'
+
 
 class BaseProductIndex(AlgoliaIndex):
     language = None
@@ -31,6 +44,105 @@ class BaseProductIndex(AlgoliaIndex):
 
         return qs1 + qs2
 
+    def get_raw_record(self, instance, update_fields=None):
+        """
+        Adds a hash of the content of full records, which incremental syncs compare to skip unchanged records.
+        """
+        record = super().get_raw_record(instance, update_fields=update_fields)
+        if not update_fields:
+            record['content_hash'] = hashlib.md5(
+                json.dumps(record, sort_keys=True, cls=DjangoJSONEncoder).encode('utf-8')
+            ).hexdigest()
+        return record
+
+    def get_changed_products(self, since, chunk_size=1000):
+        """
+        Yields the products which may have changed since the given time, or all products without it.
+
+        Products are loaded lazily, `chunk_size` at a time. Products with Contentful data are always included,
+        as changes to their Contentful entries do not change their modification timestamp.
+        """
+        bootcamp_contentful_data = fetch_and_transform_bootcamp_contentful_data()
+        degree_contentful_data = fetch_and_transform_degree_contentful_data()
+
+        for queryset, contentful_data in (
+            (AlgoliaProxyCourse.prefetch_queryset(), bootcamp_contentful_data),
+            (AlgoliaProxyProgram.prefetch_queryset(), degree_contentful_data),
+        ):
+            if since:
+                queryset = queryset.filter(Q(data_modified_timestamp__gte=since) | Q(uuid__in=list(contentful_data)))
+            for product in queryset.iterator(chunk_size=chunk_size):
+                yield AlgoliaProxyProduct(product, self.language, contentful_data=contentful_data)
+
+    def get_product_object_ids(self):
+        """
+        Returns the object IDs of every existing course and program, indexable or not.
+        """
+        return {
+            f'course-{uuid}' for uuid in AlgoliaProxyCourse.objects.values_list('uuid', flat=True).iterator()
+        } | {
+            f'program-{uuid}' for uuid in AlgoliaProxyProgram.objects.values_list('uuid', flat=True).iterator()
+        }
+
+    def sync(self, batch_size=1000):
+        """
+        Updates the records of the products which changed since the last sync, rather than reindexing all of them.
+
+        Only the records whose content hash differs from the one in the index are uploaded, and the records
+        of products which are gone or no longer indexable are deleted, in batches of `batch_size`. Records
+        also depend on the current time, for instance through their availability, so a full reindex is still
+        needed from time to time.
+
+        Returns:
+            tuple: Numbers of updated and deleted records.
+        """
+        if not self.language:
+            raise Exception(  # pylint: disable=broad-exception-raised
+                'Cannot update Algolia index \'{index_name}\'. No language set'.format(index_name=self.index_name)
+            )
+
+        index = self._AlgoliaIndex__index
+        sync_started = datetime.datetime.now(pytz.UTC)
+        user_data = index.get_settings().get('userData') or {}
+        since = user_data.get(LAST_SYNC_USER_DATA_KEY)
+        indexed_hashes = {
+            record['objectID']: record.get('content_hash')
+            for record in index.browse_all({'attributesToRetrieve': ['content_hash']})
+        }
+
+        updated, deleted = 0, []
+        batch = []
+        for product in self.get_changed_products(since, chunk_size=batch_size):
+            object_id = self.objectID(product)
+            if not self._should_index(product):
+                if object_id in indexed_hashes:
+                    deleted.append(object_id)
+                continue
+
+            record = self.get_raw_record(product)
+            if record['content_hash'] == indexed_hashes.get(object_id):
+                continue
+
+            batch.append(record)
+            if len(batch) >= batch_size:
+                index.partial_update_objects(batch)
+                updated += len(batch)
+                batch = []
+        if batch:
+            index.partial_update_objects(batch)
+            updated += len(batch)
+
+        deleted += sorted(indexed_hashes.keys() - self.get_product_object_ids())
+        for start in range(0, len(deleted), batch_size):
+            index.delete_objects(deleted[start:start + batch_size])
+
+        user_data[LAST_SYNC_USER_DATA_KEY] = sync_started.isoformat()
+        index.set_settings({'userData': user_data})
+        logger.info(
+            'Synced Algolia index [%s]: %d records updated and %d deleted.', self.index_name, updated, len(deleted)
+        )
+        return updated, len(deleted)
+
     def generate_empty_query_rule(self, rule_object_id, product_type, results):
         promoted_results = [{'objectID': f'{product_type}-{result.uuid}',
                              'position': index} for index, result in enumerate(results)]
@@ -67,8 +179,11 @@ class BaseProductIndex(AlgoliaIndex):
             if rule['objectID'] not in rules_to_create_ids
         ]
         final_rules = rules_to_create + existing_rules_to_keep
+        reindex_started = datetime.datetime.now(pytz.UTC)
         super().reindex_all(batch_size)
         self._AlgoliaIndex__index.replace_all_rules(final_rules)
+        # The reindexed records are the starting point of the next incremental sync
+        self._AlgoliaIndex__index.set_settings({'userData': {LAST_SYNC_USER_DATA_KEY: reindex_started.isoformat()}})
 
 
 class EnglishProductIndex(BaseProductIndex):
@@ -221,5 +336,9 @@ class ProductMetaIndex(AlgoliaIndex):
         for indexer in self.model_index:
             indexer.reindex_all(batch_size)
 
+    def sync(self, batch_size=1000):
+        for indexer in self.model_index:
+            indexer.sync(batch_size)
+
 
 register(AlgoliaProxyProduct, index_cls=ProductMetaIndex)
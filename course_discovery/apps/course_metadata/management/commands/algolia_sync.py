@@ -0,0 +1,22 @@
+from algoliasearch_django import get_adapter
+from django.core.management import BaseCommand
+
+from course_discovery.apps.course_metadata.algolia_models import AlgoliaProxyProduct
+
+
+class Command(BaseCommand):
+    help = (
+        'Updates the Algolia product indexes with the courses and programs changed since the last sync, '
+        'instead of reindexing all of them as algolia_reindex does.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batchsize',
+            type=int,
+            default=1000,
+            help='Number of records loaded, uploaded and deleted at once.',
+        )
+
+    def handle(self, *args, **options):
+        get_adapter(AlgoliaProxyProduct).sync(batch_size=options['batchsize'])
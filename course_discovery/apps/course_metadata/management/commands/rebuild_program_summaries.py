@@ -0,0 +1,54 @@
+import logging
+
+from django.core.management import BaseCommand, CommandError
+from django.db.models import F, Q
+
+from course_discovery.apps.api.cache import set_api_timestamp
+from course_discovery.apps.core.models import Partner
+from course_discovery.apps.course_metadata.models import Program, ProgramSummary
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the summaries of programs, from which their prices, durations and languages are serialized.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--partner_code',
+            help='The short code for a specific partner whose program summaries are rebuilt.'
+        )
+        parser.add_argument(
+            '--stale_only',
+            action='store_true',
+            help='Only rebuild the summaries of programs changed since their summary was built, or without one.'
+        )
+        parser.add_argument(
+            '--batch_size',
+            type=int,
+            default=100,
+            help='Number of programs summarized per query.'
+        )
+
+    def handle(self, *args, **options):
+        partners = Partner.objects.all()
+        if options['partner_code']:
+            partners = partners.filter(short_code=options['partner_code'])
+
+        if not partners:
+            raise CommandError('No partners available!')
+
+        for partner in partners:
+            programs = Program.objects.filter(partner=partner)
+            if options['stale_only']:
+                programs = programs.filter(
+                    Q(summary__isnull=True) |
+                    ~Q(summary__program_data_modified_timestamp=F('data_modified_timestamp'))
+                )
+
+            count = ProgramSummary.rebuild(programs, batch_size=options['batch_size'])
+            logger.info('Rebuilt the summaries of %d programs of partner [%s].', count, partner.short_code)
+
+            # Summaries are saved in bulk, without the signals invalidating the cached API responses.
+            if count:
+                set_api_timestamp('program', partner.id)
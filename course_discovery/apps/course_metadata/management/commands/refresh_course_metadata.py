@@ -10,28 +10,45 @@ from django.db import connection
 from django.db.models.signals import post_delete, post_save
 
 from course_discovery.apps.api.cache import api_change_receiver, set_api_timestamp
+from course_discovery.apps.api.cache_warming import warm_api_cache_after_data_load
 from course_discovery.apps.core.models import Partner
 from course_discovery.apps.core.utils import delete_orphans
 from course_discovery.apps.course_metadata.data_loaders.analytics_api import AnalyticsAPIDataLoader
 from course_discovery.apps.course_metadata.data_loaders.api import (
     CoursesApiDataLoader, EcommerceApiDataLoader, ProgramsApiDataLoader
 )
-from course_discovery.apps.course_metadata.models import Course, DataLoaderConfig, Image, Video
+from course_discovery.apps.course_metadata.models import (
+    Course, DataLoaderCheckpoint, DataLoaderConfig, Image, Program, ProgramSummary, Video
+)
 from course_discovery.apps.course_metadata.signals import connect_api_change_receiver
 
 logger = logging.getLogger(__name__)
 
 
-def execute_loader(loader_class, *loader_args):
+def execute_loader(loader_class, *loader_args, resume=False):
+    """
+    Runs the given data loader, retrying it if it fails.
+
+    Pages are already retried by the data loaders as they are requested. Retries of the whole loader
+    resume from the last page it checkpointed, rather than loading every page again.
+    """
+    resume_state = {'resume': resume}
+
+    def on_backoff(details):  # pylint: disable=unused-argument
+        resume_state['resume'] = True
+
     @backoff.on_exception(
         backoff.expo,
         Exception,
         max_tries=loader_class.LOADER_MAX_RETRY,
         logger=logger,
         base=60,
+        on_backoff=on_backoff,
     )
     def run_loader():
-        return loader_class(*loader_args).ingest()
+        loader = loader_class(*loader_args, resume=resume_state['resume'])
+        loader.ingest()
+        loader.complete_checkpoint()
 
     try:
         run_loader()
@@ -41,7 +58,7 @@ def execute_loader(loader_class, *loader_args):
         return False
 
 
-def execute_parallel_loader(loader_class, *loader_args):
+def execute_parallel_loader(loader_class, *loader_args, resume=False):
     """
     ProcessPoolExecutor uses the multiprocessing module. Multiprocessing forks processes,
     causing connection objects to be copied across processes. The key goal when running
@@ -57,7 +74,20 @@ def execute_parallel_loader(loader_class, *loader_args):
     """
     connection.close()
 
-    return execute_loader(loader_class, *loader_args)
+    return execute_loader(loader_class, *loader_args, resume=resume)
+
+
+def get_completed_loaders(partner, resume):
+    """
+    Returns the names of the data loaders which completed for the given partner during the previous run
+    if resuming it, or clears their checkpoints so that they start over otherwise.
+    """
+    checkpoints = DataLoaderCheckpoint.objects.filter(partner=partner)
+    if resume:
+        return set(checkpoints.filter(completed=True).values_list('loader', flat=True))
+
+    checkpoints.delete()
+    return set()
 
 
 class Command(BaseCommand):
@@ -75,11 +105,19 @@ class Command(BaseCommand):
             help='The stage of pipeline to be run. If this argument is not provided it runs all pipeline stages.'
         )
 
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Skip the data loaders which completed during the previous run, and continue the others from '
+                 'the last page they processed.'
+        )
+
     def handle(self, *args, **options):
         # For each partner defined...
         partners = Partner.objects.all()
 
         data_loader_stage = options.get('data_loader_stage')
+        resume = options.get('resume')
         # If a specific partner was indicated, filter down the set
         partner_code = options.get('partner_code')
         if partner_code:
@@ -131,6 +169,8 @@ class Command(BaseCommand):
             is_threadsafe = courses_exist and waffle.switch_is_active('threaded_metadata_write')
             max_workers = DataLoaderConfig.get_solo().max_workers
 
+            completed_loaders = get_completed_loaders(partner, resume)
+
             logger.info(
                 'Command is{negation} using threads to write data.'.format(negation='' if is_threadsafe else ' not')  # lint-amnesty, pylint: disable=logging-format-interpolation
             )
@@ -159,7 +199,9 @@ class Command(BaseCommand):
                 for stage in pipeline:
                     with concurrent.futures.ProcessPoolExecutor() as executor:
                         for loader_class, api_url, max_workers in stage:
-                            if api_url:
+                            if loader_class.__name__ in completed_loaders:
+                                logger.info(f'Skipping Loader {loader_class.__name__}, completed by the previous run')
+                            elif api_url:
                                 logger.info(f'Executing Loader {loader_class.__name__}, url: {api_url}')
                                 futures.append(executor.submit(
                                     execute_parallel_loader,
@@ -168,13 +210,16 @@ class Command(BaseCommand):
                                     api_url,
                                     max_workers,
                                     is_threadsafe,
+                                    resume=resume,
                                 ))
 
                 success = success and all(f.result() for f in futures)
             else:
                 # Flatten pipeline and run serially.
                 for loader_class, api_url, max_workers in itertools.chain(*(stage for stage in pipeline)):
-                    if api_url:
+                    if loader_class.__name__ in completed_loaders:
+                        logger.info(f'Skipping Loader {loader_class.__name__}, completed by the previous run')
+                    elif api_url:
                         logger.info(f'Executing Loader {loader_class.__name__}, url: {api_url}')
                         success = execute_loader(
                             loader_class,
@@ -182,6 +227,7 @@ class Command(BaseCommand):
                             api_url,
                             max_workers,
                             is_threadsafe,
+                            resume=resume,
                         ) and success
 
             # TODO Cleanup CourseRun overrides equivalent to the Course values.
@@ -192,10 +238,16 @@ class Command(BaseCommand):
         delete_orphans(Image)
         delete_orphans(Video)
 
+        # The data loaders update the official versions of courses and their runs, seats and entitlements,
+        # which does not change the data_modified_timestamp of the programs they belong to.
+        ProgramSummary.rebuild(Program.objects.filter(partner__in=partners))
+
         set_api_timestamp()
 
         # Re-connect back the api_change_receiver receiver to post_save and post_delete signals
         connect_api_change_receiver()
 
+        warm_api_cache_after_data_load()
+
         if not success:
             raise CommandError('One or more of the data loaders above failed.')
@@ -0,0 +1,13 @@
+from django.core.management import BaseCommand
+
+from course_discovery.apps.course_metadata.contentful_utils import sync_contentful_data
+
+
+class Command(BaseCommand):
+    help = (
+        'Refreshes the cached bootcamp and degree data from Contentful if any entry changed since the last sync. '
+        'Meant to be run periodically, so that the cached data never needs to be fetched when it is used.'
+    )
+
+    def handle(self, *args, **options):
+        sync_contentful_data()
@@ -0,0 +1,49 @@
+import datetime
+from unittest import mock
+
+import pytest
+import pytz
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from course_discovery.apps.core.tests.factories import PartnerFactory
+from course_discovery.apps.course_metadata.models import Program, ProgramSummary
+from course_discovery.apps.course_metadata.tests.factories import ProgramFactory
+
+COMMAND_PATH = 'course_discovery.apps.course_metadata.management.commands.rebuild_program_summaries'
+
+
+class RebuildProgramSummariesCommandTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.partner = PartnerFactory()
+        self.programs = ProgramFactory.create_batch(2, partner=self.partner)
+        self.other_program = ProgramFactory()
+
+    @mock.patch(f'{COMMAND_PATH}.set_api_timestamp')
+    def test_rebuild(self, mock_set_api_timestamp):
+        """ Verify the summaries of the programs of the partner are built, and their cached responses invalidated. """
+        call_command('rebuild_program_summaries', f'--partner_code={self.partner.short_code}')
+
+        assert set(ProgramSummary.objects.values_list('program', flat=True)) == {
+            program.pk for program in self.programs
+        }
+        mock_set_api_timestamp.assert_called_once_with('program', self.partner.id)
+
+    def test_rebuild_stale_only(self):
+        """ Verify only the summaries of the programs changed since they were built are rebuilt. """
+        call_command('rebuild_program_summaries', f'--partner_code={self.partner.short_code}')
+        changed_program = self.programs[0]
+        Program.objects.filter(pk=changed_program.pk).update(
+            data_modified_timestamp=datetime.datetime.now(pytz.UTC)
+        )
+
+        with mock.patch.object(ProgramSummary, 'build', wraps=ProgramSummary.build) as mock_build:
+            call_command('rebuild_program_summaries', f'--partner_code={self.partner.short_code}', '--stale_only')
+
+        assert [call.args[0].pk for call in mock_build.call_args_list] == [changed_program.pk]
+        assert Program.objects.get(pk=changed_program.pk).current_summary is not None
+
+    def test_invalid_partner_code(self):
+        with pytest.raises(CommandError):
+            call_command('rebuild_program_summaries', '--partner_code=invalid')
@@ -16,8 +16,10 @@ from course_discovery.apps.course_metadata.data_loaders.api import (
     CoursesApiDataLoader, EcommerceApiDataLoader, ProgramsApiDataLoader
 )
 from course_discovery.apps.course_metadata.data_loaders.tests import mock_data
-from course_discovery.apps.course_metadata.management.commands.refresh_course_metadata import execute_parallel_loader
-from course_discovery.apps.course_metadata.models import Image, Video
+from course_discovery.apps.course_metadata.management.commands.refresh_course_metadata import (
+    execute_loader, execute_parallel_loader
+)
+from course_discovery.apps.course_metadata.models import DataLoaderCheckpoint, Image, Video
 from course_discovery.apps.course_metadata.tests.factories import CourseFactory
 
 JSON = 'application/json'
@@ -115,7 +117,7 @@ class RefreshCourseMetadataCommandTests(OAuth2Mixin, TransactionTestCase):
             call_command('refresh_course_metadata')
 
             # Set up expected calls
-            expected_calls = [mock.call(loader_class, self.partner, api_url, max_workers or 7, False)
+            expected_calls = [mock.call(loader_class, self.partner, api_url, max_workers or 7, False, resume=False)
                               for loader_class, api_url, max_workers in self.pipeline]
             mock_executor.assert_has_calls(expected_calls)
 
@@ -136,7 +138,7 @@ class RefreshCourseMetadataCommandTests(OAuth2Mixin, TransactionTestCase):
 
             # Set up expected calls
             expected_calls = [mock.call(execute_parallel_loader, loader_class,
-                                        self.partner, api_url, max_workers or 7, True)
+                                        self.partner, api_url, max_workers or 7, True, resume=False)
                               for loader_class, api_url, max_workers in self.pipeline]
             mock_executor.assert_has_calls(expected_calls, any_order=True)
 
@@ -183,7 +185,45 @@ class RefreshCourseMetadataCommandTests(OAuth2Mixin, TransactionTestCase):
             call_command('refresh_course_metadata', *command_args)
 
             stage_1 = self.pipeline[0]
-            mock_executor.assert_has_calls([mock.call(stage_1[0], self.partner, stage_1[1], 1, False)])
+            mock_executor.assert_has_calls([mock.call(stage_1[0], self.partner, stage_1[1], 1, False, resume=False)])
+
+    def test_refresh_course_metadata_resume(self):
+        """ Verify resumed runs skip the loaders which completed, and continue the others from their checkpoint. """
+        DataLoaderCheckpoint.objects.create(partner=self.partner, loader='CoursesApiDataLoader', completed=True)
+        DataLoaderCheckpoint.objects.create(partner=self.partner, loader='ProgramsApiDataLoader', last_page=2)
+
+        with mock.patch('course_discovery.apps.course_metadata.management.commands.'
+                        'refresh_course_metadata.execute_loader', return_value=True) as mock_executor:
+            call_command('refresh_course_metadata', '--resume')
+
+            expected_calls = [mock.call(loader_class, self.partner, api_url, max_workers or 7, False, resume=True)
+                              for loader_class, api_url, max_workers in self.pipeline[1:]]
+            assert mock_executor.call_args_list == expected_calls
+
+        assert DataLoaderCheckpoint.objects.filter(partner=self.partner).count() == 2
+
+        with mock.patch('course_discovery.apps.course_metadata.management.commands.'
+                        'refresh_course_metadata.execute_loader', return_value=True) as mock_executor:
+            call_command('refresh_course_metadata')
+
+            assert mock_executor.call_count == len(self.pipeline)
+
+        # Runs which do not resume start over.
+        assert not DataLoaderCheckpoint.objects.filter(partner=self.partner).exists()
+
+    def test_execute_loader_retries_resume(self):
+        """ Verify retries of a failed loader resume from its checkpoint. """
+        loader_class = mock.Mock(__name__='CoursesApiDataLoader', LOADER_MAX_RETRY=2)
+        loader_class.return_value.ingest.side_effect = [Exception, None]
+
+        with mock.patch('time.sleep'):
+            assert execute_loader(loader_class, self.partner, self.partner.courses_api_url, 1, False)
+
+        assert loader_class.call_args_list == [
+            mock.call(self.partner, self.partner.courses_api_url, 1, False, resume=False),
+            mock.call(self.partner, self.partner.courses_api_url, 1, False, resume=True),
+        ]
+        loader_class.return_value.complete_checkpoint.assert_called_once_with()
 
     @mock.patch('course_discovery.apps.course_metadata.management.commands.refresh_course_metadata.delete_orphans')
     def test_deletes_orphans(self, mock_delete_orphans):
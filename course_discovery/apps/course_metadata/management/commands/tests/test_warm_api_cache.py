@@ -0,0 +1,68 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+
+from course_discovery.apps.api.cache import get_cache_stats
+from course_discovery.apps.api.cache_warming import get_most_requested_paths, warm_api_cache_after_data_load
+from course_discovery.apps.core.tests.factories import UserFactory
+from course_discovery.apps.course_metadata.tests.factories import CourseFactory
+
+WARMING_PATH = 'course_discovery.apps.api.cache_warming'
+
+
+@override_settings(USE_API_CACHING=True)
+class WarmApiCacheCommandTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.user = UserFactory()
+        CourseFactory()
+
+    def test_warm_paths(self):
+        """ Verify the responses of the given paths are cached, so that the next identical requests hit the cache. """
+        call_command('warm_api_cache', paths=['/api/v1/courses/'], username=self.user.username, workers=1)
+        assert get_cache_stats('CourseViewSet', 'list') == {'hits': 0, 'misses': 1}
+
+        self.client.force_login(self.user)
+        response = self.client.get('/api/v1/courses/', HTTP_ACCEPT='application/json')
+
+        assert response.status_code == 200
+        assert get_cache_stats('CourseViewSet', 'list') == {'hits': 1, 'misses': 1}
+
+    def test_failed_paths(self):
+        """ Verify the command fails if a path could not be warmed. """
+        with pytest.raises(CommandError):
+            call_command('warm_api_cache', paths=['/api/v1/unknown/'], username=self.user.username, workers=1)
+
+    def test_without_paths(self):
+        with pytest.raises(CommandError):
+            call_command('warm_api_cache', username=self.user.username)
+
+    def test_get_most_requested_paths(self):
+        lines = [
+            '127.0.0.1 - - [17/Oct/2026:10:00:00 +0000] "GET /api/v1/programs/?page=2 HTTP/1.1" 200 512',
+            '127.0.0.1 - - [17/Oct/2026:10:00:01 +0000] "GET /api/v1/courses/ HTTP/1.1" 200 512',
+            '127.0.0.1 - - [17/Oct/2026:10:00:02 +0000] "GET /api/v1/courses/ HTTP/1.1" 200 512',
+            '127.0.0.1 - - [17/Oct/2026:10:00:03 +0000] "POST /api/v1/courses/ HTTP/1.1" 201 512',
+            '127.0.0.1 - - [17/Oct/2026:10:00:04 +0000] "GET /admin/ HTTP/1.1" 200 512',
+        ]
+        assert get_most_requested_paths(lines, 10) == ['/api/v1/courses/', '/api/v1/programs/?page=2']
+        assert get_most_requested_paths(lines, 1) == ['/api/v1/courses/']
+
+    @override_settings(API_CACHE_WARMER_AFTER_DATA_LOADS=False)
+    def test_data_load_hook_disabled(self):
+        with mock.patch(f'{WARMING_PATH}.warm_api_cache') as mock_warm:
+            warm_api_cache_after_data_load()
+        assert not mock_warm.called
+
+    @override_settings(
+        API_CACHE_WARMER_AFTER_DATA_LOADS=True, API_CACHE_WARMER_PATHS=['/api/v1/courses/'], API_CACHE_WARMER_WORKERS=2
+    )
+    def test_data_load_hook_does_not_raise(self):
+        """ Verify failing to warm the cache after a data load is only logged. """
+        with mock.patch(f'{WARMING_PATH}.warm_api_cache', side_effect=Exception) as mock_warm:
+            warm_api_cache_after_data_load()
+        mock_warm.assert_called_once_with(['/api/v1/courses/'], None, 2)
@@ -0,0 +1,66 @@
+import logging
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from course_discovery.apps.api.cache_warming import get_most_requested_paths, warm_api_cache
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Caches the responses of the most requested API paths by requesting them.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            action='append',
+            dest='paths',
+            default=[],
+            help='API path to warm, including its query string. Can be given multiple times. '
+                 'Defaults to the paths of the API_CACHE_WARMER_PATHS setting.',
+        )
+        parser.add_argument(
+            '--access-log',
+            help='Access log from which the most requested API paths are warmed, instead of configured ones.',
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=100,
+            help='Number of the most requested API paths of the access log to warm.',
+        )
+        parser.add_argument(
+            '--username',
+            default=settings.API_CACHE_WARMER_USERNAME,
+            help='Username of the user requesting the API paths.',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=settings.API_CACHE_WARMER_WORKERS,
+            help='Number of API paths requested concurrently.',
+        )
+
+    def handle(self, *args, **options):
+        paths = options['paths']
+        if options['access_log']:
+            with open(options['access_log'], encoding='utf-8') as access_log:
+                paths += get_most_requested_paths(access_log, options['top'])
+        paths = paths or settings.API_CACHE_WARMER_PATHS
+
+        if not paths:
+            raise CommandError('No API path to warm.')
+        if not options['username']:
+            raise CommandError('A username is required to request the API paths.')
+
+        warmed_urls = warm_api_cache(paths, options['username'], options['workers'])
+
+        failed_paths = [warmed_url.path for warmed_url in warmed_urls if warmed_url.status_code >= 400]
+        logger.info(
+            'Warmed %d API paths in %.2fs of render time.',
+            len(warmed_urls) - len(failed_paths),
+            sum(warmed_url.seconds for warmed_url in warmed_urls),
+        )
+        if failed_paths:
+            raise CommandError('Failed to warm API paths: {}'.format(', '.join(failed_paths)))
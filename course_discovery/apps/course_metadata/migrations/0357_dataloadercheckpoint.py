@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-17 12:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django_extensions.db.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_alter_historicalpartner_options_and_more'),
+        ('course_metadata', '0356_add_course_editor_update_bulk_operation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataLoaderCheckpoint',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('loader', models.CharField(help_text='Name of the data loader class.', max_length=255)),
+                ('last_page', models.PositiveIntegerField(default=0, help_text='Last page of the API such that it and every previous page have been processed.')),
+                ('completed', models.BooleanField(default=False, help_text='Whether the data loader has completed.')),
+                ('partner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.partner')),
+            ],
+            options={
+                'unique_together': {('partner', 'loader')},
+            },
+        ),
+    ]
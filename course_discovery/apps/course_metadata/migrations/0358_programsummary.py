@@ -0,0 +1,34 @@
+# Generated by Django 5.2 on 2026-10-17 13:00
+
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+import django_extensions.db.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course_metadata', '0357_dataloadercheckpoint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgramSummary',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('program_data_modified_timestamp', models.DateTimeField(blank=True, help_text='The data_modified_timestamp of the program the summary was built with.', null=True)),
+                ('price_ranges', models.JSONField(default=list, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('weeks_to_complete_min', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('weeks_to_complete_max', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('languages', models.JSONField(default=list, help_text='Codes of the languages of the course runs.')),
+                ('program', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='summary', to='course_metadata.program')),
+            ],
+            options={
+                'get_latest_by': 'modified',
+                'abstract': False,
+            },
+        ),
+    ]
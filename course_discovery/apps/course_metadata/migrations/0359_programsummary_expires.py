@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-17 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course_metadata', '0358_programsummary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='programsummary',
+            name='expires',
+            field=models.DateTimeField(blank=True, help_text='When the total price of the program may change, as one of its course runs ends or opens for enrollment.', null=True),
+        ),
+    ]
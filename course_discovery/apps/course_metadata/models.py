@@ -3,6 +3,7 @@ import itertools
 import logging
 import re
 from collections import Counter, defaultdict
+from decimal import Decimal
 from urllib.parse import urljoin
 from uuid import uuid4
 
@@ -13,6 +14,7 @@ from config_models.models import ConfigurationModel
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import FileExtensionValidator, MaxValueValidator, MinValueValidator, RegexValidator
 from django.db import IntegrityError, models, transaction
 from django.db.models import F, Q, UniqueConstraint
@@ -66,6 +68,7 @@ from course_discovery.apps.course_metadata.utils import (
     push_to_ecommerce_for_course_run, push_tracks_to_lms_for_course_run, set_official_state, subtract_deadline_delta,
     validate_ai_languages
 )
+from course_discovery.apps.edx_elasticsearch_dsl_extensions.query_cache import get_query_values
 from course_discovery.apps.ietf_language_tags.models import LanguageTag
 from course_discovery.apps.ietf_language_tags.utils import serialize_language
 from course_discovery.apps.publisher.utils import VALID_CHARS_IN_COURSE_NUM_AND_ORG_KEY
@@ -1166,12 +1169,15 @@ class PkSearchableMixin:
         logger.info(f"Attempting Elasticsearch document search against query: {query}")
         es_document, *_ = registry.get_documents(models=(cls,))
         dsl_query = ESDSLQ('query_string', query=query, analyze_wildcard=True)
+
+        def resolve():
+            return [result.pk for result in es_document.search().query(dsl_query).source(['pk']).execute()]
+
         try:
-            results = es_document.search().query(dsl_query).execute()
+            ids = get_query_values(es_document, query, 'pk', resolve)
         except RequestError as exp:
             logger.warning('Elasticsearch request is failed. Got exception: %r', exp)
-            results = []
-        ids = {result.pk for result in results}
+            ids = set()
         logger.info(f'{len(ids)} records extracted from Elasticsearch query "{query}"')
         filtered_queryset = queryset.filter(pk__in=ids)
         logger.info(f'Filtered queryset of length {len(filtered_queryset)} extracted against query "{query}"')
@@ -1182,6 +1188,7 @@ class SearchAfterMixin:
     """
     Represents objects to query Elasticsearch with `search_after` pagination and load by primary key.
     """
+    POINT_IN_TIME_KEEP_ALIVE = '1m'
 
     @classmethod
     def search(
@@ -1218,6 +1225,75 @@ class SearchAfterMixin:
             # want everything, we don't need to actually query elasticsearch at all.
             return queryset
 
+        all_ids = set(cls.search_pks(query, page_size, partner, identifiers, document, sort_field))
+        logger.info(f"Filtering queryset by {len(all_ids)} ids for query: {query}")
+        return queryset.filter(pk__in=all_ids)
+
+    @classmethod
+    def search_values(
+        cls,
+        query,
+        field,
+        queryset=None,
+        chunk_size=settings.ITERATOR_CHUNK_SIZE,
+        **kwargs
+    ):
+        """
+        Yields the values of the given field of the objects matching the query.
+
+        Unlike `search`, the matching objects are never loaded with a single `IN` clause listing every
+        id, but with a query per `chunk_size` ids, as they are fetched from Elasticsearch.
+
+        Args:
+            query (str) -- Elasticsearch querystring (e.g. `title:intro*`)
+            field (str) -- Field whose values are yielded.
+            queryset (models.QuerySet) -- base queryset to search, defaults to objects.all()
+            chunk_size (int) -- Number of ids to load per SQL query.
+            kwargs -- Other arguments of `search`.
+
+        Yields:
+            object
+        """
+        query = clean_query(query)
+        if queryset is None:
+            queryset = cls.objects.all()
+
+        queryset = queryset.values_list(field, flat=True)
+        if query == '(*)':
+            yield from queryset.iterator(chunk_size=chunk_size)
+            return
+
+        pks = cls.search_pks(query, **kwargs)
+        while True:
+            chunk = list(itertools.islice(pks, chunk_size))
+            if not chunk:
+                break
+            yield from queryset.filter(pk__in=chunk)
+
+    @classmethod
+    def search_pks(
+        cls,
+        query,
+        page_size=settings.ELASTICSEARCH_DSL_QUERYSET_PAGINATION,
+        partner=None,
+        identifiers=None,
+        document=None,
+        sort_field="id",
+    ):
+        """
+        Yields the primary keys of the documents matching the query, page by page.
+
+        Only the `pk` doc values of the documents are requested, rather than their whole source, and the pages
+        are all read from the same point in time of the index, so that documents updated while paging are
+        neither skipped nor repeated.
+
+        Args:
+            See `search`.
+
+        Yields:
+            int
+        """
+        query = clean_query(query)
         logger.info(f"Attempting Elasticsearch document search against query: {query}")
         es_document = document or next(iter(registry.get_documents(models=(cls,))), None)
 
@@ -1229,33 +1305,45 @@ class SearchAfterMixin:
 
         dsl_query = ESDSLQ('bool', must=must_queries)
 
-        all_ids = set()
+        connection = es_document._get_connection()  # pylint: disable=protected-access
+        pit_id = connection.open_point_in_time(
+            index=es_document._index._name, keep_alive=cls.POINT_IN_TIME_KEEP_ALIVE  # pylint: disable=protected-access
+        )['id']
+        total = 0
         search_after = None
 
-        while True:
-            search = (
-                es_document.search()
-                .query(dsl_query)
-                .sort(sort_field)
-                .extra(size=page_size)
-            )
-
-            search = search.extra(search_after=search_after) if search_after else search
-
-            results = search.execute()
+        try:
+            while True:
+                search = (
+                    es_document.search()
+                    .index()
+                    .query(dsl_query)
+                    .sort(sort_field)
+                    .source(False)
+                    .extra(
+                        size=page_size,
+                        docvalue_fields=['pk'],
+                        track_total_hits=False,
+                        pit={'id': pit_id, 'keep_alive': cls.POINT_IN_TIME_KEEP_ALIVE},
+                    )
+                )
 
-            ids = {result.pk for result in results}
-            if not ids:
-                logger.info("No more results found.")
-                break
+                search = search.extra(search_after=search_after) if search_after else search
 
-            all_ids.update(ids)
-            search_after = results[-1].meta.sort if results[-1] else None
-            logger.info(f"Fetched {len(ids)} records; total so far: {len(all_ids)}")
+                response = search.execute().to_dict()
+                pit_id = response.get('pit_id', pit_id)
+                hits = response['hits']['hits']
+                if not hits:
+                    logger.info("No more results found.")
+                    break
 
-        filtered_queryset = queryset.filter(pk__in=all_ids)
-        logger.info(f"Filtered queryset of size {len(filtered_queryset)} for query: {query}")
-        return filtered_queryset
+                for hit in hits:
+                    yield hit['fields']['pk'][0]
+                total += len(hits)
+                search_after = hits[-1]['sort']
+                logger.info(f"Fetched {len(hits)} records; total so far: {total}")
+        finally:
+            connection.close_point_in_time(body={'id': pit_id})
 
 
 class Collaborator(TimeStampedModel):
@@ -1625,6 +1713,9 @@ class Course(ManageHistoryMixin, DraftModelMixin, PkSearchableMixin, CachedMixin
         if not self.is_enterprise_catalog_allowed_course() or \
                 self.enterprise_subscription_inclusion is False:
             return False
+        # A course which has not been created yet cannot have authoring organizations.
+        if not self.pk:
+            return True
         for org in self.authoring_organizations.all():
             if not org.enterprise_subscription_inclusion:
                 return False
@@ -1665,22 +1756,20 @@ class Course(ManageHistoryMixin, DraftModelMixin, PkSearchableMixin, CachedMixin
 
     def save(self, *args, **kwargs):
         """
-        There have to be two saves because in order to check for if this is included in the
-        subscription catalog, we need the id that is created on save to access the many-to-many fields
-        and then need to update the boolean in the record based on conditional logic
+        Computes whether the course is included in the subscription catalog before writing it, so that a single
+        write is needed. The authoring organizations of a new course are added once it has been created, and are
+        taken into account the next time it is saved.
         """
         self.update_data_modified_timestamp()
-        super().save(*args, **kwargs)
         self.enterprise_subscription_inclusion = self._check_enterprise_subscription_inclusion()
-        kwargs['force_insert'] = False
-        kwargs['force_update'] = True
+        is_update = bool(self.pk)
+        has_inclusion_changed = self.field_tracker.has_changed('enterprise_subscription_inclusion')
         super().save(*args, **kwargs)
 
-        # Course runs calculate enterprise subscription inclusion based off of their parent's status, so we need to
-        # force a recalculation
-        course_runs = self.course_runs.all()
-        for course_run in course_runs:
-            course_run.save()
+        # Course runs calculate enterprise subscription inclusion based off of their parent's status, so they only
+        # need a recalculation when that status changed.
+        if is_update and has_inclusion_changed:
+            self.course_runs.update_enterprise_subscription_inclusion(bool(self.enterprise_subscription_inclusion))
 
     def __str__(self):
         return f'{self.key}: {self.title}'
@@ -2955,9 +3044,6 @@ class CourseRun(ManageHistoryMixin, DraftModelMixin, CachedMixin, TimeStampedMod
             return False
         return True
 
-    # there have to be two saves because in order to check for if this is included in the
-    # subscription catalog, we need the id that is created on save to access the many-to-many fields
-    # and then need to update the boolean in the record based on conditional logic
     def save(self, *args, suppress_publication=False, send_emails=True, **kwargs):
         """
         Arguments:
@@ -2975,17 +3061,15 @@ class CourseRun(ManageHistoryMixin, DraftModelMixin, CachedMixin, TimeStampedMod
 
             has_end_changed = self.field_tracker.has_changed('end')
 
+            # The inclusion only depends on the course and the pacing type, so it is computed before saving.
+            self.enterprise_subscription_inclusion = self._check_enterprise_subscription_inclusion()
             super().save(*args, **kwargs)
 
             if has_end_changed:
-                for seat in self.seats.filter(type=Seat.VERIFIED):
+                for seat in self.seats.filter(type=Seat.VERIFIED, upgrade_deadline_override__isnull=False):
                     seat.upgrade_deadline_override = None
                     seat.save(update_fields=['upgrade_deadline_override'])
 
-            self.enterprise_subscription_inclusion = self._check_enterprise_subscription_inclusion()
-            kwargs['force_insert'] = False
-            kwargs['force_update'] = True
-            super().save(*args, **kwargs)
             self.handle_status_change(send_emails)
 
             if push_to_marketing:
@@ -3922,6 +4006,17 @@ class Program(ManageHistoryMixin, PkSearchableMixin, TimeStampedModel):
     def is_active(self):
         return self.status == ProgramStatus.Active
 
+    @cached_property
+    def current_summary(self):
+        """
+        The ProgramSummary of the program, or None if it has none or it is no longer current.
+        """
+        try:
+            summary = self.summary
+        except ObjectDoesNotExist:
+            return None
+        return summary if summary.is_current else None
+
     def _check_enterprise_subscription_inclusion(self):
         # We exclude Bachelors, Masters, and Doctorate programs as the cost per user would be too high
         if not ProgramType.is_enterprise_catalog_program_type(self.type):
@@ -4038,6 +4133,133 @@ class ProgramSubscriptionPrice(TimeStampedModel):
         return f"{self.program_subscription.program} has subscription Price {self.price} {self.currency}"
 
 
+class ProgramSummary(TimeStampedModel):
+    """
+    Values of a program aggregated over its courses, course runs, seats and entitlements.
+
+    These are otherwise computed every time the program is serialized. A summary is only current as long as
+    the data_modified_timestamp of its program is the one it was built with, as that timestamp changes along
+    with the courses, course runs, seats and entitlements of the program.
+
+    The total price of a program also depends on which of its course runs have ended or opened for enrollment,
+    so a summary is no longer current once the first of these dates after it was built has passed.
+
+    Note that the timestamp only changes along with the draft versions of courses and course runs. Changes made
+    to official versions alone, e.g. through the admin, leave summaries current until they are rebuilt by the
+    refresh_course_metadata or rebuild_program_summaries commands.
+
+    The languages are those of the unrestricted course runs of the program, which are the only ones serialized
+    unless restricted runs are explicitly requested.
+    """
+    program = models.OneToOneField(Program, models.CASCADE, related_name='summary')
+    program_data_modified_timestamp = models.DateTimeField(
+        null=True, blank=True, help_text=_('The data_modified_timestamp of the program the summary was built with.')
+    )
+    price_ranges = models.JSONField(default=list, encoder=DjangoJSONEncoder)
+    weeks_to_complete_min = models.PositiveSmallIntegerField(null=True, blank=True)
+    weeks_to_complete_max = models.PositiveSmallIntegerField(null=True, blank=True)
+    languages = models.JSONField(default=list, help_text=_('Codes of the languages of the course runs.'))
+    expires = models.DateTimeField(
+        null=True, blank=True,
+        help_text=_('When the total price of the program may change, as one of its course runs ends or opens for '
+                    'enrollment.'),
+    )
+
+    def __str__(self):
+        return f'Summary of {self.program}'
+
+    @property
+    def is_current(self):
+        return (
+            self.program_data_modified_timestamp == self.program.data_modified_timestamp and
+            (self.expires is None or self.expires > datetime.datetime.now(pytz.UTC))
+        )
+
+    def get_price_ranges(self):
+        # Prices are stored as strings, to be decoded exactly as they were computed.
+        return [
+            {**price_range, **{key: Decimal(price_range[key]) for key in ('min', 'max', 'total')}}
+            for price_range in self.price_ranges
+        ]
+
+    @staticmethod
+    def get_expiry(program, now):
+        """
+        Returns the first date after now at which a course run of the program ends or opens for enrollment,
+        which changes the seats its total price is computed with.
+        """
+        return min(
+            (
+                date
+                for seat in program.canonical_seats
+                for date in (seat.course_run.end, seat.course_run.enrollment_start)
+                if date and date > now
+            ),
+            default=None,
+        )
+
+    @classmethod
+    def build(cls, program):
+        # Dates passing while the summary is built expire it right away.
+        expires = cls.get_expiry(program, datetime.datetime.now(pytz.UTC))
+        return cls(
+            # Only the id is kept, so that programs and their prefetched objects can be freed once summarized.
+            program_id=program.pk,
+            program_data_modified_timestamp=program.data_modified_timestamp,
+            price_ranges=program.price_ranges,
+            weeks_to_complete_min=program.weeks_to_complete_min,
+            weeks_to_complete_max=program.weeks_to_complete_max,
+            languages=sorted(language.code for language in program.languages),
+            expires=expires,
+        )
+
+    @classmethod
+    def rebuild(cls, programs, batch_size=100):
+        """
+        Builds the summaries of the given programs, replacing any existing ones.
+
+        Returns:
+            int: The number of summaries built.
+        """
+        # Prices are only computed for the seat types applicable to the type of a program.
+        programs = programs.filter(type__isnull=False)
+        existing_ids = dict(cls.objects.filter(program__in=programs.values('pk')).values_list('program_id', 'id'))
+        programs = programs.select_related('type').prefetch_related(
+            'excluded_course_runs',
+            'type__applicable_seat_types',
+            Prefetch('courses', queryset=Course.objects.select_related(
+                'canonical_course_run__course',
+            ).prefetch_related(
+                'canonical_course_run__seats__currency',
+                'canonical_course_run__seats__type',
+                'entitlements__currency',
+                'entitlements__mode',
+                Prefetch(
+                    'course_runs',
+                    queryset=CourseRun.objects.filter(restricted_run__isnull=True).select_related('language'),
+                ),
+            )),
+        )
+
+        now = datetime.datetime.now(pytz.UTC)
+        summaries = [cls.build(program) for program in programs.iterator(chunk_size=batch_size)]
+        for summary in summaries:
+            summary.pk = existing_ids.get(summary.program_id)
+            summary.modified = now
+
+        # Bulk queries skip the post_save signals, which would otherwise invalidate the API cache for every summary.
+        cls.objects.bulk_update(
+            [summary for summary in summaries if summary.pk],
+            fields=[
+                'modified', 'program_data_modified_timestamp', 'price_ranges', 'weeks_to_complete_min',
+                'weeks_to_complete_max', 'languages', 'expires',
+            ],
+            batch_size=batch_size,
+        )
+        cls.objects.bulk_create([summary for summary in summaries if not summary.pk], batch_size=batch_size)
+        return len(summaries)
+
+
 class Ranking(ManageHistoryMixin, TimeStampedModel):
     """
     Represents the rankings of a program
@@ -4906,6 +5128,24 @@ class DataLoaderConfig(SingletonModel):
     max_workers = models.PositiveSmallIntegerField(default=7)
 
 
+class DataLoaderCheckpoint(TimeStampedModel):
+    """
+    Progress of a data loader of the refresh_course_metadata command for a partner, from which it can resume.
+    """
+    partner = models.ForeignKey(Partner, models.CASCADE)
+    loader = models.CharField(max_length=255, help_text=_('Name of the data loader class.'))
+    last_page = models.PositiveIntegerField(
+        default=0, help_text=_('Last page of the API such that it and every previous page have been processed.')
+    )
+    completed = models.BooleanField(default=False, help_text=_('Whether the data loader has completed.'))
+
+    class Meta:
+        unique_together = ('partner', 'loader')
+
+    def __str__(self):
+        return f'{self.loader} ({self.partner.short_code}): page {self.last_page}'
+
+
 class DeletePersonDupsConfig(SingletonModel):
     """
     Configuration for the delete_person_dups management command.
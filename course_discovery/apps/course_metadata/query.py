@@ -4,7 +4,7 @@ import pytz
 from django.db import models
 from django.db.models.query_utils import Q
 
-from course_discovery.apps.course_metadata.choices import CourseRunStatus, ProgramStatus
+from course_discovery.apps.course_metadata.choices import CourseRunPacing, CourseRunStatus, ProgramStatus
 
 
 class CourseQuerySet(models.QuerySet):
@@ -131,6 +131,20 @@ class CourseRunQuerySet(models.QuerySet):
             status=CourseRunStatus.Published
         )
 
+    def update_enterprise_subscription_inclusion(self, course_inclusion):
+        """ Updates the enterprise subscription inclusion of CourseRuns whose courses have the given inclusion.
+
+        A CourseRun is included if its course is and it is not instructor-paced. Only the CourseRuns whose
+        inclusion differs are updated, with a single query.
+
+        Returns:
+            int: number of updated CourseRuns
+        """
+        course_runs = self.exclude(enterprise_subscription_inclusion=course_inclusion)
+        if course_inclusion:
+            course_runs = course_runs.exclude(pacing_type=CourseRunPacing.Instructor)
+        return course_runs.update(enterprise_subscription_inclusion=course_inclusion)
+
 
 class ProgramQuerySet(models.QuerySet):
     def marketable(self):
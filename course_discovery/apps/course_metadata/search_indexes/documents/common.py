@@ -1,5 +1,7 @@
 import json
+import operator
 from fnmatch import fnmatch
+from functools import reduce
 
 import waffle  # lint-amnesty, pylint: disable=invalid-django-waffle-import
 from django.core.exceptions import ObjectDoesNotExist
@@ -23,6 +25,22 @@ def filter_visible_runs(course_runs):
     return course_runs.exclude(type__is_marketable=False)
 
 
+def get_visible_runs(course_runs):
+    """
+    In-memory counterpart of `filter_visible_runs` for course runs that are already fetched.
+
+    Filtering prefetched runs in Python keeps the prefetch cache in use instead of issuing a new query.
+    """
+    check_draft = waffle.switch_is_active('elasticsearch-course-draft-filter-visible-runs-check')
+
+    def is_visible(course_run):
+        if course_run.type and course_run.type.is_marketable is False:
+            return False
+        return not (check_draft and course_run.draft)
+
+    return [course_run for course_run in course_runs if is_visible(course_run)]
+
+
 class OrganizationsMixin:
     """
     OrganizationsMixin to be able prepare a set specific fields for es index.
@@ -43,10 +61,12 @@ class OrganizationsMixin:
         return [self.format_organization(organization) for organization in organizations]
 
     def prepare_authoring_organization_bodies(self, obj):
-        return [self.format_organization_body(organization) for organization in obj.authoring_organizations.all()]
+        return [
+            self.format_organization_body(organization) for organization in self._get_authoring_organizations(obj)
+        ]
 
     def prepare_authoring_organizations(self, obj):
-        return self._prepare_organizations(obj.authoring_organizations.all())
+        return self._prepare_organizations(self._get_authoring_organizations(obj))
 
     def prepare_authoring_organizations_autocomplete(self, obj):
         return self.prepare_authoring_organizations(obj)
@@ -128,9 +148,27 @@ class BaseDocument(Document, metaclass=DocumentMeta):
     text = fields.TextField(analyzer=synonym_text)
     uuid = fields.KeywordField()
 
+    # Timestamp lookups, relative to the indexed model, whose change means the document has to be re-prepared.
+    changed_since_lookups = ('modified',)
+
+    # The object whose derived data is currently held by `_memoize`, and that data.
+    # Declared on the class so that assigning them does not add them to the document data.
+    _memoized_object = None
+    _memoized_values = None
+
     def get_queryset(self):
         return self.django.model.objects.all()
 
+    def get_changed_queryset(self, since):
+        """
+        Returns the part of `get_queryset` which may have changed since the given moment.
+        """
+        changed = reduce(
+            operator.or_, (models.Q(**{f'{lookup}__gte': since}) for lookup in self.changed_since_lookups)
+        )
+        changed_pks = self.django.model._base_manager.filter(changed).values('pk')  # pylint: disable=protected-access
+        return self.get_queryset().filter(pk__in=changed_pks)
+
     @classmethod
     def _matches(cls, hit):
         # pylint: disable=protected-access
@@ -150,6 +188,23 @@ class BaseDocument(Document, metaclass=DocumentMeta):
     def _set_object(self, obj):
         self._object = obj
 
+    def _memoize(self, obj, name, compute):
+        """
+        Returns `compute(obj)`, evaluated once for the object being prepared.
+
+        Lets the `prepare_*` methods of a document share data derived from the same object
+        (e.g. its visible course runs) instead of deriving it, and querying for it, once per field.
+        """
+        if self._memoized_object is not obj:
+            self._memoized_object = obj
+            self._memoized_values = {}
+        if name not in self._memoized_values:
+            self._memoized_values[name] = compute(obj)
+        return self._memoized_values[name]
+
+    def _get_authoring_organizations(self, obj):
+        return self._memoize(obj, 'authoring_organizations', lambda o: list(o.authoring_organizations.all()))
+
     def _prepare_language(self, language):
         if language:
             return language.get_search_facet_display()
@@ -166,7 +221,7 @@ class BaseDocument(Document, metaclass=DocumentMeta):
     object = property(_get_object, _set_object)
 
     def prepare_authoring_organization_uuids(self, obj):
-        return [str(organization.uuid) for organization in obj.authoring_organizations.all()]
+        return [str(organization.uuid) for organization in self._get_authoring_organizations(obj)]
 
     def prepare_partner(self, obj):
         return obj.partner.short_code if obj.partner else ''
@@ -245,7 +300,7 @@ class BaseCourseDocument(OrganizationsMixin, BaseDocument):
         return obj.level_type.name if obj.level_type else None
 
     def prepare_logo_image_urls(self, obj):
-        orgs = obj.authoring_organizations.all()
+        orgs = self._get_authoring_organizations(obj)
         return [org.logo_image.url for org in orgs if org.logo_image]
 
     def prepare_organizations(self, obj):
@@ -10,7 +10,7 @@ from course_discovery.apps.course_metadata.models import Course, CourseRun
 from course_discovery.apps.course_metadata.utils import get_product_skill_names
 
 from .analyzers import case_insensitive_keyword
-from .common import BaseCourseDocument, filter_visible_runs
+from .common import BaseCourseDocument, get_visible_runs
 
 __all__ = ('CourseDocument',)
 
@@ -60,17 +60,24 @@ class CourseDocument(BaseCourseDocument):
     external_course_marketing_type = fields.KeywordField(multi=True)
     product_source = fields.KeywordField(multi=True)
 
+    changed_since_lookups = (
+        'modified', 'data_modified_timestamp', 'course_runs__modified', 'course_runs__seats__modified',
+    )
+
     def prepare_aggregation_key(self, obj):
         return 'course:{}'.format(obj.key)
 
     def prepare_aggregation_uuid(self, obj):
         return 'course:{}'.format(obj.uuid)
 
+    def _get_visible_runs(self, obj):
+        return self._memoize(obj, 'visible_runs', lambda course: get_visible_runs(course.course_runs.all()))
+
     def prepare_availability(self, obj):
-        return [str(course_run.availability) for course_run in filter_visible_runs(obj.course_runs)]
+        return [str(course_run.availability) for course_run in self._get_visible_runs(obj)]
 
     def prepare_course_runs(self, obj):
-        return [course_run.key for course_run in filter_visible_runs(obj.course_runs)]
+        return [course_run.key for course_run in self._get_visible_runs(obj)]
 
     def prepare_expected_learning_items(self, obj):
         return [item.value for item in obj.expected_learning_items.all()]
@@ -79,13 +86,13 @@ class CourseDocument(BaseCourseDocument):
         return list(
             {
                 self._prepare_language(course_run.language)
-                for course_run in filter_visible_runs(obj.course_runs)
+                for course_run in self._get_visible_runs(obj)
                 if course_run.language
             }
         )
 
     def prepare_end(self, obj):
-        return [course_run.end for course_run in filter_visible_runs(obj.course_runs)]
+        return [course_run.end for course_run in self._get_visible_runs(obj)]
 
     def prepare_end_date(self, obj):
         return obj.end_date
@@ -94,19 +101,19 @@ class CourseDocument(BaseCourseDocument):
         return str(obj.course_ends)
 
     def prepare_enrollment_start(self, obj):
-        return [course_run.enrollment_start for course_run in filter_visible_runs(obj.course_runs)]
+        return [course_run.enrollment_start for course_run in self._get_visible_runs(obj)]
 
     def prepare_enrollment_end(self, obj):
-        return [course_run.enrollment_end for course_run in filter_visible_runs(obj.course_runs)]
+        return [course_run.enrollment_end for course_run in self._get_visible_runs(obj)]
 
     def prepare_org(self, obj):
-        course_run = filter_visible_runs(obj.course_runs).first()
+        course_run = min(self._get_visible_runs(obj), key=lambda run: run.pk, default=None)
         if course_run:
             return CourseKey.from_string(course_run.key).org
         return None
 
     def prepare_seat_types(self, obj):
-        seat_types = [seat.slug for run in filter_visible_runs(obj.course_runs) for seat in run.seat_types]
+        seat_types = [seat.slug for run in self._get_visible_runs(obj) for seat in run.seat_types]
         return list(set(seat_types))
 
     def prepare_skill_names(self, obj):
@@ -116,10 +123,10 @@ class CourseDocument(BaseCourseDocument):
         return get_whitelisted_serialized_skills(obj.key, product_type=ProductTypes.Course)
 
     def prepare_status(self, obj):
-        return [course_run.status for course_run in filter_visible_runs(obj.course_runs)]
+        return [course_run.status for course_run in self._get_visible_runs(obj)]
 
     def prepare_start(self, obj):
-        return [course_run.start for course_run in filter_visible_runs(obj.course_runs)]
+        return [course_run.start for course_run in self._get_visible_runs(obj)]
 
     def prepare_prerequisites(self, obj):
         return [prerequisite.name for prerequisite in obj.prerequisites.all()]
@@ -134,8 +141,10 @@ class CourseDocument(BaseCourseDocument):
                 restricted_run__restriction_type__in=excluded_restriction_types
             ).prefetch_related(
                 'seats__type', 'type', 'language', 'restricted_run',
-            ))
-        ).select_related('partner')
+            )),
+            'authoring_organizations', 'sponsoring_organizations', 'subjects', 'expected_learning_items',
+            'prerequisites',
+        ).select_related('partner', 'type', 'level_type', 'additional_metadata', 'product_source')
 
     def prepare_course_type(self, obj):
         return obj.type.slug
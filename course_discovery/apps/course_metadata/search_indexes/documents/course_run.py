@@ -83,6 +83,8 @@ class CourseRunDocument(BaseCourseDocument):
     )
     weeks_to_complete = fields.IntegerField()
 
+    changed_since_lookups = ('modified', 'course__modified', 'seats__modified')
+
     def prepare_aggregation_key(self, obj):
         # Aggregate CourseRuns by Course key since that is how we plan to dedup CourseRuns on the marketing site.
         return 'courserun:{}'.format(obj.course.key)
@@ -155,8 +157,12 @@ class CourseRunDocument(BaseCourseDocument):
                    .exclude(type_id__in=retired_type_ids)
                    .select_related('course')
                    .select_related('course__type')
+                   .select_related('course__partner', 'course__level_type', 'language', 'type', 'restricted_run')
                    .prefetch_related('seats__type')
                    .prefetch_related('transcript_languages')
+                   .prefetch_related('staff')
+                   .prefetch_related('course__authoring_organizations', 'course__sponsoring_organizations')
+                   .prefetch_related('course__subjects')
         )
 
     class Django:
@@ -74,6 +74,8 @@ class ProgramDocument(BaseDocument, OrganizationsMixin):
     excluded_from_search = fields.BooleanField()
     course_run_statuses = fields.KeywordField(multi=True)
 
+    changed_since_lookups = ('modified', 'data_modified_timestamp', 'courses__course_runs__modified')
+
     def prepare_aggregation_key(self, obj):
         return 'program:{}'.format(obj.uuid)
 
@@ -83,8 +85,15 @@ class ProgramDocument(BaseDocument, OrganizationsMixin):
     def prepare_credit_backing_organizations(self, obj):
         return self._prepare_organizations(obj.credit_backing_organizations.all())
 
+    def _get_course_runs(self, obj):
+        return self._memoize(obj, 'course_runs', lambda program: list(program.course_runs))
+
     def prepare_language(self, obj):
-        return [self._prepare_language(language) for language in obj.languages]
+        # Same as `Program.languages`, over the memoized runs.
+        languages = {
+            course_run.language for course_run in self._get_course_runs(obj) if course_run.language is not None
+        }
+        return [self._prepare_language(language) for language in languages]
 
     def prepare_organizations(self, obj):
         return self.prepare_authoring_organizations(obj) + self.prepare_credit_backing_organizations(obj)
@@ -93,7 +102,15 @@ class ProgramDocument(BaseDocument, OrganizationsMixin):
         return obj.status == ProgramStatus.Active
 
     def prepare_seat_types(self, obj):
-        return [seat_type.slug for seat_type in obj.seat_types]
+        # Same as `Program.seat_types`, over the memoized runs.
+        applicable_seat_types = set(obj.type.applicable_seat_types.all())
+        seat_types = {
+            seat.type
+            for course_run in self._get_course_runs(obj)
+            for seat in course_run.seats.all()
+            if seat.type in applicable_seat_types
+        }
+        return [seat_type.slug for seat_type in seat_types]
 
     def prepare_skill_names(self, obj):
         return get_product_skill_names(obj.uuid, ProductTypes.Program)
@@ -113,7 +130,9 @@ class ProgramDocument(BaseDocument, OrganizationsMixin):
         return [str(subject.uuid) for subject in obj.subjects]
 
     def prepare_staff_uuids(self, obj):
-        return list({str(staff.uuid) for course_run in obj.course_runs for staff in course_run.staff.all()})
+        return list(
+            {str(staff.uuid) for course_run in self._get_course_runs(obj) for staff in course_run.staff.all()}
+        )
 
     def prepare_type(self, obj):
         return obj.type.name_t
@@ -126,8 +145,11 @@ class ProgramDocument(BaseDocument, OrganizationsMixin):
             Prefetch('courses', queryset=Course.objects.all().prefetch_related(
                 Prefetch('course_runs', queryset=CourseRun.objects.exclude(
                     restricted_run__restriction_type__in=excluded_restriction_types
-                ))
-            ))
+                ).select_related('language').prefetch_related('seats__type', 'staff')),
+                'subjects',
+            )),
+            'excluded_course_runs', 'authoring_organizations', 'credit_backing_organizations',
+            'type__applicable_seat_types',
         )
 
     class Django:
@@ -1,8 +1,23 @@
+import logging
+import threading
 from abc import ABC, abstractmethod, abstractproperty
-
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models, transaction
+from django_elasticsearch_dsl.apps import DEDConfig
 from django_elasticsearch_dsl.registries import registry
 from django_elasticsearch_dsl.signals import RealTimeSignalProcessor as OriginRealTimeSignalProcessor
 
+from course_discovery.apps.edx_elasticsearch_dsl_extensions.query_cache import bump_search_index_generation
+
+logger = logging.getLogger(__name__)
+
+PENDING_UPDATE_CACHE_KEY = 'search_index_update_pending:{label}:{pk}'
+
 
 class IndexForbiddenException(Exception):
     """
@@ -38,6 +53,7 @@ class RegistryUpdateHandler(ABC):
             return self.__next_handler.handle(sender, instance, **kwargs)
         registry.update(instance)
         registry.update_related(instance)
+        bump_search_index_generation()
 
 
 class MarketableHandler(RegistryUpdateHandler):
@@ -74,6 +90,72 @@ class DraftHandler(RegistryUpdateHandler):
         return super().handle(sender, instance, **kwargs)
 
 
+class DeferredUpdateHandler(RegistryUpdateHandler):
+    """
+    Index update handler.
+
+    Ends a chain of handlers in place of the index update, by handing the instance over to
+    the `DeferredSignalProcessor` which updates the index once the transaction is committed.
+    """
+
+    expected_models = ()
+
+    def __init__(self, processor):
+        self.processor = processor
+
+    def handle(self, sender, instance, **kwargs):
+        self.processor.defer_update(instance)
+
+
+def get_related_instances(instance, related_instances):
+    """
+    Adds the instances whose documents depend on the given instance to `related_instances`, by document
+    type and primary key, as `registry.update_related` would update them.
+    """
+    for document in registry._get_related_doc(instance):  # pylint: disable=protected-access
+        try:
+            related = document().get_instances_from_related(instance)
+        except ObjectDoesNotExist:
+            related = None
+
+        if related is None:
+            continue
+        if isinstance(related, models.Model):
+            related = [related]
+        for related_instance in related:
+            related_instances[document][related_instance.pk] = related_instance
+
+
+def update_search_index(pks_by_label):
+    """
+    Updates the documents of the given objects, and of the objects related to them, with a single bulk
+    request per document type.
+
+    Args:
+        pks_by_label (dict): Primary keys of the objects to update, by model label (e.g. `course_metadata.Course`).
+    """
+    if not DEDConfig.autosync_enabled():
+        return
+
+    related_instances = defaultdict(dict)
+    for label, pks in pks_by_label.items():
+        model = apps.get_model(label)
+        instances = list(model._base_manager.filter(pk__in=pks))  # pylint: disable=protected-access
+        if not instances:
+            continue
+
+        for document in registry.get_documents([model]):
+            if not document.django.ignore_signals:
+                document().update(instances)
+        for instance in instances:
+            get_related_instances(instance, related_instances)
+
+    for document, instances in related_instances.items():
+        document().update(list(instances.values()))
+
+    bump_search_index_generation()
+
+
 class RealTimeSignalProcessor(OriginRealTimeSignalProcessor):
     """
     Custom realtime signal processor to keep fresh all es indexes.
@@ -92,19 +174,93 @@ class RealTimeSignalProcessor(OriginRealTimeSignalProcessor):
         except IndexForbiddenException:
             pass
 
+    def handle_delete(self, sender, instance, **kwargs):
+        super().handle_delete(sender, instance, **kwargs)
+        bump_search_index_generation()
+
     @staticmethod
-    def build_index_updater():
+    def build_index_updater(last_handler=None):
         """
         Build a chain of handlers.
 
         Each handler must either prevent a index from being updated, or
         pass it to another handler.
-        The last handler in the chain is updating the index.
+        The last handler in the chain is updating the index, unless
+        another `last_handler` is given to take its place.
 
         Implements pattern 'Chain of responsibilities.'
         """
         market_handler = MarketableHandler()
         draft_handler = DraftHandler()
         market_handler.set_next(draft_handler)
+        if last_handler:
+            draft_handler.set_next(last_handler)
 
         return market_handler
+
+
+class DeferredSignalProcessor(RealTimeSignalProcessor):
+    """
+    Signal processor that keeps es indexes fresh without updating them inside the transaction.
+
+    Saved instances which pass the same checks as with `RealTimeSignalProcessor` are collected
+    and deduplicated, and their documents are updated after the transaction commits, with a bulk
+    request per document type instead of requests per saved instance.
+
+    If `ELASTICSEARCH_DSL_DEFERRED_UPDATE_COUNTDOWN` is set, the update is instead sent to a Celery
+    task run after that many seconds. Objects already waiting for such a task are not scheduled again,
+    so bursts of updates to the same objects result in a single index update.
+
+    Deletions are still processed immediately, as the deleted instances are needed to update the index.
+    """
+
+    def __init__(self, connections):
+        self._local = threading.local()
+        super().__init__(connections)
+
+    @property
+    def pending(self):
+        if not hasattr(self._local, 'pending'):
+            self._local.pending = defaultdict(set)
+        return self._local.pending
+
+    def handle_save(self, sender, instance, **kwargs):
+        index_updater = self.build_index_updater(DeferredUpdateHandler(self))
+        try:
+            index_updater.handle(sender, instance, **kwargs)
+        except IndexForbiddenException:
+            pass
+
+    def defer_update(self, instance):
+        self.pending[instance._meta.label].add(instance.pk)
+        # Every deferred instance registers the callback, as callbacks of rolled back transactions are dropped.
+        # The first callback run flushes all of them and the others find nothing left to do.
+        transaction.on_commit(self.flush, robust=True)
+
+    def flush(self):
+        pks_by_label = {label: sorted(pks) for label, pks in self.pending.items()}
+        self._local.pending = defaultdict(set)
+        if not pks_by_label:
+            return
+
+        countdown = settings.ELASTICSEARCH_DSL_DEFERRED_UPDATE_COUNTDOWN
+        if countdown is None:
+            update_search_index(pks_by_label)
+            return
+
+        scheduled = {}
+        for label, pks in pks_by_label.items():
+            pks = [
+                pk for pk in pks
+                if cache.add(PENDING_UPDATE_CACHE_KEY.format(label=label, pk=pk), True, timeout=countdown * 2)
+            ]
+            if pks:
+                scheduled[label] = pks
+
+        if scheduled:
+            # NOTE: Deferred to prevent a circular import:
+            # course_discovery.apps.course_metadata.tasks -> course_discovery.apps.course_metadata.search_indexes
+            # pylint: disable=import-outside-toplevel
+            from course_discovery.apps.course_metadata.tasks import update_search_index_task
+            update_search_index_task.apply_async(args=[scheduled], countdown=countdown)
+            logger.debug('Scheduled search index update of %s in %s seconds.', scheduled, countdown)
@@ -117,6 +117,9 @@ def connect_api_change_receiver():
     deleted. Given how interconnected our data is and how infrequently our models
     change (data loading aside), this is a clean and simple way to ensure correctness
     of the API while providing closer-to-optimal cache TTLs.
+
+    Changes to the models listed in API_CACHE_RESOURCE_MODELS only invalidate the
+    responses depending on their resource type, for their partner.
     """
     for model in apps.get_app_config('course_metadata').get_models():
         for signal in (post_save, post_delete):
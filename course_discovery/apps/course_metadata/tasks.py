@@ -1,12 +1,17 @@
 """
 Celery tasks for course metadata.
 """
+import datetime
 import logging
 
+import pytz
 from celery import shared_task
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Exists, OuterRef
 
+from course_discovery.apps.api.cache import set_api_timestamp
 from course_discovery.apps.core.models import Partner
 from course_discovery.apps.course_metadata.choices import BulkOperationStatus, BulkOperationType
 from course_discovery.apps.course_metadata.data_loaders.course_editors_loader import CourseEditorsLoader
@@ -16,6 +21,7 @@ from course_discovery.apps.course_metadata.emails import send_course_deadline_em
 from course_discovery.apps.course_metadata.models import (
     BulkOperationTask, Course, CourseRun, CourseType, Program, ProgramType
 )
+from course_discovery.apps.course_metadata.search_indexes.signals import PENDING_UPDATE_CACHE_KEY, update_search_index
 
 LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +31,10 @@ def update_org_program_and_courses_ent_sub_inclusion(org_pk, org_sub_inclusion):
     """
     Task to update an organization's child courses' and programs' enterprise subscription inclusion status upon saving
     the org object.
+
+    The inclusion of the courses, and then of their runs and programs, is recomputed with aggregate queries and only
+    the rows whose inclusion changed are updated, with a query per model and value. The search index documents of
+    the changed courses and programs are then updated in a single batch.
     Arguments:
         org_pk (int): primary key of the organization
         org_sub_inclusion (bool): whether or not the org is included in enterprise subscriptions
@@ -39,16 +49,35 @@ def update_org_program_and_courses_ent_sub_inclusion(org_pk, org_sub_inclusion):
             CourseType.CREDIT_VERIFIED_AUDIT,
             CourseType.EMPTY
         ]
-    )
+    ).annotate(
+        # A course is only included if all of its authoring organizations are.
+        has_excluded_org=Exists(Course.authoring_organizations.through.objects.filter(
+            course=OuterRef('pk'), organization__enterprise_subscription_inclusion=False,
+        )),
+    ).values_list('pk', 'enterprise_subscription_inclusion', 'has_excluded_org', 'draft', 'partner_id').distinct()
+    courses = list(courses)
     sub_tag_log = "Org: %s has been saved. Updating enterprise sub tagging logic for %s %s"
     LOGGER.info(sub_tag_log, org_pk, len(courses), 'courses')
-    course_ids = []
-    for course in courses:
-        course.enterprise_subscription_inclusion = org_sub_inclusion
-        course.save()
-        course_ids.append(course.id)
+
+    course_inclusions = {}
+    changed_course_pks = []
+    partner_ids = set()
+    for pk, inclusion, has_excluded_org, draft, partner_id in courses:
+        new_inclusion = org_sub_inclusion and not has_excluded_org
+        if inclusion != new_inclusion:
+            course_inclusions[pk] = new_inclusion
+            partner_ids.add(partner_id)
+            if not draft:
+                changed_course_pks.append(pk)
+
+    _update_ent_sub_inclusion(Course.everything.all(), course_inclusions)
+    for inclusion in (True, False):
+        CourseRun.everything.filter(
+            course__in=[pk for pk, value in course_inclusions.items() if value is inclusion]
+        ).update_enterprise_subscription_inclusion(inclusion)
+
     programs = Program.objects.filter(
-        courses__in=course_ids,
+        courses__in=list(course_inclusions),
         type__slug__in=[
             ProgramType.XSERIES,
             ProgramType.MICROMASTERS,
@@ -56,10 +85,51 @@ def update_org_program_and_courses_ent_sub_inclusion(org_pk, org_sub_inclusion):
             ProgramType.PROFESSIONAL_PROGRAM_WL,
             ProgramType.MICROBACHELORS
         ]
-    )
+    ).annotate(
+        # A program is only included if all of its courses are.
+        has_excluded_course=Exists(Program.courses.through.objects.filter(program=OuterRef('pk')).exclude(
+            course__enterprise_subscription_inclusion=True,
+        )),
+    ).values_list('pk', 'enterprise_subscription_inclusion', 'has_excluded_course', 'partner_id').distinct()
+    programs = list(programs)
     LOGGER.info(sub_tag_log, org_pk, len(programs), 'programs')
-    for program in programs:
-        program.save()
+
+    program_inclusions = {}
+    for pk, inclusion, has_excluded_course, partner_id in programs:
+        new_inclusion = not has_excluded_course
+        if inclusion != new_inclusion:
+            program_inclusions[pk] = new_inclusion
+            partner_ids.add(partner_id)
+
+    _update_ent_sub_inclusion(Program.objects.all(), program_inclusions)
+
+    if course_inclusions or program_inclusions:
+        for partner_id in partner_ids:
+            set_api_timestamp('course', partner_id)
+            set_api_timestamp('program', partner_id)
+
+    pks_by_label = {
+        label: pks for label, pks in (
+            (Course._meta.label, sorted(changed_course_pks)),
+            (Program._meta.label, sorted(program_inclusions)),
+        ) if pks
+    }
+    if pks_by_label:
+        update_search_index_task.delay(pks_by_label)
+
+
+def _update_ent_sub_inclusion(queryset, inclusions):
+    """
+    Updates the enterprise subscription inclusion, and the data modified timestamp, of the given objects.
+    Arguments:
+        queryset (QuerySet): objects whose inclusion may be updated
+        inclusions (dict): new inclusion of the objects to update, by primary key
+    """
+    now = datetime.datetime.now(pytz.UTC)
+    for inclusion in (True, False):
+        pks = [pk for pk, value in inclusions.items() if value is inclusion]
+        if pks:
+            queryset.filter(pk__in=pks).update(enterprise_subscription_inclusion=inclusion, data_modified_timestamp=now)
 
 
 def select_and_init_bulk_operation_loader(bulk_operation_task):
@@ -132,3 +202,17 @@ def process_send_course_deadline_email(course_key, course_run_key, recipients, e
     except Exception as e:
         LOGGER.error(f"Failed to send course deadline email for course {course.key}: {e}")
         raise e
+
+
+@shared_task()
+def update_search_index_task(pks_by_label):
+    """
+    Task to update the search index documents of objects saved with the DeferredSignalProcessor.
+    Arguments:
+        pks_by_label (dict): primary keys of the objects to update, by model label
+    """
+    # Objects saved from now on must be scheduled again, as they may be read before the new changes are committed.
+    cache.delete_many([
+        PENDING_UPDATE_CACHE_KEY.format(label=label, pk=pk) for label, pks in pks_by_label.items() for pk in pks
+    ])
+    update_search_index(pks_by_label)
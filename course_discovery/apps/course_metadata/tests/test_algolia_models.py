@@ -1,9 +1,12 @@
 import datetime
 from collections import ChainMap
+from unittest import mock
 
+import algoliasearch.index
 import ddt
 import factory
 import pytest
+from algoliasearch_django import get_adapter
 from django.conf import settings
 from django.contrib.sites.models import Site
 from django.test import TestCase, override_settings
@@ -12,8 +15,11 @@ from pytz import UTC
 from conftest import TEST_DOMAIN
 from course_discovery.apps.core.models import Currency, Partner
 from course_discovery.apps.core.tests.factories import PartnerFactory, SiteFactory
-from course_discovery.apps.course_metadata.algolia_models import AlgoliaProxyCourse, AlgoliaProxyProgram
+from course_discovery.apps.course_metadata.algolia_models import (
+    AlgoliaProxyCourse, AlgoliaProxyProduct, AlgoliaProxyProgram
+)
 from course_discovery.apps.course_metadata.choices import ExternalProductStatus, ProgramStatus
+from course_discovery.apps.course_metadata.index import LAST_SYNC_USER_DATA_KEY
 from course_discovery.apps.course_metadata.models import CourseRunStatus, CourseType, ProductValue, ProgramType
 from course_discovery.apps.course_metadata.tests.factories import (
     AdditionalMetadataFactory, CourseFactory, CourseRunFactory, CourseTypeFactory, DegreeAdditionalMetadataFactory,
@@ -333,6 +339,7 @@ class TestAlgoliaProxyCourse(TestAlgoliaProxyWithEdxPartner):
         assert 'Available now' in course.availability_level
         assert 'Upcoming' in course.availability_level
         assert 'Archived' in course.availability_level
+        assert course.availability_level == sorted(course.availability_level)
 
     def test_course_not_available_now_if_end_date_too_soon(self):
         course = AlgoliaProxyCourseFactory(partner=self.__class__.edxPartner)
@@ -663,6 +670,7 @@ class TestAlgoliaProxyProgram(TestAlgoliaProxyWithEdxPartner):
         assert 'Available now' in program.availability_level
         assert 'Upcoming' in program.availability_level
         assert 'Archived' in program.availability_level
+        assert program.availability_level == sorted(program.availability_level)
 
     @ddt.data('masters', 'bachelors', 'doctorate', 'license', 'certificate')
     def test_program_available_now(self, program_type_slug):
@@ -945,3 +953,38 @@ class TestAlgoliaProxyProgram(TestAlgoliaProxyWithEdxPartner):
             'translation_languages': [],
             'transcription_languages': []
         }
+
+
+@pytest.mark.django_db
+@mock.patch('course_discovery.apps.course_metadata.index.fetch_and_transform_degree_contentful_data', dict)
+@mock.patch('course_discovery.apps.course_metadata.index.fetch_and_transform_bootcamp_contentful_data', dict)
+class TestProductIndexSync(TestAlgoliaProxyWithEdxPartner):
+
+    def create_indexable_course(self):
+        course = self.create_course_with_basic_active_course_run()
+        course.authoring_organizations.add(OrganizationFactory())
+        return course
+
+    def test_sync(self):
+        """ Verify only changed records are uploaded, and records of gone or unindexable products deleted. """
+        unchanged_course = self.create_indexable_course()
+        changed_course = self.create_indexable_course()
+        unindexable_course = self.create_course_with_basic_active_course_run()
+        index = get_adapter(AlgoliaProxyProduct).model_index[0]
+        unchanged_record = index.get_raw_record(AlgoliaProxyProduct(unchanged_course, index.language))
+
+        mock_index = mock.create_autospec(algoliasearch.index.Index, instance=True)
+        with mock.patch.object(index, '_AlgoliaIndex__index', mock_index):
+            mock_index.get_settings.return_value = {}
+            mock_index.browse_all.return_value = [
+                {'objectID': unchanged_record['objectID'], 'content_hash': unchanged_record['content_hash']},
+                {'objectID': f'course-{changed_course.uuid}', 'content_hash': 'outdated'},
+                {'objectID': f'course-{unindexable_course.uuid}', 'content_hash': 'outdated'},
+                {'objectID': 'course-deleted', 'content_hash': 'outdated'},
+            ]
+            assert index.sync() == (1, 2)
+
+        records = mock_index.partial_update_objects.call_args[0][0]
+        assert [record['objectID'] for record in records] == [f'course-{changed_course.uuid}']
+        mock_index.delete_objects.assert_called_once_with([f'course-{unindexable_course.uuid}', 'course-deleted'])
+        assert LAST_SYNC_USER_DATA_KEY in mock_index.set_settings.call_args[0][0]['userData']
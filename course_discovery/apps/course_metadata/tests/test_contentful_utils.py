@@ -11,7 +11,7 @@ from testfixtures import LogCapture
 
 from course_discovery.apps.course_metadata.contentful_utils import (
     aggregate_contentful_data, fetch_and_transform_bootcamp_contentful_data, fetch_and_transform_degree_contentful_data,
-    get_contentful_cache_key, get_data_from_contentful, rich_text_to_plain_text
+    get_contentful_cache_key, get_data_from_contentful, rich_text_to_plain_text, sync_contentful_data
 )
 from course_discovery.apps.course_metadata.tests.contentful_utils.contentful_mock_data import (
     MockContenfulDegreeResponse, MockContentfulBootcampResponse, create_contentful_entry
@@ -44,19 +44,18 @@ class TestContentfulUtils(TestCase):
     @mock.patch('course_discovery.apps.course_metadata.contentful_utils.Client')
     def test_get_cached_data_from_contentful(self, mock_client):
         """
-        Test get_data_from_contentful utility with mock data.
+        Test the transformed Contentful data is cached, and then used without calling Contentful.
         """
         mock_response = MockContentfulBootcampResponse()
         mock_client.return_value.entries.return_value = MockContentfulBootcampResponse
         cache_key = get_contentful_cache_key(
             settings.BOOTCAMP_CONTENTFUL_CONTENT_TYPE)
         assert cache.get(cache_key) is None
-        _ = get_data_from_contentful(settings.BOOTCAMP_CONTENTFUL_CONTENT_TYPE)
-        assert cache.get(cache_key) is not None
+        _ = fetch_and_transform_bootcamp_contentful_data()
+        assert cache.get(cache_key) == mock_response.bootcamp_transformed_data
 
         with LogCapture(LOGGER_NAME) as log_capture:
-            contentful_data = get_data_from_contentful(
-                settings.BOOTCAMP_CONTENTFUL_CONTENT_TYPE)
+            contentful_data = fetch_and_transform_bootcamp_contentful_data()
 
             log_capture.check(
                 (
@@ -66,8 +65,37 @@ class TestContentfulUtils(TestCase):
                     f'{settings.BOOTCAMP_CONTENTFUL_CONTENT_TYPE}',
                 )
             )
-            assert len(contentful_data) == 2
-            assert contentful_data[0].uuid == mock_response.mock_contentful_bootcamp_entry.uuid
+            assert contentful_data == mock_response.bootcamp_transformed_data
+            assert mock_client.return_value.entries.call_count == 2
+
+    @mock.patch('course_discovery.apps.course_metadata.contentful_utils.refresh_contentful_snapshot')
+    @mock.patch('course_discovery.apps.course_metadata.contentful_utils.Client')
+    def test_sync_contentful_data(self, mock_client, mock_refresh):
+        """
+        Test the cached Contentful data is only refreshed when entries changed since the last sync.
+        """
+        def sync_page(items, next_page_url='', next_sync_token='token'):
+            return mock.Mock(items=items, next_page_url=next_page_url, next_sync_token=next_sync_token)
+
+        def refresh(content_type):
+            cache.set(get_contentful_cache_key(content_type), {}, timeout=None)
+
+        mock_refresh.side_effect = refresh
+        mock_client.return_value.sync.return_value = sync_page([mock.Mock()], next_page_url='next')
+        mock_client.return_value.sync.return_value.next.return_value = sync_page([])
+        assert sync_contentful_data()
+        mock_client.return_value.sync.assert_called_with({'initial': True})
+        assert mock_refresh.call_count == 2
+
+        mock_client.return_value.sync.return_value = sync_page([], next_sync_token='next-token')
+        assert not sync_contentful_data()
+        mock_client.return_value.sync.assert_called_with({'sync_token': 'token'})
+        assert mock_refresh.call_count == 2
+
+        mock_client.return_value.sync.return_value = sync_page([mock.Mock()])
+        assert sync_contentful_data()
+        mock_client.return_value.sync.assert_called_with({'sync_token': 'next-token'})
+        assert mock_refresh.call_count == 4
 
     def test_rich_text_to_plain_text(self):
         """
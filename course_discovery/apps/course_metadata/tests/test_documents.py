@@ -0,0 +1,76 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from course_discovery.apps.course_metadata.search_indexes.documents import CourseDocument, ProgramDocument
+from course_discovery.apps.course_metadata.tests import factories
+
+
+class CourseDocumentTests(TestCase):
+    """
+    Tests for the preparation of course documents.
+    """
+    VISIBLE_RUN_FIELDS = (
+        'availability', 'course_runs', 'end', 'enrollment_end', 'enrollment_start', 'languages', 'org',
+        'seat_types', 'start', 'status',
+    )
+
+    def create_courses(self, count):
+        for course in factories.CourseFactory.create_batch(count):
+            for course_run in factories.CourseRunFactory.create_batch(2, course=course):
+                factories.SeatFactory(course_run=course_run)
+
+    def count_preparation_queries(self):
+        document = CourseDocument()
+        with CaptureQueriesContext(connection) as context:
+            for course in document.get_queryset():
+                for field in self.VISIBLE_RUN_FIELDS:
+                    getattr(document, f'prepare_{field}')(course)
+        return len(context.captured_queries)
+
+    def test_visible_run_fields_use_constant_queries(self):
+        """ Verify the fields derived from visible course runs do not query per indexed course. """
+        self.create_courses(2)
+        query_count = self.count_preparation_queries()
+
+        self.create_courses(3)
+        assert self.count_preparation_queries() == query_count
+
+    def test_visible_runs_exclude_unmarketable_runs(self):
+        """ Verify only marketable course runs are prepared. """
+        course = factories.CourseFactory()
+        marketable_run = factories.CourseRunFactory(course=course)
+        factories.CourseRunFactory(course=course, type__is_marketable=False)
+
+        document = CourseDocument()
+        prepared_course = document.get_queryset().get(pk=course.pk)
+        assert document.prepare_course_runs(prepared_course) == [marketable_run.key]
+        assert document.prepare_org(prepared_course) == 'org'
+
+
+class ProgramDocumentTests(TestCase):
+    """
+    Tests for the preparation of program documents.
+    """
+    def test_course_run_fields_use_constant_queries(self):
+        """ Verify the fields derived from program course runs do not query per indexed program. """
+        def count_preparation_queries():
+            document = ProgramDocument()
+            with CaptureQueriesContext(connection) as context:
+                for program in document.get_queryset():
+                    document.prepare_language(program)
+                    document.prepare_seat_types(program)
+                    document.prepare_staff_uuids(program)
+            return len(context.captured_queries)
+
+        def create_programs(count):
+            for __ in range(count):
+                course_run = factories.CourseRunFactory(staff=[factories.PersonFactory()])
+                factories.SeatFactory(course_run=course_run)
+                factories.ProgramFactory(courses=[course_run.course])
+
+        create_programs(2)
+        query_count = count_preparation_queries()
+
+        create_programs(3)
+        assert count_preparation_queries() == query_count
@@ -29,6 +29,18 @@ class TestSearchAfterMixin(ElasticsearchTestMixin, TestCase):
         self.assertEqual(len(queryset), len(unique_items), 'Queryset contains duplicate entries.')
         self.assertEqual(len(queryset), self.total_courses)
 
+    @patch("course_discovery.apps.course_metadata.models.registry.get_documents")
+    def test_search_values_in_chunks(self, mock_get_documents):
+        """
+        Test the values of the matching courses are loaded with a query per chunk of ids fetched from Elasticsearch.
+        """
+        mock_get_documents.return_value = [CourseDocument]
+
+        with self.assertNumQueries(3):
+            keys = list(factories.CourseProxy.search_values('Course*', 'key', page_size=2, chunk_size=2))
+
+        self.assertCountEqual(keys, factories.Course.objects.values_list('key', flat=True))
+
     def test_wildcard_query_early_exit(self):
         """
         Test the early exit optimization when the query is `(*)`.
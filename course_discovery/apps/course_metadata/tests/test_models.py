@@ -41,7 +41,8 @@ from course_discovery.apps.course_metadata.models import (
     FAQ, AbstractHeadingBlurbModel, AbstractMediaModel, AbstractNamedModel, AbstractTitleDescriptionModel,
     AbstractValueModel, CorporateEndorsement, Course, CourseEditor, CourseRun, CourseRunType, CourseType, Curriculum,
     CurriculumCourseMembership, CurriculumCourseRunExclusion, CurriculumProgramMembership, DegreeCost, DegreeDeadline,
-    Endorsement, Organization, OrganizationMapping, Program, ProgramType, Ranking, Seat, SeatType, Subject, Topic
+    Endorsement, Organization, OrganizationMapping, Program, ProgramSummary, ProgramType, Ranking, Seat, SeatType,
+    Subject, Topic
 )
 from course_discovery.apps.course_metadata.publishers import (
     CourseRunMarketingSitePublisher, ProgramMarketingSitePublisher
@@ -544,6 +545,30 @@ class TestCourse(TestCase):
         )
         assert course1.enterprise_subscription_inclusion is False
 
+    def test_enterprise_subscription_inclusion__course_runs(self):
+        """ Verify the course runs are only updated when the enterprise inclusion of their course changes. """
+        org = factories.OrganizationFactory(enterprise_subscription_inclusion=True)
+        course_type = CourseType.objects.filter(slug=CourseType.VERIFIED_AUDIT).first()
+        course = factories.CourseFactory(
+            authoring_organizations=[org], enterprise_subscription_inclusion=None, type=course_type,
+        )
+        self_paced_run = factories.CourseRunFactory(course=course, pacing_type='self_paced')
+        instructor_paced_run = factories.CourseRunFactory(course=course, pacing_type='instructor_paced')
+
+        course.title = 'New title'
+        with mock.patch.object(CourseRun, 'save') as mock_save:
+            course.save()
+        mock_save.assert_not_called()
+
+        org.enterprise_subscription_inclusion = False
+        org.save()
+        course.save()
+        self_paced_run.refresh_from_db()
+        instructor_paced_run.refresh_from_db()
+        assert course.enterprise_subscription_inclusion is False
+        assert self_paced_run.enterprise_subscription_inclusion is False
+        assert instructor_paced_run.enterprise_subscription_inclusion is False
+
     @ddt.data(
         (CourseType.VERIFIED_AUDIT, True),
         (CourseType.AUDIT, True),
@@ -3359,6 +3384,68 @@ class ProgramTests(TestCase):
         expected_price_ranges = [{'currency': 'USD', 'min': Decimal(100), 'max': Decimal(600), 'total': Decimal(600)}]
         assert program.price_ranges == expected_price_ranges
 
+    def test_summary(self):
+        """ Verify summaries are built with the values of their program, and only current until it changes. """
+        program = self.create_program_with_seats()
+        assert ProgramSummary.rebuild(Program.objects.filter(pk=program.pk)) == 1
+
+        summary = Program.objects.get(pk=program.pk).current_summary
+        assert summary.get_price_ranges() == program.price_ranges
+        assert summary.weeks_to_complete_min == program.weeks_to_complete_min
+        assert summary.weeks_to_complete_max == program.weeks_to_complete_max
+        assert summary.languages == sorted(language.code for language in program.languages)
+
+        Program.objects.filter(pk=program.pk).update(data_modified_timestamp=datetime.datetime.now(pytz.UTC))
+        assert Program.objects.get(pk=program.pk).current_summary is None
+
+        # Existing summaries are replaced.
+        ProgramSummary.rebuild(Program.objects.filter(pk=program.pk))
+        assert ProgramSummary.objects.filter(program=program).count() == 1
+        assert Program.objects.get(pk=program.pk).current_summary is not None
+
+    def test_summary_expires(self):
+        """ Verify summaries are no longer current once a course run of their program ends or opens for enrollment. """
+        program = self.create_program_with_seats()
+        now = datetime.datetime.now(pytz.UTC)
+        end = now + datetime.timedelta(days=10)
+        CourseRun.objects.filter(course__in=program.courses.all()).update(
+            enrollment_start=now - datetime.timedelta(days=10), end=end
+        )
+        ProgramSummary.rebuild(Program.objects.filter(pk=program.pk))
+
+        assert ProgramSummary.objects.get(program=program).expires == end
+        assert Program.objects.get(pk=program.pk).current_summary is not None
+        with freeze_time(end + datetime.timedelta(seconds=1)):
+            assert Program.objects.get(pk=program.pk).current_summary is None
+
+    def test_summary_languages(self):
+        """ Verify summaries only hold the languages of the unrestricted course runs of their program. """
+        program = self.create_program_with_seats()
+        course = program.courses.first()
+        course.course_runs.update(language=LanguageTag.objects.get(code='en'))
+        restricted_run = factories.CourseRunFactory(course=course, language=LanguageTag.objects.get(code='es'))
+        factories.RestrictedCourseRunFactory(course_run=restricted_run)
+
+        ProgramSummary.rebuild(Program.objects.filter(pk=program.pk))
+        assert Program.objects.get(pk=program.pk).current_summary.languages == ['en']
+
+    def test_summary_official_changes(self):
+        """ Verify changes to official course runs alone leave summaries current until they are rebuilt. """
+        program = self.create_program_with_seats()
+        ProgramSummary.rebuild(Program.objects.filter(pk=program.pk))
+
+        course_run = program.courses.first().course_runs.first()
+        assert not course_run.draft
+        course_run.language = LanguageTag.objects.exclude(code=course_run.language.code).first()
+        course_run.save()
+
+        summary = Program.objects.get(pk=program.pk).current_summary
+        assert summary is not None
+        assert summary.languages != [course_run.language.code]
+
+        ProgramSummary.rebuild(Program.objects.filter(pk=program.pk))
+        assert Program.objects.get(pk=program.pk).current_summary.languages == [course_run.language.code]
+
     def test_price_ranges_multiple_course(self):
         """ Verifies the price_range property of a program with multiple courses """
         currency = Currency.objects.get(code='USD')
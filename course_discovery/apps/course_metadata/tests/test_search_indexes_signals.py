@@ -0,0 +1,92 @@
+"""
+Tests for the signal processors keeping the search indexes up to date.
+"""
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from elasticsearch_dsl.connections import connections
+
+from course_discovery.apps.course_metadata.search_indexes.documents import CourseRunDocument
+from course_discovery.apps.course_metadata.search_indexes.signals import (
+    PENDING_UPDATE_CACHE_KEY, DeferredSignalProcessor, update_search_index
+)
+from course_discovery.apps.course_metadata.tasks import update_search_index_task
+from course_discovery.apps.course_metadata.tests import factories
+
+SIGNALS_PATH = 'course_discovery.apps.course_metadata.search_indexes.signals'
+
+
+class DeferredSignalProcessorTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.processor = DeferredSignalProcessor(connections)
+        self.addCleanup(self.processor.teardown)
+
+    def test_updates_after_commit(self):
+        """ Verify saves are collected and deduplicated, and the index is updated once the transaction commits. """
+        with mock.patch(f'{SIGNALS_PATH}.update_search_index') as mock_update:
+            with self.captureOnCommitCallbacks(execute=True):
+                course_run = factories.CourseRunFactory()
+                course_run.save()
+                course_run.save()
+                assert not mock_update.called
+
+        mock_update.assert_called_once()
+        pks_by_label = mock_update.call_args[0][0]
+        assert pks_by_label['course_metadata.CourseRun'] == [course_run.pk]
+        assert course_run.course.pk in pks_by_label['course_metadata.Course']
+
+    def test_forbidden_instances_are_not_deferred(self):
+        """ Verify the checks applied by the real time processor still prevent indexing. """
+        with mock.patch(f'{SIGNALS_PATH}.update_search_index') as mock_update:
+            with self.captureOnCommitCallbacks(execute=True):
+                factories.CourseRunFactory(type__is_marketable=False)
+
+        assert 'course_metadata.CourseRun' not in mock_update.call_args[0][0]
+
+    @override_settings(ELASTICSEARCH_DSL_DEFERRED_UPDATE_COUNTDOWN=5)
+    def test_countdown_debounces_updates(self):
+        """ Verify updates are sent to a delayed task, scheduled once for objects already waiting for one. """
+        course_run = factories.CourseRunFactory()
+        with mock.patch.object(update_search_index_task, 'apply_async') as mock_apply_async:
+            with self.captureOnCommitCallbacks(execute=True):
+                course_run.save()
+            with self.captureOnCommitCallbacks(execute=True):
+                course_run.save()
+
+        mock_apply_async.assert_called_once()
+        assert mock_apply_async.call_args[1]['countdown'] == 5
+        assert mock_apply_async.call_args[1]['args'][0]['course_metadata.CourseRun'] == [course_run.pk]
+
+
+class UpdateSearchIndexTests(TestCase):
+    def test_update_search_index(self):
+        """ Verify the documents of all given objects are updated with a single request. """
+        course_runs = factories.CourseRunFactory.create_batch(3)
+        with mock.patch.object(CourseRunDocument, 'update') as mock_update:
+            update_search_index({'course_metadata.CourseRun': [course_run.pk for course_run in course_runs]})
+
+        mock_update.assert_called_once()
+        assert set(mock_update.call_args[0][0]) == set(course_runs)
+
+    def test_update_search_index_related(self):
+        """ Verify the documents related to all given objects are deduplicated and updated with a single request. """
+        course_run = factories.CourseRunFactory()
+        courses = factories.CourseFactory.create_batch(2)
+        with mock.patch(f'{SIGNALS_PATH}.registry._get_related_doc', return_value=[CourseRunDocument]), \
+                mock.patch.object(CourseRunDocument, 'get_instances_from_related', return_value=course_run), \
+                mock.patch.object(CourseRunDocument, 'update') as mock_update:
+            update_search_index({'course_metadata.Course': [course.pk for course in courses]})
+
+        mock_update.assert_called_once_with([course_run])
+
+    def test_update_search_index_task(self):
+        """ Verify the task lets the objects be scheduled again before updating their documents. """
+        key = PENDING_UPDATE_CACHE_KEY.format(label='course_metadata.CourseRun', pk=1)
+        cache.set(key, True)
+        with mock.patch('course_discovery.apps.course_metadata.tasks.update_search_index') as mock_update:
+            update_search_index_task({'course_metadata.CourseRun': [1]})
+
+        mock_update.assert_called_once_with({'course_metadata.CourseRun': [1]})
+        assert cache.get(key) is None
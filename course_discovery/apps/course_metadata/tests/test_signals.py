@@ -26,11 +26,11 @@ from course_discovery.apps.course_metadata.choices import CourseRunStatus
 from course_discovery.apps.course_metadata.models import (
     AdditionalMetadata, BackfillCourseRunSlugsConfig, BackpopulateCourseTypeConfig, BulkModifyProgramHookConfig,
     BulkOperationTask, BulkUpdateImagesConfig, BulkUploadTagsConfig, Course, CourseEditor, CourseRun,
-    CSVDataLoaderConfiguration, Curriculum, CurriculumCourseMembership, CurriculumProgramMembership, DataLoaderConfig,
-    DeduplicateHistoryConfig, Degree, DeletePersonDupsConfig, DrupalPublishUuidConfig, LevelTypeTranslation,
-    MigrateCourseSlugConfiguration, MigratePublisherToCourseMetadataConfig, ProductMeta, ProfileImageDownloadConfig,
-    Program, ProgramTypeTranslation, RemoveRedirectsConfig, SubjectTranslation, TagCourseUuidsConfig, TaxiForm,
-    TopicTranslation
+    CSVDataLoaderConfiguration, Curriculum, CurriculumCourseMembership, CurriculumProgramMembership,
+    DataLoaderCheckpoint, DataLoaderConfig, DeduplicateHistoryConfig, Degree, DeletePersonDupsConfig,
+    DrupalPublishUuidConfig, LevelTypeTranslation, MigrateCourseSlugConfiguration,
+    MigratePublisherToCourseMetadataConfig, ProductMeta, ProfileImageDownloadConfig, Program, ProgramSummary,
+    ProgramTypeTranslation, RemoveRedirectsConfig, SubjectTranslation, TagCourseUuidsConfig, TaxiForm, TopicTranslation
 )
 from course_discovery.apps.course_metadata.signals import (
     _duplicate_external_key_message, additional_metadata_facts_changed,
@@ -77,7 +77,7 @@ class TestCacheInvalidation:
                          AlgoliaProxyProgram, AlgoliaProxyProduct, ProgramTypeTranslation,
                          LevelTypeTranslation, SearchDefaultResultsConfiguration, BulkUpdateImagesConfig,
                          BulkUploadTagsConfig, CSVDataLoaderConfiguration, DeduplicateHistoryConfig,
-                         MigrateCourseSlugConfiguration]:
+                         MigrateCourseSlugConfiguration, DataLoaderCheckpoint, ProgramSummary]:
                 continue
             if 'abstract' in model.__name__.lower() or 'historical' in model.__name__.lower():
                 continue
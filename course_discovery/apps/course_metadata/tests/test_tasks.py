@@ -13,7 +13,7 @@ from testfixtures import LogCapture
 from course_discovery.apps.api.v1.tests.test_views.mixins import OAuth2Mixin
 from course_discovery.apps.course_metadata.choices import BulkOperationStatus, BulkOperationType
 from course_discovery.apps.course_metadata.models import (
-    BulkOperationTask, Course, CourseType, Organization, ProgramType
+    BulkOperationTask, Course, CourseRun, CourseType, Organization, Program, ProgramType
 )
 from course_discovery.apps.course_metadata.signals import (
     on_bulk_operation_create, update_enterprise_inclusion_for_courses_and_programs
@@ -199,6 +199,41 @@ class EnterpriseSubscriptionInclusionTests(OAuth2Mixin, TestCase):
         program.refresh_from_db()
         assert program.enterprise_subscription_inclusion is False
 
+    def test_org_enterprise_subscription_inclusion_bulk_update(self):
+        """
+        Test that toggling an org's enterprise_subscription_inclusion value updates the changed courses, course runs and
+        programs without saving them one by one, and updates the search index of the changed ones in a single batch
+        """
+        org = factories.OrganizationFactory(enterprise_subscription_inclusion=True)
+        course_type = factories.CourseTypeFactory(slug=CourseType.VERIFIED_AUDIT)
+        courses = factories.CourseFactory.create_batch(3, enterprise_subscription_inclusion=True, type=course_type)
+        excluded_course = factories.CourseFactory(enterprise_subscription_inclusion=False, type=course_type)
+        for course in courses + [excluded_course]:
+            course.authoring_organizations.add(org)
+            factories.CourseRunFactory(course=course, pacing_type='self_paced')
+
+        program_type = factories.ProgramTypeFactory(slug=ProgramType.XSERIES)
+        program = factories.ProgramFactory(enterprise_subscription_inclusion=True, type=program_type)
+        program.courses.add(courses[0])
+
+        org.enterprise_subscription_inclusion = False
+        org.save()
+
+        with mock.patch.object(Course, 'save') as mock_course_save, \
+                mock.patch.object(Program, 'save') as mock_program_save, \
+                mock.patch(f'{LOGGER_PATH}.update_search_index_task.delay') as mock_update_search_index:
+            update_org_program_and_courses_ent_sub_inclusion(org.id, org.enterprise_subscription_inclusion)
+
+        mock_course_save.assert_not_called()
+        mock_program_save.assert_not_called()
+        mock_update_search_index.assert_called_once_with({
+            Course._meta.label: sorted(course.pk for course in courses),
+            Program._meta.label: [program.pk],
+        })
+        assert not CourseRun.everything.filter(course__in=courses, enterprise_subscription_inclusion=True).exists()
+        program.refresh_from_db()
+        assert program.enterprise_subscription_inclusion is False
+
 
 class ProcessSendCourseDeadlineEmailTaskTests(TestCase):
     """
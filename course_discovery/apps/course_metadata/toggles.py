@@ -89,3 +89,16 @@ IS_COURSE_RUN_VARIANT_ID_ECOMMERCE_CONSUMABLE = WaffleSwitch(
 IS_COURSE_RUN_FOR_DUMMY_SKU_GENERATION = WaffleSwitch(
     'course_metadata.is_dummy_sku_generation', __name__
 )
+
+# .. toggle_name: course_metadata.courses_api_data_loader__bulk_write
+# .. toggle_implementation: WaffleSwitch
+# .. toggle_default: False
+# .. toggle_description: Enable to make the Courses API data loader fetch the course runs of every page of the API
+#     with a single query, and save the runs whose updates have no side effects with bulk updates.
+# .. toggle_use_cases: open_edx
+# .. toggle_creation_date: 2026-10-17
+# .. toggle_target_removal_date: None
+# .. toggle_tickets: None
+COURSES_API_DATA_LOADER__BULK_WRITE = WaffleSwitch(
+    'course_metadata.courses_api_data_loader__bulk_write', __name__
+)
@@ -0,0 +1,216 @@
+"""
+Bulk indexing pipeline used to populate Elasticsearch indices.
+
+The default population in django-elasticsearch-dsl fetches and prepares every document in the command's
+own process, from a single queryset iterator, before the bulk requests are sent. Preparing documents is
+the SQL and CPU heavy part of indexing, so the pipeline below splits the indexed queryset into pk ranges
+which worker processes fetch and prepare concurrently, and streams the prepared documents to
+Elasticsearch through `helpers.parallel_bulk`.
+"""
+import concurrent.futures
+import logging
+import multiprocessing
+import time
+from collections import deque
+from contextlib import ExitStack
+
+from django.db import connections
+from elasticsearch.helpers import parallel_bulk
+from elasticsearch_dsl.connections import get_connection
+
+logger = logging.getLogger(__name__)
+
+
+class StageStats:
+    """
+    Throughput of a single stage of the indexing pipeline.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.seconds = 0.0
+
+    def add(self, count, seconds):
+        self.count += count
+        self.seconds += seconds
+
+    @property
+    def rate(self):
+        return self.count / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return '{}: {} docs in {:.2f}s ({:.1f} docs/s)'.format(self.name, self.count, self.seconds, self.rate)
+
+
+def prepare_partition(document_class, index_name, first_pk, last_pk):
+    """
+    Fetches and prepares the documents whose pk is within the given (inclusive) range.
+
+    Runs in the worker processes of `IndexingPipeline`, which are started without an open
+    database connection, so that each of them opens its own.
+
+    Returns:
+        tuple: The bulk actions, the seconds spent fetching rows and the seconds spent preparing documents.
+    """
+    document = document_class()
+    started = time.perf_counter()
+    objects = list(document.get_queryset().filter(pk__gte=first_pk, pk__lte=last_pk))
+    fetched = time.perf_counter()
+    actions = [
+        {
+            '_op_type': 'index',
+            '_index': index_name,
+            '_id': document.generate_id(obj),
+            '_source': document.prepare(obj),
+        }
+        for obj in objects if document.should_index_object(obj)
+    ]
+    return actions, fetched - started, time.perf_counter() - fetched
+
+
+class IndexingPipeline:
+    """
+    Populates the index of a document with concurrently prepared documents.
+
+    The indexed queryset is partitioned into pk ranges of `partition_size` rows. Up to `workers`
+    processes fetch and prepare the partitions, at most `queue_size` of which are prepared ahead of
+    the bulk requests, and `bulk_threads` threads send the prepared documents in bulk requests of
+    `chunk_size` documents. With a single worker the partitions are prepared in the command's process.
+    """
+
+    def __init__(self, document_class, workers, partition_size, chunk_size, bulk_threads, queue_size=None):
+        self.document_class = document_class
+        self.workers = workers
+        self.partition_size = partition_size
+        self.chunk_size = chunk_size
+        self.bulk_threads = bulk_threads
+        self.queue_size = queue_size or workers * 2
+        self.fetch_stats = StageStats('SQL fetch')
+        self.prepare_stats = StageStats('Prepare')
+        self.bulk_stats = StageStats('Bulk send')
+        self.wait_seconds = 0.0
+
+    @property
+    def index_name(self):
+        return self.document_class._index._name  # pylint: disable=protected-access
+
+    def get_partitions(self):
+        """
+        Yields (first_pk, last_pk) ranges each covering up to `partition_size` indexed rows.
+        """
+        pks = (
+            self.document_class().get_queryset()
+            .prefetch_related(None)
+            .order_by('pk')
+            .values_list('pk', flat=True)
+        )
+        first_pk = last_pk = None
+        count = 0
+        for pk in pks.iterator(chunk_size=self.partition_size):
+            if first_pk is None:
+                first_pk = pk
+            last_pk = pk
+            count += 1
+            if count == self.partition_size:
+                yield first_pk, last_pk
+                first_pk, count = None, 0
+
+        if first_pk is not None:
+            yield first_pk, last_pk
+
+    def _record_partition(self, result):
+        actions, fetch_seconds, prepare_seconds = result
+        self.fetch_stats.add(len(actions), fetch_seconds)
+        self.prepare_stats.add(len(actions), prepare_seconds)
+        return actions
+
+    def _generate_serial_actions(self):
+        for first_pk, last_pk in self.get_partitions():
+            yield from self._record_partition(
+                prepare_partition(self.document_class, self.index_name, first_pk, last_pk)
+            )
+
+    def _start_parallel_actions(self, stack):
+        """
+        Starts preparing the partitions in worker processes, and returns an iterator over their actions.
+
+        This runs in the calling thread, before `parallel_bulk` starts the threads consuming the actions.
+        The partition boundaries are fetched upfront, so that every database connection of the thread can
+        be closed before the workers are forked, which the first submission does for all of them. No
+        connection is then shared with them: each worker opens its own the first time it queries the
+        database, and so does the command once it needs one again.
+        """
+        partitions = iter(list(self.get_partitions()))
+        connections.close_all()
+        executor = stack.enter_context(concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context('fork')
+        ))
+        pending = deque()
+
+        def submit_next():
+            partition = next(partitions, None)
+            if partition is not None:
+                pending.append(executor.submit(prepare_partition, self.document_class, self.index_name, *partition))
+
+        for __ in range(self.queue_size):
+            submit_next()
+        return self._generate_parallel_actions(pending, submit_next)
+
+    def _generate_parallel_actions(self, pending, submit_next):
+        while pending:
+            waiting_started = time.perf_counter()
+            result = pending.popleft().result()
+            self.wait_seconds += time.perf_counter() - waiting_started
+            submit_next()
+            yield from self._record_partition(result)
+
+    def generate_actions(self, stack):
+        """
+        Returns an iterator over the bulk actions, whose workers, if any, are shut down by the given ExitStack.
+        """
+        if self.workers > 1:
+            return self._start_parallel_actions(stack)
+        return self._generate_serial_actions()
+
+    def run(self, refresh=None):
+        """
+        Populates the index and logs the throughput of every stage.
+
+        Returns:
+            int: Number of indexed documents.
+        """
+        es_connection = get_connection()
+        started = time.perf_counter()
+        indexed = 0
+        with ExitStack() as stack:
+            for __ in parallel_bulk(
+                es_connection,
+                self.generate_actions(stack),
+                chunk_size=self.chunk_size,
+                thread_count=self.bulk_threads,
+                queue_size=self.bulk_threads,
+            ):
+                indexed += 1
+
+        if refresh:
+            es_connection.indices.refresh(index=self.index_name)
+
+        # Bulk requests are sent while documents are being prepared, so the send rate is the rate
+        # at which the index received documents over the whole run, excluding the time spent
+        # waiting for the workers.
+        self.bulk_stats.add(indexed, time.perf_counter() - started - self.wait_seconds)
+        logger.info(
+            'Indexed %d %s documents into [%s] in %.2fs with %d worker(s). %s; %s (per worker); '
+            '%s (per worker); waited %.2fs on workers.',
+            indexed,
+            self.document_class.django.model.__name__,
+            self.index_name,
+            time.perf_counter() - started,
+            self.workers,
+            self.bulk_stats,
+            self.fetch_stats,
+            self.prepare_stats,
+            self.wait_seconds,
+        )
+        return indexed
@@ -3,14 +3,19 @@ import logging
 import time
 from collections import namedtuple
 
+import pytz
 from django.conf import settings
 from django.core.management import CommandError
 from django_elasticsearch_dsl.management.commands.search_index import Command as DjangoESDSLCommand
 from django_elasticsearch_dsl.registries import registry
+from elasticsearch.helpers import scan
 from elasticsearch_dsl import Mapping
 from elasticsearch_dsl.connections import get_connection
 
+from course_discovery.apps.api.cache_warming import warm_api_cache_after_data_load
 from course_discovery.apps.core.utils import ElasticsearchUtils
+from course_discovery.apps.edx_elasticsearch_dsl_extensions.indexing import IndexingPipeline
+from course_discovery.apps.edx_elasticsearch_dsl_extensions.query_cache import bump_search_index_generation
 
 OLD_AND_NEW_INDEX_NAMES = slice(2, 4)
 
@@ -44,6 +49,31 @@ class Command(DjangoESDSLCommand):
             help='Run populate/rebuild update single threaded'
         )
         parser.set_defaults(parallel=getattr(settings, 'ELASTICSEARCH_DSL_PARALLEL', False))
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=settings.ELASTICSEARCH_DSL_INDEXING_WORKERS,
+            help='Populate new indices through the indexing pipeline, preparing documents in this many '
+                 'processes. 0 uses the default django-elasticsearch-dsl population.'
+        )
+        parser.add_argument(
+            '--partition-size',
+            type=int,
+            default=settings.ELASTICSEARCH_DSL_INDEXING_PARTITION_SIZE,
+            help='Number of records fetched and prepared at once by a worker of the indexing pipeline.'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=settings.ELASTICSEARCH_DSL_INDEXING_CHUNK_SIZE,
+            help='Number of documents per bulk request sent by the indexing pipeline.'
+        )
+        parser.add_argument(
+            '--bulk-threads',
+            type=int,
+            default=settings.ELASTICSEARCH_DSL_INDEXING_BULK_THREADS,
+            help='Number of bulk requests the indexing pipeline keeps in flight.'
+        )
         parser.add_argument(
             '--refresh',
             action='store_true',
@@ -62,6 +92,13 @@ class Command(DjangoESDSLCommand):
             '--disable-change-limit', action='store_true', dest='disable_change_limit',
             help='Disables checks limiting the number of records modified.'
         )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            dest='incremental',
+            help='Update the live indices in place with the records changed since the last update, '
+                 'instead of rebuilding them from scratch.'
+        )
         parser.add_argument(
             '-u',
             '--using',
@@ -84,7 +121,12 @@ class Command(DjangoESDSLCommand):
 
         self.backends = (specified_backend,) if specified_backend else supported_backends
         models = self._get_models(options['models'])
-        self._update(models, options)
+        if options.get('incremental'):
+            self._incremental_update(models, options)
+        else:
+            self._update(models, options)
+
+        warm_api_cache_after_data_load()
 
     def _update(self, models, options):
         """
@@ -107,6 +149,9 @@ class Command(DjangoESDSLCommand):
         conn = get_connection()
         while indexes_pending and run_attempts < 1:  # Only try once, as retries gave buggy results. See VAN-391
             run_attempts += 1
+            # Anything modified after this moment may have been missed by the population, so it is
+            # recorded as the starting point for the next incremental update.
+            indexing_started = datetime.datetime.now(pytz.UTC)
             self._populate(models, options)
             for doc, __, new_index_name, alias, record_count in alias_mappings:
                 # Run a sanity check to ensure we aren't drastically changing the
@@ -118,22 +163,97 @@ class Command(DjangoESDSLCommand):
                     if record_count_is_sane:
                         ElasticsearchUtils.set_alias(conn, alias, new_index_name)
                         ElasticsearchUtils.update_max_result_window(conn, settings.MAX_RESULT_WINDOW, new_index_name)
+                        ElasticsearchUtils.set_high_water_mark(conn, new_index_name, indexing_started)
                         indexes_pending.pop(new_index_name, None)
                     else:
                         indexes_pending[new_index_name] = index_info_string
                 else:
                     ElasticsearchUtils.set_alias(conn, alias, new_index_name)
                     ElasticsearchUtils.update_max_result_window(conn, settings.MAX_RESULT_WINDOW, new_index_name)
+                    ElasticsearchUtils.set_high_water_mark(conn, new_index_name, indexing_started)
                     indexes_pending.pop(new_index_name, None)
 
         for index_alias_mapper in alias_mappings:
             index_alias_mapper.registered_index._name = index_alias_mapper.alias  # pylint: disable=protected-access
+        bump_search_index_generation()
 
         if indexes_pending:
             raise CommandError('Sanity check failed for the new index(es): {}'.format(indexes_pending))
 
         return True
 
+    def _incremental_update(self, models, options):
+        """
+        Update the live indices in place.
+
+        Only the records changed since the high-water mark stored in each index are prepared and
+        upserted, and the documents whose records are gone or no longer visible are deleted.
+        """
+        conn = get_connection()
+        for document in registry.get_documents(models):
+            # pylint: disable=protected-access
+            alias = ElasticsearchUtils.get_alias_by_index_name(document._index._name)
+            high_water_mark = ElasticsearchUtils.get_high_water_mark(conn, alias)
+            if high_water_mark is None:
+                raise CommandError(
+                    'Index [{}] has no high-water mark. Run a full update before an incremental one.'.format(alias)
+                )
+
+            indexing_started = datetime.datetime.now(pytz.UTC)
+            doc = document()
+            changed_queryset = doc.get_changed_queryset(high_water_mark)
+            self.stdout.write("Indexing {} '{}' objects changed since {}{}".format(
+                changed_queryset.count() if options['count'] else 'all',
+                document.django.model.__name__,
+                high_water_mark.isoformat(),
+                ' (parallel)' if options['parallel'] else '',
+            ))
+            doc.update(
+                changed_queryset.iterator(chunk_size=document.django.queryset_pagination),
+                parallel=options['parallel'],
+                refresh=options['refresh'],
+            )
+
+            stale_ids = self.get_stale_document_ids(conn, doc, alias)
+            self.stdout.write("Deleting {} stale '{}' documents".format(
+                len(stale_ids), document.django.model.__name__
+            ))
+            if stale_ids:
+                doc.bulk(
+                    ({'_op_type': 'delete', '_index': alias, '_id': _id} for _id in stale_ids),
+                    refresh=options['refresh'],
+                )
+
+            ElasticsearchUtils.set_high_water_mark(conn, alias, indexing_started)
+
+        bump_search_index_generation()
+
+    @staticmethod
+    def get_stale_document_ids(conn, doc, index):
+        """ Return ids of the documents in the index whose records are deleted or no longer indexable. """
+        indexed_ids = {hit['_id'] for hit in scan(conn, index=index, query={'_source': False})}
+        visible_ids = {
+            str(pk) for pk in doc.get_queryset().prefetch_related(None).values_list('pk', flat=True).iterator()
+        }
+        return indexed_ids - visible_ids
+
+    def _populate(self, models, options):
+        if not options.get('workers'):
+            super()._populate(models, options)
+            return
+
+        for document in registry.get_documents(models):
+            self.stdout.write("Indexing '{}' objects with {} worker(s)".format(
+                document.django.model.__name__, options['workers']
+            ))
+            IndexingPipeline(
+                document,
+                workers=options['workers'],
+                partition_size=options['partition_size'],
+                chunk_size=options['chunk_size'],
+                bulk_threads=options['bulk_threads'],
+            ).run(refresh=options['refresh'])
+
     @staticmethod
     def percentage_change(current, previous):
         if current == previous:
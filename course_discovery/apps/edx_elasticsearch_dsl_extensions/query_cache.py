@@ -0,0 +1,93 @@
+"""
+Cache of resolved Elasticsearch queries.
+
+Catalogs resolve the same few query strings to the same primary keys on every request. The values a query
+resolves to are cached, compressed, under a key made of the normalized query and the current generation
+of the search indexes. The generation is changed whenever the indexes are updated, be it by `update_index`
+switching aliases or by signals updating documents, which makes every resolved query stale at once.
+
+A single generation is shared by every index, as updating a document also updates the documents related
+to it in other indexes.
+"""
+import hashlib
+import logging
+import zlib
+from array import array
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+GENERATION_CACHE_KEY = 'search_index_generation'
+QUERY_VALUES_CACHE_KEY = 'search_query_values:{index}:{generation}:{field}:{query_hash}'
+
+
+def get_search_index_generation():
+    """
+    Returns the current generation of the search indexes.
+    """
+    return cache.get_or_set(GENERATION_CACHE_KEY, lambda: uuid4().hex, None)
+
+
+def bump_search_index_generation():
+    """
+    Starts a new generation of the search indexes, so that queries resolved before are resolved again.
+    """
+    cache.set(GENERATION_CACHE_KEY, uuid4().hex, None)
+
+
+def normalize_query(query):
+    return ' '.join(query.split())
+
+
+def compress_values(values):
+    """
+    Compresses the given values, either integers stored as a sorted array, or sorted newline separated text.
+    """
+    values = sorted(values)
+    if all(isinstance(value, int) for value in values):
+        return 'int', zlib.compress(array('q', values).tobytes())
+    return 'str', zlib.compress('\n'.join(values).encode('utf-8'))
+
+
+def decompress_values(kind, data):
+    data = zlib.decompress(data)
+    if kind == 'int':
+        values = array('q')
+        values.frombytes(data)
+        return frozenset(values)
+    return frozenset(data.decode('utf-8').split('\n')) if data else frozenset()
+
+
+def get_query_values(document, query, field, resolve):
+    """
+    Returns the values of a field of the documents matching a query, resolving the query only if it is not cached.
+
+    Arguments:
+        document (Document): Document class searched by the query.
+        query (str): Query string.
+        field (str): Name of the field whose values are returned (e.g. `pk` or `key`).
+        resolve (callable): Function returning the values of the field of the documents matching the query.
+            It is only called when the values are not cached yet.
+
+    Returns:
+        frozenset
+    """
+    query_hash = hashlib.md5(normalize_query(query).encode('utf-8')).hexdigest()
+    cache_key = QUERY_VALUES_CACHE_KEY.format(
+        index=document._index._name,  # pylint: disable=protected-access
+        generation=get_search_index_generation(),
+        field=field,
+        query_hash=query_hash,
+    )
+
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return decompress_values(*cached)
+
+    values = frozenset(resolve())
+    cache.set(cache_key, compress_values(values), settings.SEARCH_QUERY_CACHE_TIMEOUT)
+    logger.debug('Cached %d values of [%s] for query "%s".', len(values), field, query)
+    return values
@@ -0,0 +1,62 @@
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from course_discovery.apps.core.tests.mixins import ElasticsearchTestMixin
+from course_discovery.apps.course_metadata.models import CourseRun
+from course_discovery.apps.course_metadata.search_indexes.documents import CourseRunDocument
+from course_discovery.apps.course_metadata.tests.factories import CourseRunFactory
+from course_discovery.apps.edx_elasticsearch_dsl_extensions.indexing import IndexingPipeline, StageStats
+from course_discovery.apps.edx_elasticsearch_dsl_extensions.tests.mixins import SearchIndexTestMixin
+
+
+class StageStatsTests(TestCase):
+    def test_rate(self):
+        stats = StageStats('Prepare')
+        assert stats.rate == 0.0
+
+        stats.add(10, 2)
+        stats.add(20, 1)
+        assert stats.rate == 10.0
+        assert str(stats) == 'Prepare: 30 docs in 3.00s (10.0 docs/s)'
+
+
+@override_settings(ELASTICSEARCH_DSL_SIGNAL_PROCESSOR='django_elasticsearch_dsl.signals.BaseSignalProcessor')
+class IndexingPipelineTests(ElasticsearchTestMixin, SearchIndexTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        CourseRunFactory.create_batch(5)
+        self.pipeline = IndexingPipeline(CourseRunDocument, workers=1, partition_size=2, chunk_size=2, bulk_threads=2)
+
+    def test_get_partitions(self):
+        """ Verify the indexed records are split into contiguous pk ranges of at most partition_size records. """
+        pks = sorted(CourseRun.objects.values_list('pk', flat=True))
+        assert list(self.pipeline.get_partitions()) == [(pks[0], pks[1]), (pks[2], pks[3]), (pks[4], pks[4])]
+
+    def test_run(self):
+        """ Verify every record is indexed and the throughput of each stage is recorded. """
+        assert self.pipeline.run(refresh=True) == 5
+        assert CourseRunDocument.search().count() == 5
+        for stats in (self.pipeline.fetch_stats, self.pipeline.prepare_stats, self.pipeline.bulk_stats):
+            assert stats.count == 5
+
+    def test_update_index_with_workers(self):
+        """ Verify update_index populates the new indices through the pipeline when workers are requested. """
+        call_command('update_index', workers=1, disable_change_limit=True, refresh=True)
+
+        assert CourseRunDocument.search().count() == 5
+
+
+@override_settings(ELASTICSEARCH_DSL_SIGNAL_PROCESSOR='django_elasticsearch_dsl.signals.BaseSignalProcessor')
+class ParallelIndexingPipelineTests(ElasticsearchTestMixin, SearchIndexTestMixin, TransactionTestCase):
+    # The records are committed, so that the worker processes can read them.
+
+    def test_run(self):
+        """ Verify the documents prepared by every worker are indexed, and the stats of the workers are merged. """
+        CourseRunFactory.create_batch(5)
+        pipeline = IndexingPipeline(CourseRunDocument, workers=2, partition_size=2, chunk_size=2, bulk_threads=2)
+
+        assert pipeline.run(refresh=True) == 5
+        assert CourseRunDocument.search().count() == 5
+        for stats in (pipeline.fetch_stats, pipeline.prepare_stats, pipeline.bulk_stats):
+            assert stats.count == 5
+            assert stats.seconds > 0
@@ -0,0 +1,37 @@
+from unittest import mock
+
+import ddt
+from django.test import TestCase
+
+from course_discovery.apps.course_metadata.search_indexes.documents import CourseDocument
+from course_discovery.apps.edx_elasticsearch_dsl_extensions.query_cache import (
+    bump_search_index_generation, compress_values, decompress_values, get_query_values
+)
+
+
+@ddt.ddt
+class QueryCacheTests(TestCase):
+    @ddt.data(
+        [3, 1, 2],
+        ['course-v1:edX+DemoX+Demo_Course', 'edX/DemoX/Demo_Course'],
+        [],
+    )
+    def test_compress_values(self, values):
+        assert decompress_values(*compress_values(values)) == frozenset(values)
+
+    def test_get_query_values(self):
+        """ Verify queries are only resolved again once the generation changes, whatever their spacing. """
+        resolve = mock.Mock(return_value=[1, 2])
+        assert get_query_values(CourseDocument, 'title:abc*', 'pk', resolve) == {1, 2}
+        assert get_query_values(CourseDocument, ' title:abc* ', 'pk', resolve) == {1, 2}
+        assert resolve.call_count == 1
+
+        bump_search_index_generation()
+        assert get_query_values(CourseDocument, 'title:abc*', 'pk', resolve) == {1, 2}
+        assert resolve.call_count == 2
+
+    def test_errors_not_cached(self):
+        resolve = mock.Mock(side_effect=[ValueError, [1]])
+        with self.assertRaises(ValueError):
+            get_query_values(CourseDocument, 'title:abc*', 'pk', resolve)
+        assert get_query_values(CourseDocument, 'title:abc*', 'pk', resolve) == {1}
@@ -1,12 +1,17 @@
+import datetime
 from unittest import mock
 
 import pytest
+import pytz
 from django.conf import settings
 from django.core.management import CommandError, call_command
 from django.test import TestCase, override_settings
 from freezegun import freeze_time
 
 from course_discovery.apps.core.tests.mixins import ElasticsearchTestMixin
+from course_discovery.apps.core.utils import ElasticsearchUtils
+from course_discovery.apps.course_metadata.models import CourseRun
+from course_discovery.apps.course_metadata.search_indexes.documents import CourseRunDocument
 from course_discovery.apps.course_metadata.tests.factories import CourseRunFactory, PersonFactory, ProgramFactory
 from course_discovery.apps.edx_elasticsearch_dsl_extensions.tests.mixins import SearchIndexTestMixin
 
@@ -65,3 +70,43 @@ class UpdateIndexTests(ElasticsearchTestMixin, SearchIndexTestMixin, TestCase):
                         'update_index.Command.sanity_check_new_index') as mock_sanity_check_new_index:
             call_command('update_index', disable_change_limit=True)
             assert not mock_sanity_check_new_index.called
+
+    def test_handle_sets_high_water_mark(self):
+        """ Verify a full update records when the population started on every new index. """
+        with freeze_time('2016-06-21'):
+            call_command('update_index', disable_change_limit=True)
+
+        for alias in settings.ELASTICSEARCH_INDEX_NAMES.values():
+            assert ElasticsearchUtils.get_high_water_mark(self.conn, alias) == datetime.datetime(
+                2016, 6, 21, tzinfo=pytz.UTC
+            )
+
+    def test_incremental_without_high_water_mark(self):
+        """ Verify an incremental update refuses to run against an index never fully updated. """
+        call_command('search_index', '--delete', '-f')
+        call_command('search_index', '--create')
+
+        with pytest.raises(CommandError):
+            call_command('update_index', incremental=True)
+
+    def test_incremental(self):
+        """ Verify an incremental update upserts changed records and deletes stale ones in the live index. """
+        with freeze_time('2016-06-20'):
+            unchanged_run, deleted_run = CourseRunFactory.create_batch(2)
+        with freeze_time('2016-06-21'):
+            call_command('update_index', disable_change_limit=True)
+        CourseRun.objects.filter(pk=unchanged_run.pk).update(title='Not reindexed')
+        deleted_run.delete()
+        new_run = CourseRunFactory()
+
+        with mock.patch('course_discovery.apps.edx_elasticsearch_dsl_extensions.management.commands.'
+                        'update_index.Command._update') as mock_update:
+            call_command('update_index', incremental=True, refresh=True)
+            assert not mock_update.called
+
+        indexed = {hit.meta.id: hit for hit in CourseRunDocument.search().execute()}
+        assert set(indexed) == {str(unchanged_run.pk), str(new_run.pk)}
+        assert indexed[str(unchanged_run.pk)].title == unchanged_run.title
+        alias = CourseRunDocument._index._name  # pylint: disable=protected-access
+        high_water_mark = ElasticsearchUtils.get_high_water_mark(self.conn, alias)
+        assert high_water_mark > datetime.datetime(2016, 6, 21, tzinfo=pytz.UTC)
@@ -13,8 +13,14 @@ settings.
 For a more detailed explanation of the implementation and thinking behind this provider can be found at
 https://openedx.atlassian.net/wiki/spaces/SOL/pages/1814922129/Platform+Agnostic+Implementation+of+Taxonomy+Application
 """
+import concurrent.futures
+import hashlib
+import json
+
 from django.conf import settings
+from django.core.cache import cache
 from django.utils.translation import gettext_lazy as _
+from edx_django_utils.cache import get_cache_key
 from edx_django_utils.db import chunked_queryset
 from taxonomy.providers import (
     CourseMetadataProvider, CourseRunContent, CourseRunMetadataProvider, ProgramMetadataProvider, XBlockContent,
@@ -185,6 +191,7 @@ class DiscoveryXBlockMetadataProvider(XBlockMetadataProvider):
     """
     Discovery xblock provider.
     """
+    METADATA_FETCH_WORKERS = 8
 
     def __init__(self):
         """
@@ -216,21 +223,76 @@ class DiscoveryXBlockMetadataProvider(XBlockMetadataProvider):
                 content_list.append(content_text)
         return content_list
 
-    def _combine_text_data(self, cur_block, all_blocks):
+    def _get_blocks_content(self, blocks):
+        """
+        Fetches the content of the given blocks concurrently, with up to `METADATA_FETCH_WORKERS` requests at once.
+
+        Returns:
+            dict: Content list of every block, by block id.
+        """
+        def get_block_content(block):
+            return block['id'], self._get_block_content(block['id'], block.get('type'))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.METADATA_FETCH_WORKERS) as executor:
+            return dict(executor.map(get_block_content, blocks))
+
+    def _combine_text_data(self, cur_block, all_blocks, contents=None, combined=None):
         """
         Recursively combines content values in all children blocks.
+
+        Content of the blocks is taken from `contents` when it has been fetched already, and the combined
+        content of every block is memoized in `combined`, so that no subtree is combined more than once.
         """
         block_id = cur_block.get('id')
+        if combined is not None and block_id in combined:
+            return combined[block_id]
+
         block_type = cur_block.get('type')
         content_list = []
         if block_id:
-            content_list = self._get_block_content(block_id, block_type)
+            if contents is not None and block_id in contents:
+                content_list = list(contents[block_id])
+            else:
+                content_list = self._get_block_content(block_id, block_type)
         for child in cur_block.get('children', []):
             child_block = all_blocks.get(child)
             if child_block:
-                content_list.extend(self._combine_text_data(child_block, all_blocks))
+                content_list.extend(self._combine_text_data(child_block, all_blocks, contents, combined))
         # return ordered unique list of content.
-        return list(dict.fromkeys(content_list))
+        content_list = list(dict.fromkeys(content_list))
+        if combined is not None and block_id:
+            combined[block_id] = content_list
+        return content_list
+
+    def _get_supported_xblocks(self, all_blocks):
+        """
+        Returns the XBlockContent of the supported blocks among the given ones.
+
+        The metadata of the supported blocks and of all their descendants is fetched concurrently first, and
+        then combined once per block.
+        """
+        supported_blocks = [
+            block for block in all_blocks.values() if block['type'] in settings.TAXONOMY_XBLOCK_SUPPORTED_TYPES
+        ]
+
+        descendants = {}
+        pending = list(supported_blocks)
+        while pending:
+            block = pending.pop()
+            if block.get('id') and block['id'] not in descendants:
+                descendants[block['id']] = block
+                pending.extend(filter(None, (all_blocks.get(child) for child in block.get('children', []))))
+
+        contents = self._get_blocks_content(descendants.values())
+        combined = {}
+        return [
+            XBlockContent(
+                key=block.get('id'),
+                content_type=block.get('type'),
+                content='\n'.join(self._combine_text_data(block, all_blocks, contents, combined)),
+            )
+            for block in supported_blocks
+        ]
 
     def get_xblocks(self, xblock_ids):
         """
@@ -241,27 +303,25 @@ class DiscoveryXBlockMetadataProvider(XBlockMetadataProvider):
         blocks_data = set()
         for block_id in xblock_ids:
             all_blocks = self.client.get_blocks_data(block_id) or {}
-            for block in all_blocks.values():
-                if block['type'] in settings.TAXONOMY_XBLOCK_SUPPORTED_TYPES:
-                    content = '\n'.join(self._combine_text_data(block, all_blocks))
-                    blocks_data.add(XBlockContent(
-                        key=block.get('id'),
-                        content_type=block.get('type'),
-                        content=content,
-                    ))
+            blocks_data.update(self._get_supported_xblocks(all_blocks))
         return list(blocks_data)
 
     def get_all_xblocks_in_course(self, course_id: str):
         """
         Get iterator for all unit/video xblocks in course
+
+        The xblocks of a course are cached for `TAXONOMY_XBLOCK_CONTENT_CACHE_TIMEOUT` seconds, under the digest of
+        the course blocks, which stands for the version of the course as the LMS does not return it. The digest
+        only changes along with the structure of the course, so edits to the text of its blocks are picked up
+        once the cached xblocks expire.
         """
         blocks = self.client.get_course_blocks_data(course_id) or {}
+        blocks_digest = hashlib.md5(json.dumps(blocks, sort_keys=True).encode('utf-8')).hexdigest()
+        cache_key = get_cache_key(resource='xblock_contents', course_id=course_id, blocks_digest=blocks_digest)
+
+        xblocks = cache.get(cache_key)
+        if xblocks is None:
+            xblocks = self._get_supported_xblocks(blocks)
+            cache.set(cache_key, xblocks, settings.TAXONOMY_XBLOCK_CONTENT_CACHE_TIMEOUT)
 
-        for block in blocks.values():
-            if block['type'] in settings.TAXONOMY_XBLOCK_SUPPORTED_TYPES:
-                content = '\n'.join(self._combine_text_data(block, blocks))
-                yield XBlockContent(
-                    key=block.get('id'),
-                    content_type=block.get('type'),
-                    content=content,
-                )
+        yield from xblocks
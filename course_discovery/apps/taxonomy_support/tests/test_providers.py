@@ -29,7 +29,7 @@ from urllib.parse import urljoin
 
 from django.conf import settings
 from django.test import TestCase
-from taxonomy.providers import CourseRunContent
+from taxonomy.providers import CourseRunContent, XBlockContent
 from taxonomy.providers.utils import (
     get_course_metadata_provider, get_course_run_metadata_provider, get_xblock_metadata_provider
 )
@@ -143,6 +143,32 @@ class TaxonomyIntegrationTests(TestCase, LMSAPIClientMixin):
         xblocks = provider.get_xblocks(block_ids)
         assert 'Should not be included in tagging content.' not in xblocks[0].content
 
+    def test_get_all_xblocks_in_course(self):
+        """
+        Test the metadata of each block is fetched once, and the xblocks of a course are cached.
+        """
+        PartnerFactory.create(id=settings.DEFAULT_PARTNER_ID)
+        provider = get_xblock_metadata_provider()
+        blocks = {
+            'vertical': {'id': 'vertical', 'type': 'vertical', 'children': ['video', 'html']},
+            'video': {'id': 'video', 'type': 'video'},
+            'html': {'id': 'html', 'type': 'html'},
+        }
+
+        def get_blocks_metadata(block_id):
+            return {'index_dictionary': {'content': {'display_name': block_id}}}
+
+        with mock.patch.object(provider.client, 'get_course_blocks_data', return_value=blocks), \
+                mock.patch.object(provider.client, 'get_blocks_metadata', side_effect=get_blocks_metadata) as mock_get:
+            xblocks = list(provider.get_all_xblocks_in_course('course-v1:edX+DemoX+Demo_Course'))
+            assert list(provider.get_all_xblocks_in_course('course-v1:edX+DemoX+Demo_Course')) == xblocks
+
+        assert mock_get.call_count == 3
+        assert xblocks == [
+            XBlockContent(key='vertical', content_type='vertical', content='vertical\nvideo\nhtml'),
+            XBlockContent(key='video', content_type='video', content='video'),
+        ]
+
 
 class DiscoveryCourseMetadataProviderTests(TestCase):
     """
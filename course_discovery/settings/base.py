@@ -101,7 +101,12 @@ INSTALLED_APPS += THIRD_PARTY_APPS
 INSTALLED_APPS += PROJECT_APPS
 INSTALLED_APPS += ES_APPS
 
+# Profile the SQL queries, Elasticsearch requests and cache lookups of each request, reported as monitoring
+# custom attributes and, when DEBUG is enabled, as response headers.
+REQUEST_PROFILING_ENABLED = True
+
 MIDDLEWARE = (
+    'course_discovery.apps.core.middleware.RequestProfilingMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'edx_django_utils.monitoring.CookieMonitoringMiddleware',
     'edx_django_utils.monitoring.DeploymentMonitoringMiddleware',
@@ -176,6 +181,26 @@ PARLER_ENABLE_CACHING = False
 # Determines whether the caching mixin in course_discovery/apps/api/cache.py is used
 USE_API_CACHING = True
 
+# Seconds a request may hold the lock for rendering a missing cached API response, and seconds identical
+# requests wait for it to be cached when no previously cached response can be served in the meantime.
+API_CACHE_LOCK_TIMEOUT = 30
+API_CACHE_LOCK_WAIT = 10
+
+# API paths whose responses are cached again by the warm_api_cache command, and after data loads if
+# API_CACHE_WARMER_AFTER_DATA_LOADS is enabled, e.g. '/api/v1/courses/?page=1&page_size=100'.
+API_CACHE_WARMER_PATHS = []
+# Username of the user requesting the warmed API paths.
+API_CACHE_WARMER_USERNAME = None
+API_CACHE_WARMER_WORKERS = 4
+API_CACHE_WARMER_AFTER_DATA_LOADS = False
+
+# Seconds the results of typeahead searches are cached for, per partner and query.
+TYPEAHEAD_CACHE_TIMEOUT = 60
+
+# Seconds the values resolved from catalog queries are cached for. They are also stale as soon as the
+# search indexes are updated.
+SEARCH_QUERY_CACHE_TIMEOUT = 60 * 60
+
 TIME_ZONE = 'UTC'
 
 USE_I18N = True
@@ -471,6 +496,16 @@ ELASTICSEARCH_DSL_LOAD_PER_QUERY = 10000
 
 MAX_RESULT_WINDOW = 15000
 
+# Indexing pipeline used by update_index to populate new indices (see edx_elasticsearch_dsl_extensions.indexing).
+# Number of processes preparing documents; 0 keeps the default django-elasticsearch-dsl population.
+ELASTICSEARCH_DSL_INDEXING_WORKERS = 0
+# Number of records a worker fetches and prepares at once.
+ELASTICSEARCH_DSL_INDEXING_PARTITION_SIZE = 1000
+# Number of documents per bulk request.
+ELASTICSEARCH_DSL_INDEXING_CHUNK_SIZE = 500
+# Number of bulk requests kept in flight.
+ELASTICSEARCH_DSL_INDEXING_BULK_THREADS = 4
+
 ELASTICSEARCH_DSL = {
     'default': {'hosts': '127.0.0.1:9200'}
 }
@@ -487,7 +522,12 @@ ELASTICSEARCH_DSL_INDEX_SETTINGS = {'number_of_shards': 1, 'number_of_replicas':
 # Elasticsearch instance when running the refresh_course_metadata command
 # If you still want to use please use customized RealTimeSignalProcessor
 # course_discovery.apps.course_metadata.search_indexes.signals.RealTimeSignalProcessor
+# or, to update the index in bulk after each transaction commits, DeferredSignalProcessor
+# course_discovery.apps.course_metadata.search_indexes.signals.DeferredSignalProcessor
 ELASTICSEARCH_DSL_SIGNAL_PROCESSOR = 'django_elasticsearch_dsl.signals.BaseSignalProcessor'
+# Seconds after which course_discovery.apps.course_metadata.search_indexes.signals.DeferredSignalProcessor
+# updates the index from a Celery task. If None, the index is updated as soon as the transaction commits.
+ELASTICSEARCH_DSL_DEFERRED_UPDATE_COUNTDOWN = None
 ELASTICSEARCH_DSL_INDEX_RETENTION_LIMIT = 3
 
 # Update Index Settings
@@ -614,6 +654,11 @@ TAXONOMY_COURSE_RUN_METADATA_PROVIDER = 'course_discovery.apps.taxonomy_support.
 TAXONOMY_PROGRAM_METADATA_PROVIDER = 'course_discovery.apps.taxonomy_support.providers.DiscoveryProgramMetadataProvider'
 TAXONOMY_XBLOCK_METADATA_PROVIDER = 'course_discovery.apps.taxonomy_support.providers.DiscoveryXBlockMetadataProvider'
 TAXONOMY_XBLOCK_SUPPORTED_TYPES = ['video', 'vertical']
+# Seconds the content of the xblocks of a course is cached for, while the course blocks are unchanged.
+# The cache only detects changes to the structure of a course, not to the text of its blocks, so this is kept
+# shorter than the interval between xblock skill tagging runs: content is reused within a run, and fetched
+# again by the next one.
+TAXONOMY_XBLOCK_CONTENT_CACHE_TIMEOUT = 60 * 60
 
 SKILLS_VERIFICATION_THRESHOLD = 10  # minimum votes required for a skill to be marked verified
 SKILLS_VERIFICATION_RATIO_THRESHOLD = 0.7 # 70% validation threshold out of total votes